@@ -8,10 +8,11 @@ import importlib
 # Single source of truth for all lazy-loaded names.
 # Submodules map to their fully-qualified module names.
 # Symbols map to the module that defines them.
-_LAZY_SUBMODULES = {"info", "core"}
+_LAZY_SUBMODULES = {"aio", "info", "core"}
 
 _LAZY_TARGETS = {
     # Submodules
+    "aio": "audb.aio",
     "info": "audb.info",
     "core": "audb.core",
     # From audb.core.api
@@ -32,6 +33,8 @@ _LAZY_TARGETS = {
     "Dependencies": "audb.core.dependencies",
     # From audb.core.flavor
     "Flavor": "audb.core.flavor",
+    # From audb.core.lazy
+    "LazyDatabase": "audb.core.lazy",
     # From audb.core.load
     "load": "audb.core.load",
     "load_attachment": "audb.core.load",
@@ -39,10 +42,23 @@ _LAZY_TARGETS = {
     "load_table": "audb.core.load",
     # From audb.core.load_to
     "load_to": "audb.core.load_to",
+    # From audb.core.memory
+    "read_media": "audb.core.memory",
+    # From audb.core.mirror
+    "Mirror": "audb.core.mirror",
+    # From audb.core.prefetch
+    "Prefetch": "audb.core.prefetch",
+    "prefetch": "audb.core.prefetch",
     # From audb.core.publish
     "publish": "audb.core.publish",
+    # From audb.core.replicas
+    "repository_statistics": "audb.core.replicas",
     # From audb.core.repository
     "Repository": "audb.core.repository",
+    # From audb.core.retry
+    "backend_statistics": "audb.core.retry",
+    # From audb.core.session
+    "Session": "audb.core.session",
     # From audb.core.stream
     "DatabaseIterator": "audb.core.stream",
     "stream": "audb.core.stream",
@@ -0,0 +1,3 @@
+from audb.core.aio import dependencies
+from audb.core.aio import load_media
+from audb.core.aio import load_table
@@ -3,18 +3,32 @@ import importlib
 
 
 _SUBMODULES = {
+    "aio",
     "api",
     "cache",
+    "catalog",
+    "checksums",
+    "coalesce",
+    "concurrency",
     "config",
     "define",
     "dependencies",
     "flavor",
     "info",
+    "journal",
+    "lazy",
     "load",
     "load_to",
     "lock",
+    "lookup",
+    "memory",
+    "mirror",
+    "prefetch",
     "publish",
+    "replicas",
     "repository",
+    "retry",
+    "session",
     "stream",
     "utils",
 }
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Sequence
+import concurrent.futures
+import contextvars
+import functools
+import threading
+
+import pandas as pd
+
+from audb.core import define
+from audb.core.api import dependencies as _dependencies
+from audb.core.dependencies import Dependencies
+from audb.core.load import load_media as _load_media
+from audb.core.load import load_table as _load_table
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+# Requests that are currently processed,
+# stored per event loop,
+# see _shared()
+_inflight: dict[tuple[int, Hashable], asyncio.Future] = {}
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    r"""Thread pool shared by all coroutines.
+
+    :mod:`audbackend` provides only blocking I/O.
+    Instead of starting a thread per request,
+    all coroutines share a single, bounded pool of threads.
+    Requests exceeding the size of the pool
+    are queued,
+    so a single event loop can await
+    thousands of requests
+    without creating thousands of threads.
+
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix="audb-aio",
+            )
+    return _executor
+
+
+async def _run(func: Callable, *args, **kwargs) -> object:
+    r"""Run blocking function in shared thread pool."""
+    loop = asyncio.get_running_loop()
+    # Run in context of coroutine,
+    # e.g. to use its audb.Session
+    context = contextvars.copy_context()
+    return await loop.run_in_executor(
+        _get_executor(),
+        functools.partial(context.run, func, *args, **kwargs),
+    )
+
+
+async def _shared(key: Hashable, func: Callable, *args, **kwargs) -> object:
+    r"""Run blocking function once for concurrent identical requests.
+
+    If a request with the same ``key``
+    is already awaited on the running event loop,
+    the result of the running request is returned
+    instead of starting a new one.
+
+    """
+    loop = asyncio.get_running_loop()
+    key = (id(loop), key)
+    if key not in _inflight:
+        future = asyncio.ensure_future(_run(func, *args, **kwargs))
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    return await asyncio.shield(_inflight[key])
+
+
+async def dependencies(
+    name: str,
+    *,
+    version: str = None,
+    cache_root: str = None,
+    verbose: bool = False,
+) -> Dependencies:
+    r"""Database dependencies.
+
+    Coroutine version of :func:`audb.dependencies`.
+    Concurrent requests for the same dependency table
+    are merged into a single request.
+
+    Args:
+        name: name of database
+        version: version of database
+        cache_root: cache folder where databases are stored.
+            If not set :meth:`audb.default_cache_root` is used
+        verbose: show debug messages
+
+    Returns:
+        dependency object
+
+    Examples:
+        >>> import asyncio
+        >>> deps = asyncio.run(audb.aio.dependencies("emodb", version="1.4.1"))
+        >>> deps.version("db.emotion.csv")
+        '1.1.0'
+
+    """
+    shared_deps = await _shared(
+        ("dependencies", name, version, cache_root),
+        _dependencies,
+        name,
+        version=version,
+        cache_root=cache_root,
+        verbose=verbose,
+    )
+    # Callers sharing a request should not share the same object
+    deps = Dependencies()
+    deps._df = shared_deps._df.copy()
+    return deps
+
+
+async def load_media(
+    name: str,
+    media: str | Sequence[str],
+    *,
+    version: str = None,
+    bit_depth: int = None,
+    channels: int | Sequence[int] = None,
+    format: str = None,
+    mixdown: bool = False,
+    sampling_rate: int = None,
+    cache_root: str = None,
+    num_workers: int | str | None = 1,
+    timeout: float = define.TIMEOUT,
+    verbose: bool = False,
+) -> list | None:
+    r"""Load media file(s).
+
+    Coroutine version of :func:`audb.load_media`.
+    It shares the cache and its locks
+    with :func:`audb.load_media`.
+
+    Args:
+        name: name of database
+        media: load media files provided in the list
+        version: version of database
+        bit_depth: bit depth, one of ``16``, ``24``, ``32``
+        channels: channel selection, see :func:`audresample.remix`
+        format: file format, one of ``'flac'``, ``'wav'``
+        mixdown: apply mono mix-down
+        sampling_rate: sampling rate in Hz, one of
+            ``8000``, ``16000``, ``22050``, ``24000``, ``44100``, ``48000``
+        cache_root: cache folder where databases are stored.
+            If not set :meth:`audb.default_cache_root` is used
+        num_workers: number of parallel jobs or 1 for sequential
+            processing. If ``None`` will be set to the number of
+            processors on the machine multiplied by 5.
+            If ``'auto'``,
+            the number of parallel jobs is adapted while running,
+            based on the measured throughput
+        timeout: maximum time in seconds
+            before giving up acquiring a lock to the database cache folder.
+            ``None`` is returned in this case
+        verbose: show debug messages
+
+    Returns:
+        paths to media files
+
+    Raises:
+        ValueError: if a media file is requested
+            that is not part of the database
+        ValueError: if a non-supported ``bit_depth``,
+            ``format``,
+            or ``sampling_rate``
+            is requested
+
+    Examples:
+        >>> import asyncio
+        >>> paths = asyncio.run(
+        ...     audb.aio.load_media("emodb", ["wav/03a01Fa.wav"], version="1.4.1")
+        ... )
+        >>> paths[0].endswith("03a01Fa.wav")
+        True
+
+    """
+    return await _run(
+        _load_media,
+        name,
+        media,
+        version=version,
+        bit_depth=bit_depth,
+        channels=channels,
+        format=format,
+        mixdown=mixdown,
+        sampling_rate=sampling_rate,
+        cache_root=cache_root,
+        num_workers=num_workers,
+        timeout=timeout,
+        verbose=verbose,
+    )
+
+
+async def load_table(
+    name: str,
+    table: str,
+    *,
+    version: str = None,
+    map: dict[str, str | Sequence[str]] = None,
+    pickle_tables: bool = True,
+    cache_root: str = None,
+    num_workers: int | str | None = 1,
+    verbose: bool = False,
+) -> pd.DataFrame:
+    r"""Load a database table.
+
+    Coroutine version of :func:`audb.load_table`.
+    It shares the cache and its locks
+    with :func:`audb.load_table`.
+    Concurrent requests for the same table
+    are merged into a single request.
+
+    Args:
+        name: name of database
+        table: load table from database
+        version: version of database
+        map: map scheme or scheme fields to column values,
+            see :func:`audb.load_table`
+        pickle_tables: if ``True``,
+            tables are cached locally
+            in their original format
+            and as pickle files.
+            This allows for faster loading,
+            when loading from cache
+        cache_root: cache folder where databases are stored.
+            If not set :meth:`audb.default_cache_root` is used
+        num_workers: number of parallel jobs or 1 for sequential
+            processing. If ``None`` will be set to the number of
+            processors on the machine multiplied by 5.
+            If ``'auto'``,
+            the number of parallel jobs is adapted while running,
+            based on the measured throughput
+        verbose: show debug messages
+
+    Returns:
+        database table
+
+    Raises:
+        ValueError: if a table is requested
+            that is not part of the database
+
+    Examples:
+        >>> import asyncio
+        >>> df = asyncio.run(audb.aio.load_table("emodb", "emotion", version="1.4.1"))
+        >>> df[:3]
+                           emotion  emotion.confidence
+        file
+        wav/03a01Fa.wav  happiness                0.90
+        wav/03a01Nc.wav    neutral                1.00
+        wav/03a01Wa.wav      anger                0.95
+
+    """
+    if map is not None:
+        # Mappings might not be hashable
+        # and result in a different table,
+        # so they are not shared
+        return await _run(
+            _load_table,
+            name,
+            table,
+            version=version,
+            map=map,
+            pickle_tables=pickle_tables,
+            cache_root=cache_root,
+            num_workers=num_workers,
+            verbose=verbose,
+        )
+    df = await _shared(
+        ("load_table", name, table, version, pickle_tables, cache_root),
+        _load_table,
+        name,
+        table,
+        version=version,
+        pickle_tables=pickle_tables,
+        cache_root=cache_root,
+        num_workers=num_workers,
+        verbose=verbose,
+    )
+    # Callers sharing a request should not share the same object
+    return df.copy()
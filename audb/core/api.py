@@ -11,7 +11,10 @@ import audbackend
 import audeer
 import audformat
 
+from audb.core import catalog
 from audb.core import define
+from audb.core import lookup
+from audb.core import session
 from audb.core import utils
 from audb.core.cache import database_cache_root
 from audb.core.cache import default_cache_root
@@ -88,8 +91,7 @@ def available(
             # as the pool is created lazily on the first request.
             _match_connection_pool_size(backend_interface.backend, workers)
             with backend_interface.backend as backend:
-                versions = _collect_versions(backend, workers)
-                for name, version in versions:
+                for name, version in catalog.versions(backend, workers):
                     add_database(name, version, repository)
 
         except (audbackend.BackendError, ValueError):
@@ -115,44 +117,6 @@ def available(
     return df.set_index("name")
 
 
-def _collect_versions(backend, workers: int):
-    r"""Yield ``(name, version)`` for all databases in a repository.
-
-    All backends use a ``Versioned`` interface,
-    which stores the version folders and header file under
-    ``/<name>/<version>/db.yaml``.
-    A version exists
-    if the corresponding header file
-    can be found on the backend.
-
-    Args:
-        backend: opened backend
-        workers: number of parallel workers
-            used to collect the versions
-
-    Yields:
-        tuple of database name and version
-
-    """
-
-    def version_exists(name, version):
-        header_file = f"/{name}/{version}/{define.HEADER_FILE}"
-        return backend.exists(header_file)
-
-    def collect_versions(name):
-        versions = audeer.sort_versions(
-            [v for v in backend.ls_dirs(f"/{name}/") if audeer.is_semantic_version(v)]
-        )
-        return name, [v for v in versions if version_exists(name, v)]
-
-    names = backend.ls_dirs("/")
-    max_workers = min(workers, max(1, len(names)))
-    with concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
-        for name, versions in pool.map(collect_versions, names):
-            for version in versions:
-                yield name, version
-
-
 def _match_connection_pool_size(backend, maxsize: int) -> None:
     """Match the HTTP connection pool size to ``num_workers``.
 
@@ -339,28 +303,42 @@ def dependencies(
     )
     cached_deps_file = os.path.join(db_root, define.CACHED_DEPENDENCY_FILE)
 
-    with FolderLock(db_root):
-        try:
-            deps = Dependencies()
-            deps.load(cached_deps_file)
-        except Exception:  # does not catch KeyboardInterupt
-            # If loading cached file fails, load again from backend
-            #
-            # Loading a cache file can fail
-            # as we use PyArrow data types,
-            # which when loading from pickle
-            # are not compatible between all pandas versions.
-            # We had originally some tests for it,
-            # but as the actual failure is not that important,
-            # we removed them in
-            # See https://github.com/audeering/audb/pull/507
-            #
-            backend_interface = utils.lookup_backend(name, version)
-            deps = download_dependencies(backend_interface, name, version, verbose)
-            # Store as pickle in cache
-            deps.save(cached_deps_file)
-
-    return deps
+    def load_dependencies() -> Dependencies:
+        with FolderLock(db_root):
+            try:
+                deps = Dependencies()
+                deps.load(cached_deps_file)
+            except Exception:  # does not catch KeyboardInterupt
+                # If loading cached file fails, load again from backend
+                #
+                # Loading a cache file can fail
+                # as we use PyArrow data types,
+                # which when loading from pickle
+                # are not compatible between all pandas versions.
+                # We had originally some tests for it,
+                # but as the actual failure is not that important,
+                # we removed them in
+                # See https://github.com/audeering/audb/pull/507
+                #
+                backend_interface = utils.lookup_backend(name, version)
+                deps = download_dependencies(backend_interface, name, version, verbose)
+                # Store as pickle in cache
+                deps.save(cached_deps_file)
+        return deps
+
+    return session.cached(
+        "dependencies",
+        db_root,
+        load_dependencies,
+        copy=_copy_dependencies,
+    )
+
+
+def _copy_dependencies(deps: Dependencies) -> Dependencies:
+    r"""Copy dependency object."""
+    copied_deps = Dependencies()
+    copied_deps._df = deps._df.copy()
+    return copied_deps
 
 
 def exists(
@@ -508,11 +486,17 @@ def flavor_path(
 
 def latest_version(
     name,
+    *,
+    refresh: bool = False,
 ) -> str:
     r"""Latest version of database.
 
     Args:
         name: name of database
+        refresh: if ``True``,
+            request versions from backends
+            even if they are stored in the user cache folder,
+            see :func:`audb.versions`
 
     Returns:
         version string
@@ -525,7 +509,7 @@ def latest_version(
         '2.0.0'
 
     """
-    vs = versions(name)
+    vs = versions(name, refresh=refresh)
     if not vs:
         raise RuntimeError(
             f"Cannot find a version for database '{name}'.",
@@ -555,7 +539,7 @@ def remove_media(
     if isinstance(files, str):
         files = [files]
 
-    for version in versions(name):
+    for version in versions(name, refresh=True):
         backend_interface = utils.lookup_backend(name, version)
         deps = download_dependencies(backend_interface, name, version, verbose)
 
@@ -616,7 +600,9 @@ def repository(
     r"""Return repository that stores the requested database.
 
     If the database is stored in several repositories,
-    only the first one is returned.
+    only the first one is returned,
+    or the fastest one
+    if :attr:`config.FASTEST_REPLICA` is ``True``.
     The order of the repositories to look for the database
     is given by :attr:`config.REPOSITORIES`.
 
@@ -635,6 +621,9 @@ def repository(
         Repository('audb-public', 's3.dualstack.eu-north-1.amazonaws.com', 's3')
 
     """  # noqa: E501
+    found, repository = lookup.read_repository(name, version)
+    if found and repository is not None and not config.FASTEST_REPLICA:
+        return repository
     if not versions(name):
         raise RuntimeError(f"Cannot find database '{name}'.")
     return utils._lookup(name, version)[0]
@@ -642,11 +631,27 @@ def repository(
 
 def versions(
     name: str,
+    *,
+    refresh: bool = False,
 ) -> list[str]:
     r"""Available versions of database.
 
+    The versions are stored in the user cache folder
+    for :attr:`audb.config.VERSIONS_TTL` seconds,
+    and returned from there by later calls,
+    also in other processes.
+    If :attr:`audb.config.OFFLINE` is ``True``,
+    no backend is requested,
+    and the stored versions,
+    or the versions of the database
+    found in the cache folders
+    are returned.
+
     Args:
         name: name of database
+        refresh: if ``True``,
+            request versions from backends
+            even if they are stored in the user cache folder
 
     Returns:
         list of versions
@@ -656,19 +661,59 @@ def versions(
         ['1.1.0', '1.1.1', '1.2.0', '1.3.0', '1.4.0', '1.4.1', '2.0.0']
 
     """
-    vs = []
-    for repository in config.REPOSITORIES:
+    # Repositories that could not be requested
+    unreachable = []
+
+    def job(repository: Repository) -> list[str]:
         try:
             backend_interface = repository.create_backend_interface()
+            # Versions are listed from the backend,
+            # as the catalog might miss versions
             with backend_interface.backend:
                 header = backend_interface.join("/", name, "db.yaml")
-                vs.extend(
-                    backend_interface.versions(header, suppress_backend_errors=True)
-                )
+                try:
+                    return backend_interface.versions(header)
+                except audbackend.BackendError as ex:
+                    if isinstance(ex.exception, FileNotFoundError):
+                        return []
+                    raise
         except (audbackend.BackendError, ValueError):
             # If the backend cannot be accessed,
             # e.g. host or repository do not exist,
             # we skip it
             # and continue with the next repository
-            continue
+            unreachable.append(repository)
+            return []
+
+    def request_versions() -> list[str]:
+        if not refresh:
+            vs = lookup.read_versions(name)
+            if vs is not None:
+                return vs
+        if config.OFFLINE:
+            return _cached_versions(name)
+        # Request all repositories at the same time
+        with concurrent.futures.ThreadPoolExecutor(max(1, len(repositories))) as pool:
+            vs = [v for repo_vs in pool.map(job, repositories) for v in repo_vs]
+        vs = audeer.sort_versions(vs)
+        # Incomplete results are not stored
+        if not unreachable:
+            lookup.write_versions(name, vs)
+        return vs
+
+    repositories = tuple(config.REPOSITORIES)
+    if refresh:
+        return request_versions()
+    return session.cached(
+        "versions",
+        (name, repositories),
+        request_versions,
+        copy=list,
+    )
+
+
+def _cached_versions(name: str) -> list[str]:
+    r"""Versions of database found in cache folders."""
+    vs = set(cached(name=name)["version"])
+    vs |= set(cached(name=name, shared=True)["version"])
     return audeer.sort_versions(vs)
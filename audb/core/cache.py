@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 import audeer
 
@@ -49,8 +50,12 @@ def database_tmp_root(
     r"""Create and return temporary database cache folder.
 
     The temporary cache folder is created under ``db_root + '~'``.
-    Any existing temporary folder from previous interrupted downloads
-    is removed before creating a fresh one.
+    Every call returns a new folder,
+    so that downloads running at the same time,
+    e.g. of a table and a media file,
+    do not remove each other's files.
+    Use :func:`remove_database_tmp_root`
+    to remove it afterwards.
 
     Args:
         db_root: path to database cache folder
@@ -59,11 +64,48 @@ def database_tmp_root(
         path to temporary cache folder
 
     """
-    tmp_root = db_root + "~"
-    # Clean up any leftover tmp folder from previous interrupted downloads
-    audeer.rmdir(tmp_root)
-    tmp_root = audeer.mkdir(tmp_root)
-    return tmp_root
+    tmp_root = audeer.mkdir(db_root + "~")
+    return tempfile.mkdtemp(dir=tmp_root)
+
+
+def clear_database_tmp_root(
+    db_root: str,
+):
+    r"""Remove all temporary database cache folders.
+
+    Removes leftover temporary folders
+    from previous interrupted downloads.
+    It must only be called
+    when no other download for ``db_root`` is running,
+    e.g. after locking the database cache folder.
+
+    Args:
+        db_root: path to database cache folder
+
+    """
+    audeer.rmdir(db_root + "~")
+
+
+def remove_database_tmp_root(
+    db_root_tmp: str,
+):
+    r"""Remove temporary database cache folder.
+
+    The parent folder ``db_root + '~'``
+    is removed as well,
+    if no other temporary folder is left in it.
+
+    Args:
+        db_root_tmp: temporary cache folder
+            returned by :func:`database_tmp_root`
+
+    """
+    audeer.rmdir(db_root_tmp)
+    try:
+        os.rmdir(os.path.dirname(db_root_tmp))
+    except OSError:
+        # Folder is still used by another download
+        pass
 
 
 def default_cache_root(
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+import concurrent.futures
+import json
+import os
+import tempfile
+import uuid
+
+import audbackend
+import audeer
+
+from audb.core import define
+from audb.core import retry
+from audb.core.dependencies import Dependencies
+
+
+# Path of catalog on backend
+_PATH = f"/{define.CATALOG_FILE}"
+
+
+def add(
+    backend: audbackend.backend.Base,
+    name: str,
+    version: str,
+    deps: Dependencies,
+):
+    r"""Add published version of database to catalog.
+
+    If the repository has no catalog yet,
+    it is created from all databases found on the backend.
+    The catalog is replaced in a single step,
+    so that readers never see a partially written catalog.
+    As backends provide no conditional writes,
+    the catalog is read again afterwards,
+    and the update is repeated
+    if a concurrent publication removed the entry.
+
+    Args:
+        backend: opened backend
+        name: name of database
+        version: version of database
+        deps: dependency table of version
+
+    """
+    df = deps()
+    media = df[(df["type"] == define.DEPENDENCY_TYPE["media"]) & (df["removed"] == 0)]
+    entry = {
+        "files": len(media),
+        "tables": len(deps.tables),
+        "duration": float(media["duration"].sum()),
+    }
+    for _ in range(define.CATALOG_ATTEMPTS):
+        databases = read(backend)
+        if databases is None:
+            databases = {}
+            for other_name, other_version in collect_versions(backend, 1):
+                databases.setdefault(other_name, {})[other_version] = {}
+        databases.setdefault(name, {})[version] = entry
+        _write(backend, databases)
+        if read(backend).get(name, {}).get(version) == entry:
+            break
+
+
+def collect_versions(
+    backend: audbackend.backend.Base,
+    workers: int,
+    *,
+    known: dict[str, dict[str, dict]] = None,
+) -> Iterator[tuple[str, str]]:
+    r"""Yield ``(name, version)`` for all databases on backend.
+
+    All backends use a ``Versioned`` interface,
+    which stores the version folders and header file under
+    ``/<name>/<version>/db.yaml``.
+    A version exists
+    if the corresponding header file
+    can be found on the backend.
+    For versions listed in ``known``
+    the header file is not requested.
+
+    Args:
+        backend: opened backend
+        workers: number of parallel workers
+            used to collect the versions
+        known: entries of versions per database,
+            e.g. from the catalog
+
+    Yields:
+        tuple of database name and version
+
+    """
+    known = known or {}
+
+    def ls_dirs(path):
+        return retry.call(backend.ls_dirs, path, operation="ls_dirs", concurrent=True)
+
+    def version_exists(name, version):
+        if version in known.get(name, {}):
+            return True
+        header_file = f"/{name}/{version}/{define.HEADER_FILE}"
+        return retry.call(
+            backend.exists,
+            header_file,
+            operation="exists",
+            concurrent=True,
+        )
+
+    def collect(name):
+        versions = audeer.sort_versions(
+            [v for v in ls_dirs(f"/{name}/") if audeer.is_semantic_version(v)]
+        )
+        return name, [v for v in versions if version_exists(name, v)]
+
+    names = ls_dirs("/")
+    max_workers = min(workers, max(1, len(names)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
+        for name, versions in pool.map(collect, names):
+            for version in versions:
+                yield name, version
+
+
+def read(backend: audbackend.backend.Base) -> dict[str, dict[str, dict]] | None:
+    r"""Read catalog of repository.
+
+    Args:
+        backend: opened backend
+
+    Returns:
+        entries of published versions per database,
+        or ``None`` if the repository has no catalog
+
+    """
+    if not retry.call(backend.exists, _PATH, operation="exists"):
+        return None
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, define.CATALOG_FILE)
+        retry.call(backend.get_file, _PATH, path, operation="get_file")
+        with open(path) as fp:
+            return json.load(fp)["databases"]
+
+
+def versions(
+    backend: audbackend.backend.Base,
+    workers: int,
+) -> Iterator[tuple[str, str]]:
+    r"""Yield ``(name, version)`` for all databases in repository.
+
+    The catalog is only used as a hint,
+    as it is updated without a lock
+    and misses versions
+    published with older versions of audb.
+    Versions are listed from the backend,
+    but the header file is only requested
+    for versions missing in the catalog.
+
+    Args:
+        backend: opened backend
+        workers: number of parallel workers
+            used to collect the versions
+
+    Yields:
+        tuple of database name and version
+
+    """
+    yield from collect_versions(backend, workers, known=read(backend))
+
+
+def _write(
+    backend: audbackend.backend.Base,
+    databases: dict[str, dict[str, dict]],
+):
+    r"""Write catalog to backend."""
+    tmp_path = f"/.{uuid.uuid4().hex}.{define.CATALOG_FILE}"
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, define.CATALOG_FILE)
+        with open(path, "w") as fp:
+            json.dump({"databases": databases}, fp)
+        backend.put_file(path, tmp_path)
+    backend.move_file(tmp_path, _PATH)
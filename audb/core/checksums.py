@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import os
+from stat import S_ISREG
+import tempfile
+import threading
+import time
+
+import pyarrow as pa
+import pyarrow.parquet as parquet
+
+from audb.core import define
+from audb.core import utils
+
+
+_SCHEMA = pa.schema(
+    [
+        ("file", pa.string()),
+        ("size", pa.int64()),
+        ("mtime", pa.int64()),
+        ("inode", pa.int64()),
+        ("checksum", pa.string()),
+    ]
+)
+
+
+class Checksums:
+    def __init__(
+        self,
+        root: str,
+        *,
+        verify: bool = False,
+    ):
+        r"""Persistent cache of checksums of files.
+
+        Calculating the MD5 checksums
+        of all files of a large database
+        takes long,
+        even if only a few files have changed.
+        The checksums are stored
+        in the file ``.checksums.parquet`` in ``root``,
+        together with size,
+        modification time,
+        and inode of every file.
+        The checksum of a file is only calculated again
+        if one of them has changed.
+
+        Files modified less than two seconds
+        before their checksum was calculated
+        are not stored,
+        as a later change within the resolution
+        of the modification time of the file system
+        would not be detected.
+        Checksums of folders are never stored.
+
+        Args:
+            root: folder containing the files
+            verify: if ``True``,
+                stored checksums are ignored
+                and calculated again
+
+        """
+        self.root = root
+        r"""Folder containing the files."""
+        self.path = os.path.join(root, define.CHECKSUM_CACHE_FILE)
+        r"""Path to cache file."""
+        self._verify = verify
+        self._entries = {} if verify else self._read()
+        self._used = {}
+        self._lock = threading.Lock()
+
+    def md5(
+        self,
+        file: str,
+        *,
+        func: Callable[[str], str] = utils.md5,
+    ) -> str:
+        r"""MD5 checksum of file.
+
+        The method is thread-safe.
+
+        Args:
+            file: path of file relative to :attr:`root`
+            func: function calculating the checksum
+                of a file with absolute path
+
+        Returns:
+            MD5 checksum
+
+        """
+        path = os.path.join(self.root, file)
+        stat = os.stat(path)
+        if not S_ISREG(stat.st_mode):
+            return func(path)
+        key = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+        entry = self._entries.get(file)
+        if entry is not None and entry[:3] == key:
+            checksum = entry[3]
+        else:
+            checksum = func(path)
+        if time.time_ns() - stat.st_mtime_ns >= define.CHECKSUM_CACHE_MIN_AGE:
+            with self._lock:
+                self._used[file] = key + (checksum,)
+        return checksum
+
+    def save(self):
+        r"""Store checksums calculated or used since creation.
+
+        The cache file is replaced in a single step.
+        Errors when writing it are ignored,
+        e.g. if ``root`` is read-only.
+
+        """
+        with self._lock:
+            entries = sorted(self._used.items())
+        columns = list(zip(*[(file,) + entry for file, entry in entries]))
+        if not columns:
+            columns = [[] for _ in _SCHEMA]
+        table = pa.table(
+            {name: list(column) for name, column in zip(_SCHEMA.names, columns)},
+            schema=_SCHEMA,
+        )
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix="~")
+        except OSError:
+            return
+        os.close(fd)
+        try:
+            parquet.write_table(table, tmp_path)
+            os.replace(tmp_path, self.path)
+        except OSError:  # pragma: no cover
+            os.remove(tmp_path)
+
+    def _read(self) -> dict[str, tuple[int, int, int, str]]:
+        r"""Read entries from cache file."""
+        try:
+            table = parquet.read_table(self.path, schema=_SCHEMA)
+        except (OSError, ValueError):
+            # Missing or damaged file
+            return {}
+        columns = table.to_pydict()
+        return {
+            file: (size, mtime, inode, checksum)
+            for file, size, mtime, inode, checksum in zip(
+                *[columns[name] for name in _SCHEMA.names]
+            )
+        }
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Hashable
+from collections.abc import Sequence
+import concurrent.futures
+import threading
+
+
+class _Group:
+    r"""Requests for the same key."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.process_lock = threading.Lock()
+        self.queue = []
+        self.users = 0
+
+
+class Coalescer:
+    r"""Merge concurrent requests into batches.
+
+    Requests with the same key
+    that arrive while a batch is processed
+    are collected
+    and processed together as the next batch
+    by one of the waiting threads.
+    Every request receives its own result.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._groups = {}
+
+    def submit(
+        self,
+        key: Hashable,
+        items: Sequence,
+        process: Callable[[list[Sequence]], list],
+        *,
+        timeout: float = None,
+    ) -> object:
+        r"""Submit request and wait for its result.
+
+        Args:
+            key: requests with the same key are merged
+            items: items of the request
+            process: function processing a batch.
+                It is called with the items of all merged requests
+                and returns a result for every request.
+                If a result is an exception,
+                it is raised for the corresponding request
+            timeout: maximum time in seconds
+                to wait for another batch to finish.
+                If ``None`` or negative,
+                wait without limit
+
+        Returns:
+            result of request
+
+        Raises:
+            TimeoutError: if the request was not processed
+                before ``timeout``
+
+        """
+        with self._lock:
+            if key not in self._groups:
+                self._groups[key] = _Group()
+            group = self._groups[key]
+            group.users += 1
+        try:
+            return self._submit(group, items, process, timeout)
+        finally:
+            with self._lock:
+                group.users -= 1
+                if group.users == 0:
+                    del self._groups[key]
+
+    def _submit(
+        self,
+        group: _Group,
+        items: Sequence,
+        process: Callable[[list[Sequence]], list],
+        timeout: float | None,
+    ) -> object:
+        r"""Process request or wait for it to be processed."""
+        request = (items, concurrent.futures.Future())
+        with group.lock:
+            # Process request directly
+            # if no batch is running
+            processing = group.process_lock.acquire(blocking=False)
+            if processing:
+                batch = [request]
+            else:
+                group.queue.append(request)
+
+        if not processing:
+            if timeout is None or timeout < 0:
+                timeout = -1
+            processing = group.process_lock.acquire(timeout=timeout)
+            with group.lock:
+                if processing:
+                    batch = group.queue
+                    group.queue = []
+                elif any(other is request for other in group.queue):
+                    group.queue.remove(request)
+                    raise TimeoutError()
+                # Otherwise request is processed by other thread
+
+        if processing:
+            try:
+                self._process(batch, process)
+            finally:
+                group.process_lock.release()
+
+        return request[1].result()
+
+    @staticmethod
+    def _process(
+        batch: list[tuple[Sequence, concurrent.futures.Future]],
+        process: Callable[[list[Sequence]], list],
+    ):
+        r"""Process batch and set results of its requests."""
+        if not batch:
+            return
+        try:
+            results = process([items for items, _ in batch])
+        except BaseException as ex:
+            for _, future in batch:
+                future.set_exception(ex)
+        else:
+            for (_, future), result in zip(batch, results):
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
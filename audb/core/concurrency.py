@@ -0,0 +1,407 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Sequence
+import concurrent.futures
+import os
+import threading
+import time
+
+import audeer
+
+from audb.core import define
+
+
+AUTO = "auto"
+r"""Value of ``num_workers`` to adapt the number of workers."""
+
+
+class AdaptiveWorkers:
+    def __init__(
+        self,
+        *,
+        initial: int = define.ADAPTIVE_WORKERS_INITIAL,
+        minimum: int = 1,
+        maximum: int = None,
+        tolerance: float = define.ADAPTIVE_WORKERS_TOLERANCE,
+    ):
+        r"""Adaptive number of workers.
+
+        Controls the number of parallel workers
+        with an additive increase/multiplicative decrease (AIMD) scheme.
+        Finished tasks are reported
+        with :meth:`AdaptiveWorkers.observe`.
+        After a window of as many finished tasks
+        as there are workers,
+        the throughput of the window is compared
+        to the throughput of the previous window.
+        If the throughput did not drop,
+        one worker is added.
+        If it dropped by more than ``tolerance``,
+        or if the latency of the tasks increased
+        by more than ``tolerance``
+        without increasing the throughput,
+        the number of workers is halved.
+
+        Args:
+            initial: initial number of workers
+            minimum: minimum number of workers
+            maximum: maximum number of workers.
+                If ``None``,
+                the number of processors on the machine
+                multiplied by 5 is used
+            tolerance: relative change of throughput and latency
+                that is considered as noise
+
+        """
+        if maximum is None:
+            maximum = max_workers()
+        self.minimum = minimum
+        r"""Minimum number of workers."""
+        self.maximum = max(minimum, maximum)
+        r"""Maximum number of workers."""
+        self.tolerance = tolerance
+        r"""Tolerated relative change of throughput and latency."""
+        self.workers = min(max(initial, self.minimum), self.maximum)
+        r"""Current number of workers."""
+        self.throughput = None
+        r"""Tasks per second measured in last window."""
+        self.latency = None
+        r"""Average task duration in seconds measured in last window."""
+
+        self._lock = threading.Lock()
+        self._reset_window()
+
+    def observe(self, latency: float):
+        r"""Report a finished task.
+
+        Args:
+            latency: duration of task in seconds
+
+        """
+        with self._lock:
+            self._window_tasks += 1
+            self._window_latency += latency
+            if self._window_tasks < self.workers:
+                return
+            elapsed = max(time.perf_counter() - self._window_start, 1e-9)
+            self._update(
+                self._window_tasks / elapsed,
+                self._window_latency / self._window_tasks,
+            )
+            self._reset_window()
+
+    def _reset_window(self):
+        self._window_start = time.perf_counter()
+        self._window_tasks = 0
+        self._window_latency = 0.0
+
+    def _update(self, throughput: float, latency: float):
+        r"""Adapt number of workers after a window."""
+        if self.throughput is not None:
+            dropped = throughput < self.throughput * (1 - self.tolerance)
+            gained = throughput > self.throughput * (1 + self.tolerance)
+            slowed = latency > self.latency * (1 + self.tolerance)
+            if dropped or (slowed and not gained):
+                self.workers = max(self.minimum, self.workers // 2)
+            else:
+                self.workers = min(self.maximum, self.workers + 1)
+        else:
+            self.workers = min(self.maximum, self.workers + 1)
+        self.throughput = throughput
+        self.latency = latency
+
+
+# Controllers of previous calls,
+# stored per task description,
+# see run_tasks()
+_controllers: dict[str | None, AdaptiveWorkers] = {}
+_controllers_lock = threading.Lock()
+
+
+def max_workers() -> int:
+    r"""Maximum number of workers.
+
+    Same value as used by :func:`audeer.run_tasks`
+    for ``num_workers=None``.
+
+    Returns:
+        number of processors on the machine multiplied by 5
+
+    """
+    return (os.cpu_count() or 1) * 5
+
+
+def resolve_num_workers(num_workers: int | str | None) -> int | None:
+    r"""Convert ``num_workers`` to a static value.
+
+    Functions of other packages,
+    e.g. :meth:`audformat.Database.load`,
+    do not support ``num_workers='auto'``.
+    They are mostly limited by the CPU,
+    so the number of processors on the machine is used.
+
+    Args:
+        num_workers: number of workers
+
+    Returns:
+        number of workers or ``None``
+
+    """
+    if num_workers == AUTO:
+        return os.cpu_count() or 1
+    return num_workers
+
+
+def workers_per_task(num_workers: int | str | None, num_tasks: int) -> int:
+    r"""Number of workers available inside each task.
+
+    If there are less tasks than workers,
+    the remaining workers can be used
+    to parallelize the work inside each task,
+    e.g. to extract the members of an archive.
+
+    Args:
+        num_workers: number of workers
+        num_tasks: number of tasks running in parallel
+
+    Returns:
+        number of workers per task
+
+    """
+    if num_workers is None:
+        num_workers = max_workers()
+    num_workers = resolve_num_workers(num_workers)
+    return max(1, num_workers // max(1, num_tasks))
+
+
+def run_tasks(
+    task_func: Callable,
+    params: Sequence[tuple[Sequence[object], dict[str, object]]],
+    *,
+    num_workers: int | str | None = 1,
+    progress_bar: bool = False,
+    task_description: str = None,
+    maximum_refresh_time: float = None,
+) -> list[object]:
+    r"""Run parallel tasks.
+
+    Same as :func:`audeer.run_tasks`,
+    but supports ``num_workers='auto'``.
+    In this case,
+    the number of parallel tasks is adapted
+    by :class:`AdaptiveWorkers`
+    while the tasks are running.
+    The number of workers a call settles on
+    is used as start value
+    for the next call
+    with the same ``task_description``.
+
+    Args:
+        task_func: task function
+        params: sequence of tuples holding parameters for each task
+        num_workers: number of parallel jobs,
+            ``1`` for sequential processing,
+            ``'auto'`` for an adaptive number of jobs.
+            If ``None`` will be set to the number of
+            processors on the machine multiplied by 5
+        progress_bar: show a progress bar
+        task_description: task description
+            that will be displayed next to progress bar
+        maximum_refresh_time: refresh the progress bar
+            at least every ``maximum_refresh_time`` seconds
+
+    Returns:
+        list of computed results
+
+    """
+    if num_workers != AUTO:
+        return audeer.run_tasks(
+            task_func,
+            params=params,
+            num_workers=num_workers,
+            progress_bar=progress_bar,
+            task_description=task_description,
+            maximum_refresh_time=maximum_refresh_time,
+        )
+
+    with _controllers_lock:
+        if task_description not in _controllers:
+            _controllers[task_description] = AdaptiveWorkers()
+        controller = _controllers[task_description]
+
+    def job(index: int):
+        start = time.perf_counter()
+        result = task_func(*params[index][0], **params[index][1])
+        controller.observe(time.perf_counter() - start)
+        return result
+
+    results = [None] * max(1, len(params))
+    with concurrent.futures.ThreadPoolExecutor(controller.maximum) as pool:
+        try:
+            with audeer.progress_bar(
+                total=len(params),
+                desc=task_description,
+                maximum_refresh_time=maximum_refresh_time,
+                disable=not progress_bar,
+            ) as pbar:
+                futures = {}
+                index = 0
+                while index < len(params) or futures:
+                    # Submit only as many tasks
+                    # as workers are currently allowed
+                    while index < len(params) and len(futures) < controller.workers:
+                        futures[pool.submit(job, index)] = index
+                        index += 1
+                    done, _ = concurrent.futures.wait(
+                        futures,
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    for future in done:
+                        results[futures.pop(future)] = future.result()
+                        pbar.update()
+        except (Exception, KeyboardInterrupt):
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    return results
+
+
+class Stage:
+    def __init__(
+        self,
+        num_workers: int | str | None = 1,
+        *,
+        task_description: str = None,
+        queue_size: int = None,
+    ):
+        r"""Stage of a pipeline.
+
+        Runs tasks in its own thread pool
+        as soon as they are submitted,
+        e.g. by the tasks of a previous stage.
+        If ``queue_size`` tasks are waiting or running,
+        :meth:`Stage.submit` blocks
+        until one of them has finished,
+        which limits the memory
+        and slows down faster previous stages.
+        If a task fails,
+        waiting tasks are canceled
+        and the error is raised
+        by the next call to :meth:`Stage.submit`
+        and by :meth:`Stage.join`.
+
+        Args:
+            num_workers: number of parallel jobs,
+                ``1`` for sequential processing,
+                ``'auto'`` for an adaptive number of jobs.
+                If ``None`` will be set to the number of
+                processors on the machine multiplied by 5
+            task_description: task description,
+                used to remember the adapted number of jobs
+                as in :func:`run_tasks`
+            queue_size: maximum number of waiting and running tasks.
+                If ``None``,
+                ``define.STAGE_QUEUE_SIZE`` times
+                the number of jobs is used
+
+        """
+        self._controller = None
+        if num_workers == AUTO:
+            with _controllers_lock:
+                if task_description not in _controllers:
+                    _controllers[task_description] = AdaptiveWorkers()
+                self._controller = _controllers[task_description]
+            num_workers = self._controller.maximum
+        elif num_workers is None:
+            num_workers = max_workers()
+        if queue_size is None:
+            queue_size = define.STAGE_QUEUE_SIZE * num_workers
+        self._pool = concurrent.futures.ThreadPoolExecutor(num_workers)
+        self._slots = threading.Semaphore(queue_size)
+        self._condition = threading.Condition()
+        self._futures = set()
+        self._running = 0
+        self._error = None
+
+    def __enter__(self) -> Stage:
+        r"""Start stage."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        r"""Wait for running tasks, cancel waiting ones on error."""
+        if exc_type is not None:
+            self._cancel()
+        self._pool.shutdown(wait=True)
+
+    def join(self):
+        r"""Wait for all submitted tasks.
+
+        Raises:
+            Exception: first error raised by a task
+
+        """
+        while True:
+            with self._condition:
+                futures = list(self._futures)
+            if not futures:
+                break
+            concurrent.futures.wait(futures)
+        if self._error is not None:
+            raise self._error
+
+    def submit(self, func: Callable, *args: object):
+        r"""Submit task.
+
+        Args:
+            func: task function
+            args: arguments of task function
+
+        Raises:
+            Exception: first error raised by a task
+
+        """
+        self._slots.acquire()
+        if self._error is not None:
+            self._slots.release()
+            raise self._error
+        future = self._pool.submit(self._run, func, *args)
+        with self._condition:
+            self._futures.add(future)
+        future.add_done_callback(self._done)
+
+    def _cancel(self):
+        r"""Cancel waiting tasks."""
+        with self._condition:
+            futures = list(self._futures)
+        for future in futures:
+            future.cancel()
+
+    def _done(self, future: concurrent.futures.Future):
+        r"""Release slot of finished or canceled task."""
+        with self._condition:
+            self._futures.discard(future)
+        self._slots.release()
+
+    def _run(self, func: Callable, *args: object):
+        r"""Run task with adaptive number of workers."""
+        if self._error is not None:
+            return
+        controller = self._controller
+        if controller is not None:
+            with self._condition:
+                self._condition.wait_for(lambda: self._running < controller.workers)
+                self._running += 1
+        start = time.perf_counter()
+        try:
+            func(*args)
+        except Exception as ex:
+            if self._error is None:
+                self._error = ex
+            self._cancel()
+        finally:
+            if controller is not None:
+                controller.observe(time.perf_counter() - start)
+                with self._condition:
+                    self._running -= 1
+                    self._condition.notify_all()
@@ -4,9 +4,15 @@ import oyaml as yaml
 
 import audeer
 
+from audb.core.define import ARCHIVE_SIZE
+from audb.core.define import BACKEND_BACKOFF
+from audb.core.define import BACKEND_RETRIES
 from audb.core.define import CONFIG_FILE
 from audb.core.define import DEPRECATED_USER_CONFIG_FILE
+from audb.core.define import LOOKUP_TTL
+from audb.core.define import MEMORY_CACHE_SIZE
 from audb.core.define import USER_CONFIG_FILE
+from audb.core.define import VERSIONS_TTL
 from audb.core.repository import Repository
 
 
@@ -124,3 +130,141 @@ class config:
 
     SHARED_CACHE_ROOT = _config["shared_cache_root"]
     r"""Shared cache folder."""
+
+    BACKEND_RETRIES = BACKEND_RETRIES
+    r"""Number of retries of a failed backend request.
+
+    Only errors that might disappear
+    when the request is repeated,
+    e.g. connection errors,
+    are retried.
+
+    """
+
+    BACKEND_BACKOFF = BACKEND_BACKOFF
+    r"""Maximum delay in seconds before retrying a backend request.
+
+    The maximum delay is doubled with every further retry.
+    The actual delay is chosen randomly
+    below the maximum delay.
+
+    """
+
+    BACKEND_TIMEOUT = None
+    r"""Timeout in seconds of a single backend request.
+
+    If a download takes longer,
+    it is abandoned and retried.
+    ``None`` disables the timeout.
+
+    """
+
+    BACKEND_HEDGE_PERCENTILE = None
+    r"""Percentile of latency after which a request is duplicated.
+
+    If a download takes longer
+    than the given percentile
+    of the duration of previous requests
+    of the same type,
+    e.g. ``95``,
+    a second identical request is started
+    and the result of the faster one is used.
+    ``None`` disables hedged requests.
+
+    """
+
+    LOOKUP_TTL = LOOKUP_TTL
+    r"""Time in seconds a failed database look up is remembered.
+
+    The repository containing a version of a database
+    is stored in the user cache folder,
+    so that it has to be looked up only once.
+    If a version of a database is not found
+    in any repository,
+    this is remembered for the given time.
+    ``0`` disables remembering failed look ups.
+
+    """
+
+    VERSIONS_TTL = VERSIONS_TTL
+    r"""Time in seconds versions of a database are remembered.
+
+    :func:`audb.versions`
+    stores the versions of a database
+    in the user cache folder,
+    and returns them from there
+    for the given time,
+    also to other processes.
+    ``0`` disables remembering versions.
+    :func:`audb.versions`
+    and :func:`audb.latest_version`
+    request them again
+    when called with ``refresh=True``.
+
+    """
+
+    OFFLINE = False
+    r"""Do not request versions of databases from backends.
+
+    If ``True``,
+    :func:`audb.versions`
+    returns the versions stored in the user cache folder,
+    regardless of their age,
+    or the versions of the database
+    found in the cache folders.
+
+    """
+
+    FASTEST_REPLICA = False
+    r"""Select fastest repository containing a database.
+
+    If ``False``,
+    a database is loaded
+    from the first repository in :attr:`audb.config.REPOSITORIES`
+    that contains it.
+    If ``True``,
+    all repositories containing the database are considered
+    and the healthy one
+    with the lowest expected download duration is selected,
+    based on the measured latency and throughput
+    of previous requests,
+    see :func:`audb.repository_statistics`.
+    The repositories containing a database
+    are remembered in the user cache folder
+    for :attr:`audb.config.LOOKUP_TTL` seconds.
+
+    """
+
+    STRIPE_REPLICAS = False
+    r"""Distribute downloads of media across repositories.
+
+    If ``True``
+    and a database is stored in several repositories,
+    :func:`audb.load` and :func:`audb.load_media`
+    download every media archive
+    from the healthy repository
+    that is expected to finish it first,
+    given its throughput
+    and the archives it is already downloading.
+    If the download of an archive fails,
+    it is repeated from another repository.
+
+    """
+
+    MEMORY_CACHE_SIZE = MEMORY_CACHE_SIZE
+    r"""Maximum size in bytes of archives kept in memory.
+
+    :func:`audb.read_media` keeps recently used archives
+    in memory up to this size.
+    ``0`` disables keeping archives in memory.
+
+    """
+
+    ARCHIVE_SIZE = ARCHIVE_SIZE
+    r"""Target size in bytes of media archives.
+
+    :func:`audb.publish` bundles new media files
+    into archives of about this size,
+    if ``archives='auto'``.
+
+    """
@@ -21,6 +21,52 @@ see https://github.com/audeering/audb/pull/569.
 
 """
 
+DOWNLOAD_JOURNAL_FILE = ".download"
+r"""Filename of journal of downloaded archives.
+
+:func:`audb.load_to` records every archive
+it has completely downloaded
+in this file
+inside the target folder.
+When rerunning an interrupted download,
+files belonging to recorded archives
+are not verified again.
+The file is removed
+after a successful download.
+
+"""
+
+UPLOAD_JOURNAL_FILE = ".upload"
+r"""Filename of journal of uploaded files.
+
+:func:`audb.publish` records every attachment,
+table,
+and media archive
+it has uploaded
+in this file
+inside the database folder.
+When publishing the same version again
+after an interruption,
+recorded files that still exist on the backend
+are not uploaded again.
+The file is removed
+after a successful publication.
+
+"""
+
+CHECKSUM_CACHE_FILE = ".checksums.parquet"
+r"""Filename of cache of checksums of files.
+
+:func:`audb.publish` and :func:`audb.load_to`
+store the checksums of the files of a database
+in this file
+inside the database folder,
+and calculate them only again
+for files that have changed.
+
+"""
+CHECKSUM_CACHE_MIN_AGE = 2_000_000_000  # ns before checksum of a file is stored
+
 # Dependencies
 DEPENDENCY_FILE = f"{DB}.parquet"
 r"""Filename and extension of dependency table file."""
@@ -106,5 +152,68 @@ FORMATS = [Format.WAV, Format.FLAC]
 BIT_DEPTHS = [16, 24, 32]
 SAMPLING_RATES = [8000, 16000, 22050, 24000, 44100, 48000]
 
+# Formats with header read by soundfile, see audb.publish()
+HEADER_FORMATS = ("flac", "mp3", "ogg", "wav")
+SUBTYPE_BIT_DEPTHS = {
+    # Subtype: bit depth, as in audiofile.bit_depth()
+    "ALAW": 8,
+    "DOUBLE": 64,
+    "FLOAT": 32,
+    "G721_32": 4,
+    "GSM610": 16,
+    "IMA_ADPCM": 4,
+    "MS_ADPCM": 4,
+    "PCM_16": 16,
+    "PCM_24": 24,
+    "PCM_32": 32,
+    "PCM_S8": 8,
+    "PCM_U8": 8,
+    "ULAW": 8,
+}
+
+# Archives created by audb.publish()
+ARCHIVE_SIZE = 256 * 1024 * 1024  # 256 MiB, see archives="auto"
+COMPRESSION = ("deflate", "store")
+COMPRESSED_FORMATS = ("flac", "m4a", "mp3", "mp4", "ogg", "opus")  # stored by default
+
+# Download order of media archives, see audb.load()
+ORDERS = ("table", "smallest-first")
+
 # Progress bar
 MAXIMUM_REFRESH_TIME = 1  # force progress bar to update every second
+
+# Adaptive number of workers, see num_workers="auto"
+ADAPTIVE_WORKERS_INITIAL = 4
+ADAPTIVE_WORKERS_TOLERANCE = 0.1  # relative change considered as noise
+
+# Stages of publication pipeline
+STAGE_QUEUE_SIZE = 2  # waiting tasks per worker of a stage
+
+# Resilience of backend requests
+BACKEND_RETRIES = 3
+BACKEND_BACKOFF = 0.5  # delay before first retry in seconds
+HEDGE_MIN_REQUESTS = 20  # requests observed before hedging starts
+LATENCY_WINDOW = 1000  # number of latencies stored per operation
+
+# Selection of repositories containing the same database
+REPLICA_AVERAGE_WEIGHT = 0.3  # weight of latest measurement in average
+REPLICA_COOLDOWN = 60  # seconds a failed repository is avoided
+REPLICA_MIN_SIZE = 1024 * 1024  # minimum size of download to measure throughput
+REPLICA_PROBE_INTERVAL = 300  # seconds before latency is measured again
+REPLICA_REFERENCE_SIZE = 64 * 1024 * 1024  # size of download to rank repositories
+
+# Lock files of read-through mirror
+MIRROR_LOCK_FOLDER = ".locks"
+
+# Catalog of databases at root of repository
+CATALOG_FILE = "catalog.json"
+CATALOG_ATTEMPTS = 3  # updates of catalog when concurrently published
+
+# Persistent cache of repository look ups and versions
+LOOKUP_CACHE_FOLDER = ".lookup"
+LOOKUP_TTL = 600  # seconds a database not found is remembered
+VERSIONS_TTL = 300  # seconds versions of a database are remembered
+
+# Reading media into memory
+MEMORY_CACHE_SIZE = 0  # disabled
+MEMORY_CACHE_DEPENDENCIES = 8  # dependency tables kept in memory
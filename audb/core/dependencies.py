@@ -16,6 +16,8 @@ import audbackend
 import audeer
 
 from audb.core import define
+from audb.core import retry
+from audb.core import utils
 
 
 class Dependencies:
@@ -871,9 +873,16 @@ def download_dependencies(
         # or if non-existent `db.zip`
         # from backend
         remote_deps_file = backend_interface.join("/", name, define.DEPENDENCY_FILE)
-        if backend_interface.exists(remote_deps_file, version):
+        if retry.call(
+            backend_interface.exists,
+            remote_deps_file,
+            version,
+            operation="exists",
+            concurrent=True,
+        ):
             local_deps_file = os.path.join(tmp_root, define.DEPENDENCY_FILE)
-            backend_interface.get_file(
+            utils.get_file(
+                backend_interface,
                 remote_deps_file,
                 local_deps_file,
                 version,
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import os
+import threading
+
+
+class Journal:
+    def __init__(
+        self,
+        path: str,
+    ):
+        r"""Journal of completed operations.
+
+        Records completed operations,
+        e.g. downloaded archives,
+        in a text file,
+        one operation per line.
+        As every entry is appended to the file
+        directly after an operation is finished,
+        the journal survives interruptions
+        and can be used to skip finished operations
+        when rerunning an interrupted job.
+
+        Entries are tuples of strings,
+        and are stored as tab separated lines.
+        An incomplete last line,
+        e.g. written while the job was killed,
+        is ignored.
+
+        Args:
+            path: path to journal file
+
+        """
+        self.path = path
+        r"""Path to journal file."""
+        self._entries = set()
+        self._lock = threading.Lock()
+        if os.path.exists(path):
+            incomplete = False
+            with open(path) as fp:
+                for line in fp:
+                    if line.endswith("\n"):
+                        self._entries.add(tuple(line[:-1].split("\t")))
+                    else:
+                        incomplete = True
+            if incomplete:
+                # Rewrite file,
+                # as new entries would be appended
+                # to the incomplete line
+                with open(path, "w") as fp:
+                    for entry in self._entries:
+                        fp.write("\t".join(entry) + "\n")
+
+    def __contains__(self, entry: tuple[str, ...]) -> bool:
+        r"""Check if operation is recorded in journal.
+
+        Args:
+            entry: operation
+
+        Returns:
+            ``True`` if operation is recorded
+
+        """
+        return tuple(entry) in self._entries
+
+    def __len__(self) -> int:
+        r"""Number of recorded operations."""
+        return len(self._entries)
+
+    def add(self, *entry: str):
+        r"""Record completed operation.
+
+        The entry is written to the journal file
+        before the method returns.
+        The method is thread-safe.
+
+        Args:
+            entry: operation
+
+        """
+        with self._lock:
+            if entry in self._entries:
+                return
+            with open(self.path, "a") as fp:
+                fp.write("\t".join(entry) + "\n")
+            self._entries.add(entry)
+
+    def clear(self):
+        r"""Remove all entries and the journal file."""
+        with self._lock:
+            self._entries.clear()
+            if os.path.exists(self.path):
+                os.remove(self.path)
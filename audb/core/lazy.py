@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Sequence
+import concurrent.futures
+import os
+import threading
+
+import pandas as pd
+
+import audformat
+
+from audb.core import define
+from audb.core.dependencies import Dependencies
+
+
+class LazyDatabase(audformat.Database):
+    r"""Database with media files loaded on access.
+
+    This class cannot be created directly,
+    but only by calling :func:`audb.load`
+    with ``lazy_media=True``.
+    It behaves as :class:`audformat.Database`,
+    but its media files are not loaded
+    before they are requested
+    with :meth:`audb.LazyDatabase.audb_path`.
+
+    Examples:
+        >>> db = audb.load(
+        ...     "emodb",
+        ...     version="1.4.1",
+        ...     lazy_media=True,
+        ...     full_path=False,
+        ...     verbose=False,
+        ... )
+        >>> path = db.audb_path("wav/03a01Fa.wav")
+        >>> path.endswith("03a01Fa.wav")
+        True
+
+    """
+
+    def __init__(
+        self,
+        db: audformat.Database,
+        *,
+        db_root: str,
+        deps: Dependencies,
+        format: str | None,
+        full_path: bool,
+        load_media: Callable[[Sequence[str]], list | None],
+    ):
+        # Transfer attributes of database object
+        for attr in db.__dict__.keys():
+            setattr(self, attr, getattr(db, attr))
+
+        self._db_root = db_root
+        self._deps = deps
+        self._format = format
+        self._load_media = load_media
+
+        # Map file paths as used in the tables
+        # to file paths as used in the dependency table
+        media = deps._df[
+            (deps._df["type"] == define.DEPENDENCY_TYPE["media"])
+            & (deps._df["removed"] == 0)
+        ].index
+        files = pd.Index(media, name="file")
+        if format is not None:
+            files = audformat.utils.replace_file_extension(files, format)
+        cache_files = audformat.utils.expand_file_path(files, db_root)
+        if full_path:
+            files = cache_files
+        self._media = dict(zip(files, media))
+        self._cache_files = dict(zip(media, cache_files))
+
+        # Archives requested, but not loaded yet
+        self._requests = {}
+        self._queue = []
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def audb_path(self, file: str) -> str:
+        r"""Path to media file in cache.
+
+        If the media file is not in the cache yet,
+        the archive containing the file is loaded.
+        Requests from different threads
+        for files of the same archive
+        are served by a single download,
+        and requests that arrive
+        while other archives are loaded
+        are combined into a single call
+        to :func:`audb.load_media`.
+
+        Args:
+            file: media file
+                as stored in the tables of the database
+
+        Returns:
+            absolute path to media file in cache
+
+        Raises:
+            ValueError: if media file is not part of the database
+            RuntimeError: if the lock of the database cache folder
+                cannot be acquired
+
+        """
+        if file not in self._media:
+            raise ValueError(f"Could not find the media file '{file}' in {self.name}.")
+        media = self._media[file]
+        path = self._cache_files[media]
+        if os.path.exists(path):
+            return path
+
+        archive = (self._deps.archive(media), self._deps.version(media))
+        with self._lock:
+            if archive not in self._requests:
+                self._requests[archive] = concurrent.futures.Future()
+                self._queue.append(archive)
+            future = self._requests[archive]
+
+        self._process_queue()
+        future.result()
+        return path
+
+    def _process_queue(self):
+        r"""Load all requested archives.
+
+        Only one thread loads archives at a time.
+        It takes all archives requested so far,
+        including those of other threads.
+
+        """
+        with self._load_lock:
+            with self._lock:
+                archives = self._queue
+                self._queue = []
+            if not archives:
+                # Archives already loaded by other thread
+                return
+
+            df = self._deps._df
+            selection = pd.MultiIndex.from_arrays([df["archive"], df["version"]]).isin(
+                archives
+            )
+            files = [file for file in df.index[selection] if file in self._cache_files]
+            try:
+                if self._load_media(files) is None:
+                    raise RuntimeError(define.TIMEOUT_MSG)
+            except BaseException as ex:
+                with self._lock:
+                    for archive in archives:
+                        self._requests.pop(archive).set_exception(ex)
+                return
+            with self._lock:
+                for archive in archives:
+                    self._requests.pop(archive).set_result(None)
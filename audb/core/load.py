@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from collections.abc import Sequence
+import concurrent.futures
+import contextvars
+import functools
 import os
 import shutil
 
@@ -11,6 +15,7 @@ import audbackend
 import audeer
 import audformat
 
+from audb.core import concurrency
 from audb.core import define
 from audb.core import utils
 from audb.core.api import cached
@@ -19,10 +24,13 @@ from audb.core.api import latest_version
 from audb.core.cache import database_cache_root
 from audb.core.cache import database_tmp_root
 from audb.core.cache import default_cache_root
+from audb.core.cache import remove_database_tmp_root
+from audb.core.coalesce import Coalescer
 from audb.core.dependencies import Dependencies
 from audb.core.dependencies import error_message_missing_object
 from audb.core.dependencies import filter_deps
 from audb.core.flavor import Flavor
+from audb.core.lazy import LazyDatabase
 from audb.core.lock import FolderLock
 from audb.core.shimmer import shimmer
 from audb.core.utils import is_empty
@@ -32,6 +40,38 @@ from audb.core.utils import lookup_backend
 CachedVersions = Sequence[tuple[audeer.StrictVersion, str, Dependencies]]
 
 
+def _archive_sizes(deps: Dependencies) -> dict[tuple[str, str], float]:
+    r"""Estimate size of media archives.
+
+    The dependency table does not store file sizes.
+    The size of audio files is estimated
+    by their number of samples,
+    channels
+    and bit depth.
+    Other files,
+    e.g. text files,
+    are assumed to have size 0.
+
+    Args:
+        deps: database dependency object
+
+    Returns:
+        dictionary with ``(archive, version)`` as keys
+        and estimated size in bytes as values
+
+    """
+    df = deps._df
+    size = (
+        df["duration"].astype("float")
+        * df["sampling_rate"].astype("float")
+        * df["channels"].astype("float")
+        * df["bit_depth"].astype("float")
+        / 8
+    )
+    sizes = size.groupby([df["archive"], df["version"]]).sum()
+    return dict(zip(sizes.index, sizes.values))
+
+
 def _cached_versions(
     name: str,
     version: str,
@@ -202,6 +242,59 @@ def _database_check_complete(
     return True
 
 
+def _dependencies_async(
+    name: str,
+    version: str,
+    cache_root: str | None,
+) -> concurrent.futures.Future:
+    r"""Load dependency table in a background thread.
+
+    Allows to fetch the dependency table
+    while the database header is fetched.
+
+    Args:
+        name: name of database
+        version: version of database
+        cache_root: cache folder where databases are stored
+
+    Returns:
+        future of dependency object
+
+    """
+    pool = concurrent.futures.ThreadPoolExecutor(1)
+    future = pool.submit(
+        contextvars.copy_context().run,
+        dependencies,
+        name,
+        version=version,
+        cache_root=cache_root,
+    )
+    pool.shutdown(wait=False)
+    return future
+
+
+def _table_order(
+    db: audformat.Database,
+    tables: Sequence[str],
+) -> Callable[[str], int]:
+    r"""Sort key of media files by their position in tables.
+
+    Args:
+        db: database with loaded tables
+        tables: tables in requested order
+
+    Returns:
+        function returning position of a media file
+
+    """
+    positions = {}
+    for table in tables:
+        if table in db.tables:
+            for file in db[table].files:
+                positions.setdefault(file, len(positions))
+    return positions.__getitem__
+
+
 def _files_duration(
     db: audformat.Database,
     deps: Dependencies,
@@ -231,7 +324,7 @@ def _get_attachments_from_cache(
     deps: Dependencies,
     cached_versions: CachedVersions,
     flavor: Flavor,
-    num_workers: int,
+    num_workers: int | str | None,
     verbose: bool,
 ) -> list[str]:
     r"""Copy files from cache.
@@ -277,7 +370,7 @@ def _get_attachments_from_cache(
         def job(cache_root: str, file: str):
             _copy_path(file, cache_root, db_root_tmp, db_root)
 
-        audeer.run_tasks(
+        concurrency.run_tasks(
             job,
             params=[([root, path], {}) for root, path in cached_paths],
             num_workers=num_workers,
@@ -286,7 +379,7 @@ def _get_attachments_from_cache(
             maximum_refresh_time=define.MAXIMUM_REFRESH_TIME,
         )
 
-        audeer.rmdir(db_root_tmp)
+        remove_database_tmp_root(db_root_tmp)
 
     return missing_attachments
 
@@ -298,7 +391,7 @@ def _get_files_from_cache(
     deps: Dependencies,
     cached_versions: CachedVersions,
     flavor: Flavor,
-    num_workers: int,
+    num_workers: int | str | None,
     verbose: bool,
 ) -> Sequence[str]:
     r"""Copy files from cache.
@@ -357,7 +450,7 @@ def _get_files_from_cache(
                 def job(cache_root: str, file: str):
                     _copy_path(file, cache_root, db_root_tmp, db_root)
 
-            audeer.run_tasks(
+            concurrency.run_tasks(
                 job,
                 params=[([root, file], {}) for root, file in cached_files],
                 num_workers=num_workers,
@@ -366,7 +459,7 @@ def _get_files_from_cache(
                 maximum_refresh_time=define.MAXIMUM_REFRESH_TIME,
             )
 
-            audeer.rmdir(db_root_tmp)
+            remove_database_tmp_root(db_root_tmp)
 
     except filelock.Timeout:
         missing_files = files
@@ -380,7 +473,7 @@ def _get_attachments_from_backend(
     db_root: str,
     deps: Dependencies,
     backend_interface: type[audbackend.interface.Base],
-    num_workers: int | None,
+    num_workers: int | str | None,
     verbose: bool,
 ):
     r"""Load attachments from backend."""
@@ -396,7 +489,8 @@ def _get_attachments_from_backend(
         archive = deps.archive(path)
         version = deps.version(path)
         archive = backend_interface.join("/", db.name, "attachment", archive + ".zip")
-        backend_interface.get_archive(
+        utils.get_archive(
+            backend_interface,
             archive,
             db_root_tmp,
             version,
@@ -410,7 +504,7 @@ def _get_attachments_from_backend(
             dst_path,
         )
 
-    audeer.run_tasks(
+    concurrency.run_tasks(
         job,
         params=[([path], {}) for path in paths],
         num_workers=num_workers,
@@ -419,28 +513,71 @@ def _get_attachments_from_backend(
         maximum_refresh_time=define.MAXIMUM_REFRESH_TIME,
     )
 
-    audeer.rmdir(db_root_tmp)
+    remove_database_tmp_root(db_root_tmp)
 
 
 def _get_media_from_backend(
     name: str,
+    version: str,
     media: Sequence[str],
     db_root: str,
     flavor: Flavor | None,
     deps: Dependencies,
     backend_interface: type[audbackend.interface.Base],
-    num_workers: int | None,
+    num_workers: int | str | None,
     verbose: bool,
+    order: str | Callable[[str], object] | None = None,
+    media_callback: Callable[[str], None] | None = None,
 ):
-    r"""Load media from backend."""
+    r"""Load media from backend.
+
+    If :attr:`audb.config.STRIPE_REPLICAS` is ``True``,
+    the archives are downloaded
+    from all repositories containing the database,
+    see :func:`audb.core.utils.replica_backends`.
+
+    Args:
+        name: name of database
+        version: version of database
+        media: media files
+        db_root: database root
+        flavor: database flavor object
+        deps: database dependency object
+        backend_interface: backend object
+        num_workers: number of workers to use
+        verbose: if ``True`` show progress bar
+        order: order in which archives are downloaded,
+            see :func:`audb.load`
+        media_callback: function called
+            with the path of every requested media file
+            after it was moved to ``db_root``
+
+    """
     # figure out archives
     archives = set()
     archive_names = set()
+    # smallest key of the media files of every archive
+    # to sort the archives
+    archive_keys = {}
+    if callable(order):
+        file_key = order
+    else:
+        file_key = {file: n for n, file in enumerate(media)}.__getitem__
     for file in media:
         archive_name = deps.archive(file)
         archive_version = deps.version(file)
-        archives.add((archive_name, archive_version))
+        archive = (archive_name, archive_version)
+        archives.add(archive)
         archive_names.add(archive_name)
+        if order is not None and order != "smallest-first":
+            key = file_key(file)
+            if archive not in archive_keys or key < archive_keys[archive]:
+                archive_keys[archive] = key
+    if order == "smallest-first":
+        archive_keys = _archive_sizes(deps)
+    if order is not None:
+        archives = sorted(archives, key=archive_keys.__getitem__)
+    requested_media = set(media)
     # collect all files that will be extracted,
     # if we have more files than archives
     if len(deps.files) > len(deps.archives):
@@ -458,53 +595,81 @@ def _get_media_from_backend(
     utils.mkdir_tree(media, db_root)
     utils.mkdir_tree(media, db_root_tmp)
 
-    def job(archive: str, version: str):
+    # media files that can be changed to a requested flavor
+    flavor_files = set(deps._df[deps._df.sampling_rate != 0].index)
+
+    def move_file(file: str):
+        if os.name == "nt":  # pragma: no cover
+            file = file.replace(os.sep, "/")
+        requested = file in requested_media
+        if flavor is not None and file in flavor_files:
+            bit_depth = deps.bit_depth(file)
+            channels = deps.channels(file)
+            sampling_rate = deps.sampling_rate(file)
+            src_path = os.path.join(db_root_tmp, file)
+            file = flavor.destination(file)
+            dst_path = os.path.join(db_root_tmp, file)
+            flavor(
+                src_path,
+                dst_path,
+                src_bit_depth=bit_depth,
+                src_channels=channels,
+                src_sampling_rate=sampling_rate,
+            )
+            if src_path != dst_path:
+                os.remove(src_path)
+
+        audeer.move_file(
+            os.path.join(db_root_tmp, file),
+            os.path.join(db_root, file),
+        )
+        if media_callback is not None and requested:
+            media_callback(os.path.join(db_root, file))
+
+    # If there are less archives than workers,
+    # use remaining workers to extract
+    # and convert files of an archive in parallel
+    member_workers = concurrency.workers_per_task(num_workers, len(archives))
+
+    def job(archive: str, archive_version: str):
+        size = archive_sizes.get((archive, archive_version), 0)
         archive = backend_interface.join("/", name, "media", archive + ".zip")
         # extract and move all files that are stored in the archive,
         # even if only a single file from the archive was requested
-        files = backend_interface.get_archive(
-            archive,
-            db_root_tmp,
-            version,
-            tmp_root=db_root_tmp,
+        files = stripe.run(
+            lambda backend_interface: utils.get_archive(
+                backend_interface,
+                archive,
+                db_root_tmp,
+                archive_version,
+                tmp_root=db_root_tmp,
+                num_workers=member_workers,
+            ),
+            size,
+        )
+        concurrency.run_tasks(
+            move_file,
+            params=[([file], {}) for file in files],
+            num_workers=member_workers,
         )
-        # media files that can be changed to a requested flavor
-        flavor_files = deps._df[deps._df.sampling_rate != 0].index
-        for file in files:
-            if os.name == "nt":  # pragma: no cover
-                file = file.replace(os.sep, "/")
-            if flavor is not None and file in flavor_files:
-                bit_depth = deps.bit_depth(file)
-                channels = deps.channels(file)
-                sampling_rate = deps.sampling_rate(file)
-                src_path = os.path.join(db_root_tmp, file)
-                file = flavor.destination(file)
-                dst_path = os.path.join(db_root_tmp, file)
-                flavor(
-                    src_path,
-                    dst_path,
-                    src_bit_depth=bit_depth,
-                    src_channels=channels,
-                    src_sampling_rate=sampling_rate,
-                )
-                if src_path != dst_path:
-                    os.remove(src_path)
-
-            audeer.move_file(
-                os.path.join(db_root_tmp, file),
-                os.path.join(db_root, file),
-            )
 
-    audeer.run_tasks(
-        job,
-        params=[([archive, version], {}) for archive, version in archives],
-        num_workers=num_workers,
-        progress_bar=verbose,
-        task_description="Load media",
-        maximum_refresh_time=define.MAXIMUM_REFRESH_TIME,
-    )
+    with utils.replica_backends(name, version, backend_interface) as stripe:
+        # Downloads are only distributed by size
+        # across several repositories
+        archive_sizes = _archive_sizes(deps) if len(stripe) > 1 else {}
+        concurrency.run_tasks(
+            job,
+            params=[
+                ([archive, archive_version], {})
+                for archive, archive_version in archives
+            ],
+            num_workers=num_workers,
+            progress_bar=verbose,
+            task_description="Load media",
+            maximum_refresh_time=define.MAXIMUM_REFRESH_TIME,
+        )
 
-    audeer.rmdir(db_root_tmp)
+    remove_database_tmp_root(db_root_tmp)
 
 
 def _get_tables_from_backend(
@@ -514,7 +679,7 @@ def _get_tables_from_backend(
     deps: Dependencies,
     backend_interface: type[audbackend.interface.Base],
     pickle_tables: bool,
-    num_workers: int | None,
+    num_workers: int | str | None,
     verbose: bool,
 ):
     r"""Load tables from backend.
@@ -540,6 +705,11 @@ def _get_tables_from_backend(
     """
     db_root_tmp = database_tmp_root(db_root)
 
+    # If there are less tables than workers,
+    # use remaining workers to download large tables
+    # in parallel byte ranges
+    table_workers = concurrency.workers_per_task(num_workers, len(tables))
+
     def job(table: str):
         csv_file = f"db.{table}.csv"
         parquet_file = f"db.{table}.parquet"
@@ -547,21 +717,25 @@ def _get_tables_from_backend(
         if csv_file in deps.tables:
             table_file = csv_file
             remote_file = backend_interface.join("/", db.name, "meta", f"{table}.zip")
-            backend_interface.get_archive(
+            utils.get_archive(
+                backend_interface,
                 remote_file,
                 db_root_tmp,
                 deps.version(table_file),
                 tmp_root=db_root_tmp,
+                num_workers=table_workers,
             )
         else:
             table_file = parquet_file
             remote_file = backend_interface.join(
                 "/", db.name, "meta", f"{table}.parquet"
             )
-            backend_interface.get_file(
+            utils.get_file(
+                backend_interface,
                 remote_file,
                 os.path.join(db_root_tmp, table_file),
                 deps.version(table_file),
+                num_workers=table_workers,
             )
 
         table_files = [table_file]
@@ -584,7 +758,7 @@ def _get_tables_from_backend(
                 os.path.join(db_root, table_file),
             )
 
-    audeer.run_tasks(
+    concurrency.run_tasks(
         job,
         params=[([table], {}) for table in tables],
         num_workers=num_workers,
@@ -593,7 +767,7 @@ def _get_tables_from_backend(
         maximum_refresh_time=define.MAXIMUM_REFRESH_TIME,
     )
 
-    audeer.rmdir(db_root_tmp)
+    remove_database_tmp_root(db_root_tmp)
 
 
 def _load_attachments(
@@ -606,7 +780,7 @@ def _load_attachments(
     deps: Dependencies,
     flavor: Flavor,
     cache_root: str,
-    num_workers: int,
+    num_workers: int | str | None,
     verbose: bool,
 ) -> CachedVersions | None:
     r"""Load attachments to cache.
@@ -686,8 +860,10 @@ def _load_files(
     cache_root: str,
     pickle_tables: bool,
     scan_for_missing_files: bool,
-    num_workers: int,
+    num_workers: int | str | None,
     verbose: bool,
+    order: str | Callable[[str], object] | None = None,
+    media_callback: Callable[[str], None] | None = None,
 ) -> CachedVersions | None:
     r"""Load files to cache.
 
@@ -727,6 +903,11 @@ def _load_files(
         num_workers: number of workers to use
         verbose: if ``True`` show progress bars
             for each step
+        order: order in which media archives are downloaded,
+            see :func:`audb.load`
+        media_callback: function called
+            with the path of every media file
+            as soon as it is stored in ``db_root``
 
     Returns:
         cached versions object
@@ -744,6 +925,16 @@ def _load_files(
     else:
         missing_files = list(files)
 
+    def report(files: Sequence[str], exclude: Sequence[str]):
+        r"""Call media callback for files stored in cache."""
+        if files_type == "media" and media_callback is not None:
+            exclude = set(exclude)
+            for file in files:
+                if file not in exclude:
+                    media_callback(_media_path(file, db_root, flavor))
+
+    report(files, missing_files)
+
     if missing_files:
         if cached_versions is None:
             cached_versions = _cached_versions(
@@ -753,6 +944,7 @@ def _load_files(
                 cache_root,
             )
         if cached_versions:
+            requested_files = missing_files
             missing_files = _get_files_from_cache(
                 missing_files,
                 files_type,
@@ -763,12 +955,14 @@ def _load_files(
                 num_workers,
                 verbose,
             )
+            report(requested_files, missing_files)
         if missing_files:
             if backend_interface is None:
                 backend_interface = lookup_backend(db.name, version)
             if files_type == "media":
                 _get_media_from_backend(
                     db.name,
+                    version,
                     missing_files,
                     db_root,
                     flavor,
@@ -776,6 +970,8 @@ def _load_files(
                     backend_interface,
                     num_workers,
                     verbose,
+                    order=order,
+                    media_callback=media_callback,
                 )
             elif files_type == "table":
                 _get_tables_from_backend(
@@ -833,6 +1029,28 @@ def _misc_tables_used_in_table(
     return audeer.unique(misc_tables_used_in_table)
 
 
+def _media_path(
+    file: str,
+    db_root: str,
+    flavor: Flavor,
+) -> str:
+    r"""Path of media file in cache.
+
+    Args:
+        file: media file
+        db_root: database root
+        flavor: database flavor object
+
+    Returns:
+        absolute path of media file
+        with file extension of requested format
+
+    """
+    if flavor.format is not None:
+        file = audeer.replace_file_extension(file, flavor.format)
+    return os.path.join(db_root, file)
+
+
 def _missing_files(
     files: Sequence[str],
     files_type: str,
@@ -882,14 +1100,14 @@ def _missing_files(
 def _remove_media(
     db: audformat.Database,
     deps: Dependencies,
-    num_workers: int,
+    num_workers: int | str | None,
     verbose: bool,
 ):
     removed_files = deps.removed_media
     if removed_files:
         db.drop_files(
             removed_files,
-            num_workers=num_workers,
+            num_workers=concurrency.resolve_num_workers(num_workers),
             verbose=verbose,
         )
 
@@ -899,7 +1117,7 @@ def _update_path(
     root: str,
     full_path: bool,
     format: str | None,
-    num_workers: int,
+    num_workers: int | str | None,
     verbose: bool,
 ):
     r"""Change the file path in all tables.
@@ -935,7 +1153,7 @@ def _update_path(
             )
 
     tables = db.tables.values()
-    audeer.run_tasks(
+    concurrency.run_tasks(
         job,
         params=[([table], {}) for table in tables],
         num_workers=num_workers,
@@ -1015,8 +1233,11 @@ def load(
     removed_media: bool = False,
     full_path: bool = True,
     pickle_tables: bool = True,
+    order: str | Callable[[str], object] = None,
+    media_callback: Callable[[str], None] = None,
+    lazy_media: bool = False,
     cache_root: str = None,
-    num_workers: int | None = 1,
+    num_workers: int | str | None = 1,
     timeout: float = define.TIMEOUT,
     verbose: bool = True,
 ) -> audformat.Database | None:
@@ -1042,6 +1263,21 @@ def load(
     Likewise, references to missing media files will be removed, too.
     I.e. filtering media files, may also remove entries from the meta files.
 
+    Media files are downloaded in archives.
+    With ``order``
+    the order in which archives are downloaded
+    can be controlled,
+    e.g. to get the first files of a table early.
+    Together with ``media_callback``,
+    which is called as soon as a media file
+    is stored in the cache,
+    processing of media files
+    can start before all files are loaded.
+    With ``lazy_media=True``
+    media files are not loaded at all,
+    but only when they are accessed
+    with :meth:`audb.LazyDatabase.audb_path`.
+
     Args:
         name: name of database
         version: version string, latest if ``None``
@@ -1090,11 +1326,39 @@ def load(
             and as pickle files.
             This allows for faster loading,
             when loading from cache
+        order: order in which media archives are downloaded.
+            If ``None``,
+            the order is arbitrary.
+            If ``'table'``,
+            archives are downloaded in the order
+            their media files appear in the requested tables.
+            If ``'smallest-first'``,
+            archives with the smallest estimated size
+            are downloaded first.
+            If a callable,
+            it is called with every requested media file
+            and should return a sort key.
+            Archives are downloaded
+            in the order of the smallest key
+            of their media files
+        media_callback: function called with the absolute path
+            of every requested media file
+            as soon as it is stored in the cache.
+            It might be called from different threads
+            if ``num_workers`` is not ``1``
+        lazy_media: if ``True``,
+            return after loading the tables
+            an :class:`audb.LazyDatabase` object,
+            which loads media files on access.
+            ``order`` and ``media_callback`` are ignored
         cache_root: cache folder where databases are stored.
             If not set :meth:`audb.default_cache_root` is used
         num_workers: number of parallel jobs or 1 for sequential
             processing. If ``None`` will be set to the number of
-            processors on the machine multiplied by 5
+            processors on the machine multiplied by 5.
+            If ``'auto'``,
+            the number of parallel jobs is adapted while running,
+            based on the measured throughput
         timeout: maximum time in seconds
             before giving up acquiring a lock to the database cache folder.
             ``None`` is returned in this case
@@ -1106,6 +1370,7 @@ def load(
     Raises:
         ValueError: if attachment, table or media is requested
             that is not part of the database
+        ValueError: if a non-supported ``order`` is requested
         ValueError: if a non-supported ``bit_depth``,
             ``format``,
             or ``sampling_rate``
@@ -1128,6 +1393,12 @@ def load(
         ['emotion', 'files']
 
     """
+    if order is not None and not callable(order) and order not in define.ORDERS:
+        raise ValueError(
+            f"Order '{order}' is not supported. "
+            f"Use one of {define.ORDERS} or a callable."
+        )
+
     if version is None:
         version = latest_version(name)
 
@@ -1164,6 +1435,32 @@ def load(
             flavor,
             db_root,
             scan_for_missing_files,
+            order,
+            media_callback,
+            lazy_media,
+        )
+
+    if db is not None and lazy_media and not only_metadata:
+        db = LazyDatabase(
+            db,
+            db_root=db_root,
+            deps=dependencies(name, version=version, cache_root=cache_root),
+            format=flavor.format,
+            full_path=full_path,
+            load_media=functools.partial(
+                load_media,
+                name,
+                version=version,
+                bit_depth=bit_depth,
+                channels=channels,
+                format=format,
+                mixdown=mixdown,
+                sampling_rate=sampling_rate,
+                cache_root=cache_root,
+                num_workers=num_workers,
+                timeout=timeout,
+                verbose=False,
+            ),
         )
 
     return db
@@ -1180,12 +1477,15 @@ def _load(
     full_path: bool,
     pickle_tables: bool,
     cache_root: str | None,
-    num_workers: int | None,
+    num_workers: int | str | None,
     timeout: float,
     verbose: bool,
     flavor: Flavor,
     db_root: str,
     scan_for_missing_files: bool,
+    order: str | Callable[[str], object] | None,
+    media_callback: Callable[[str], None] | None,
+    lazy_media: bool,
 ) -> audformat.Database | None:
     r"""Load database without the progress animation.
 
@@ -1195,13 +1495,14 @@ def _load(
     """
     db = None
     cached_versions = None
+    # Fetch dependency table and header concurrently.
+    # Tables are fetched afterwards,
+    # as the requested tables,
+    # and the misc tables used in schemes
+    # that have to be loaded first,
+    # are only known from the header
+    deps_future = _dependencies_async(name, version, cache_root)
     try:
-        deps = dependencies(
-            name,
-            version=version,
-            cache_root=cache_root,
-        )
-
         with utils.lock_cache(db_root, timeout=timeout):
             # Start with database header without tables
             db, backend_interface = load_header_to(
@@ -1211,6 +1512,7 @@ def _load(
                 flavor=flavor,
                 add_audb_meta=True,
             )
+            deps = deps_future.result()
 
             # A database cached with an older version of audb
             # stores its completeness in the header instead of
@@ -1306,7 +1608,9 @@ def _load(
             )
 
             # load missing media
-            if not db_is_complete and not only_metadata:
+            if not db_is_complete and not only_metadata and not lazy_media:
+                if order == "table":
+                    order = _table_order(db, requested_tables)
                 cached_versions = _load_files(
                     requested_media,
                     "media",
@@ -1322,7 +1626,12 @@ def _load(
                     scan_for_missing_files,
                     num_workers,
                     verbose,
+                    order=order,
+                    media_callback=media_callback,
                 )
+            elif not only_metadata and not lazy_media and media_callback is not None:
+                for file in requested_media:
+                    media_callback(_media_path(file, db_root, flavor))
 
             # filter media
             if media is not None or tables is not None:
@@ -1363,6 +1672,10 @@ def _load(
 
     except filelock.Timeout:
         utils.timeout_warning()
+    finally:
+        # Wait for dependency table,
+        # which holds a lock on the cache folder
+        concurrent.futures.wait([deps_future])
 
     return db
 
@@ -1528,7 +1841,7 @@ def load_header_to(
         if add_audb_meta:
             db_root_tmp = database_tmp_root(db_root)
             local_header = os.path.join(db_root_tmp, define.HEADER_FILE)
-        backend_interface.get_file(remote_header, local_header, version)
+        utils.get_file(backend_interface, remote_header, local_header, version)
         if add_audb_meta:
             db = audformat.Database.load(db_root_tmp, load_data=False)
             db.meta["audb"] = {
@@ -1541,7 +1854,7 @@ def load_header_to(
                 os.path.join(db_root_tmp, define.HEADER_FILE),
                 os.path.join(db_root, define.HEADER_FILE),
             )
-            audeer.rmdir(db_root_tmp)
+            remove_database_tmp_root(db_root_tmp)
 
     return audformat.Database.load(db_root, load_data=False), backend_interface
 
@@ -1557,7 +1870,7 @@ def load_media(
     mixdown: bool = False,
     sampling_rate: int = None,
     cache_root: str = None,
-    num_workers: int | None = 1,
+    num_workers: int | str | None = 1,
     timeout: float = define.TIMEOUT,
     verbose: bool = True,
 ) -> list | None:
@@ -1571,6 +1884,17 @@ def load_media(
     to your disk,
     but share the cache with :func:`audb.load`.
 
+    Concurrent calls from different threads
+    for the same database and flavor,
+    and with the same ``num_workers``,
+    ``timeout``,
+    and ``verbose`` arguments,
+    are merged,
+    so that every archive is downloaded only once.
+    A call waiting for a merged request
+    to be started
+    gives up after ``timeout`` as well.
+
     Args:
         name: name of database
         media: load media files provided in the list
@@ -1591,7 +1915,10 @@ def load_media(
             If not set :meth:`audb.default_cache_root` is used
         num_workers: number of parallel jobs or 1 for sequential
             processing. If ``None`` will be set to the number of
-            processors on the machine multiplied by 5
+            processors on the machine multiplied by 5.
+            If ``'auto'``,
+            the number of parallel jobs is adapted while running,
+            based on the measured throughput
         timeout: maximum time in seconds
             before giving up acquiring a lock to the database cache folder.
             ``None`` is returned in this case
@@ -1635,17 +1962,11 @@ def load_media(
         sampling_rate=sampling_rate,
     )
     db_root = database_cache_root(name, version, cache_root, flavor)
-    scan_for_missing_files = not is_empty(db_root)
 
-    with shimmer(
-        prefix="Get:   ",
-        text=f"{name} v{version}",
-        next_line=f"Cache: {db_root}",
-        enabled=verbose,
-    ):
-        files = _load_media(
+    def process(requests: list[list[str]]) -> list:
+        return _load_media(
             name,
-            media,
+            requests,
             version,
             format,
             cache_root,
@@ -1654,41 +1975,84 @@ def load_media(
             verbose,
             flavor,
             db_root,
-            scan_for_missing_files,
         )
 
+    with shimmer(
+        prefix="Get:   ",
+        text=f"{name} v{version}",
+        next_line=f"Cache: {db_root}",
+        enabled=verbose,
+    ):
+        # Concurrent requests for the same database and flavor
+        # are merged into a single request
+        key = (db_root, num_workers, timeout, verbose)
+        try:
+            files = _media_requests.submit(key, media, process, timeout=timeout)
+        except TimeoutError:
+            utils.timeout_warning()
+            files = None
+
     return files
 
 
+# Collects concurrent calls of load_media()
+_media_requests = Coalescer()
+
+
 def _load_media(
     name: str,
-    media: Sequence[str],
+    requests: list[list[str]],
     version: str,
     format: str | None,
     cache_root: str | None,
-    num_workers: int | None,
+    num_workers: int | str | None,
     timeout: float,
     verbose: bool,
     flavor: Flavor,
     db_root: str,
-    scan_for_missing_files: bool,
-) -> list | None:
-    r"""Load media file(s) without the progress animation.
+) -> list:
+    r"""Load media file(s) of one or more requests.
+
+    Dependencies are resolved,
+    the cache folder is locked
+    and missing archives are downloaded
+    once for all requests.
+
+    Args:
+        name: name of database
+        requests: requested media files of every request
+        version: version of database
+        format: file format
+        cache_root: cache folder where databases are stored
+        num_workers: number of workers
+        timeout: maximum time in seconds
+            before giving up acquiring a lock to the database cache folder
+        verbose: show debug messages
+        flavor: database flavor
+        db_root: database root folder
 
-    The body of :func:`load_media` lives here so that
-    :func:`load_media` only sets up and tears down the
-    :func:`shimmer` animation.
+    Returns:
+        paths to media files
+        or :class:`ValueError`
+        for every request
+
+    Raises:
+        filelock.Timeout: if the lock of the cache folder
+            cannot be acquired before ``timeout``
 
     """
-    files = None
-    try:
-        deps = dependencies(
-            name,
-            version=version,
-            cache_root=cache_root,
-        )
+    results = [None] * len(requests)
+    scan_for_missing_files = not is_empty(db_root)
+    deps = dependencies(
+        name,
+        version=version,
+        cache_root=cache_root,
+    )
 
-        available_files = set(deps.media)
+    # Requests with missing media files fail individually
+    available_files = set(deps.media)
+    valid = []
+    for n, media in enumerate(requests):
         missing = set(media) - available_files
         if missing:
             msg = error_message_missing_object(
@@ -1697,56 +2061,60 @@ def _load_media(
                 name,
                 version,
             )
-            raise ValueError(msg)
+            results[n] = ValueError(msg)
+        else:
+            valid.append(n)
+    media = list(dict.fromkeys(m for n in valid for m in requests[n]))
+    if not media:
+        return results
+
+    with utils.lock_cache(db_root, timeout=timeout):
+        # Start with database header without tables
+        db, backend_interface = load_header_to(
+            db_root,
+            name,
+            version,
+            flavor=flavor,
+            add_audb_meta=True,
+        )
 
-        with utils.lock_cache(db_root, timeout=timeout):
-            # Start with database header without tables
-            db, backend_interface = load_header_to(
+        # A database cached with an older version of audb
+        # stores its completeness in the header instead of
+        # in a ``.complete`` file, which is migrated here,
+        # see https://github.com/audeering/audb/pull/569
+        db_is_complete = utils.database_is_complete(db_root)
+        db_is_complete = db_is_complete or utils.legacy_complete(db_root, db)
+
+        # load missing media
+        if not db_is_complete:
+            _load_files(
+                media,
+                "media",
+                backend_interface,
                 db_root,
-                name,
+                db,
                 version,
-                flavor=flavor,
-                add_audb_meta=True,
+                None,
+                deps,
+                flavor,
+                cache_root,
+                False,
+                scan_for_missing_files,
+                num_workers,
+                verbose,
             )
 
-            # A database cached with an older version of audb
-            # stores its completeness in the header instead of
-            # in a ``.complete`` file, which is migrated here,
-            # see https://github.com/audeering/audb/pull/569
-            db_is_complete = utils.database_is_complete(
-                db_root
-            ) or utils.legacy_complete(db_root, db)
-
-            # load missing media
-            if not db_is_complete:
-                _load_files(
-                    media,
-                    "media",
-                    backend_interface,
-                    db_root,
-                    db,
-                    version,
-                    None,
-                    deps,
-                    flavor,
-                    cache_root,
-                    False,
-                    scan_for_missing_files,
-                    num_workers,
-                    verbose,
-                )
-
-            if format is not None:
-                media = [audeer.replace_file_extension(m, format) for m in media]
-            files = [
-                os.path.join(db_root, os.path.normpath(file))  # convert "/" to os.sep
-                for file in media
-            ]
-
-    except filelock.Timeout:
-        utils.timeout_warning()
+        files = media
+        if format is not None:
+            files = [audeer.replace_file_extension(m, format) for m in media]
+        paths = {
+            m: os.path.join(db_root, os.path.normpath(file))  # "/" to os.sep
+            for m, file in zip(media, files)
+        }
+        for n in valid:
+            results[n] = [paths[m] for m in requests[n]]
 
-    return files
+    return results
 
 
 def load_table(
@@ -1757,7 +2125,7 @@ def load_table(
     map: dict[str, str | Sequence[str]] = None,
     pickle_tables: bool = True,
     cache_root: str = None,
-    num_workers: int | None = 1,
+    num_workers: int | str | None = 1,
     verbose: bool = True,
 ) -> pd.DataFrame:
     r"""Load a database table.
@@ -1793,7 +2161,10 @@ def load_table(
             If not set :meth:`audb.default_cache_root` is used
         num_workers: number of parallel jobs or 1 for sequential
             processing. If ``None`` will be set to the number of
-            processors on the machine multiplied by 5
+            processors on the machine multiplied by 5.
+            If ``'auto'``,
+            the number of parallel jobs is adapted while running,
+            based on the measured throughput
         verbose: show debug messages
 
     Returns:
@@ -7,11 +7,16 @@ import audbackend
 import audeer
 import audformat
 
+from audb.core import concurrency
 from audb.core import define
 from audb.core import utils
 from audb.core.api import dependencies
 from audb.core.api import latest_version
+from audb.core.cache import clear_database_tmp_root
+from audb.core.cache import remove_database_tmp_root
+from audb.core.checksums import Checksums
 from audb.core.dependencies import Dependencies
+from audb.core.journal import Journal
 from audb.core.load import database_tmp_root
 from audb.core.load import load_header_to
 from audb.core.shimmer import shimmer
@@ -36,7 +41,7 @@ def _find_media(
     db: audformat.Database,
     db_root: str,
     deps: Dependencies,
-    num_workers: int | None,
+    num_workers: int | str | None,
     verbose: bool,
 ) -> list[str]:
     r"""Find missing media.
@@ -57,7 +62,7 @@ def _find_media(
             if not os.path.exists(full_file):
                 media.append(file)
 
-    audeer.run_tasks(
+    concurrency.run_tasks(
         job,
         params=[([file], {}) for file in db.files],
         num_workers=num_workers,
@@ -73,7 +78,7 @@ def _find_tables(
     db_header: audformat.Database,
     db_root: str,
     deps: Dependencies,
-    num_workers: int | None,
+    num_workers: int | str | None,
     verbose: bool,
 ) -> list[str]:
     r"""Find missing tables.
@@ -106,7 +111,7 @@ def _find_tables(
         ) and not os.path.exists(os.path.join(db_root, f"db.{table}.parquet")):
             tables.append(table)
 
-    audeer.run_tasks(
+    concurrency.run_tasks(
         job,
         params=[([table], {}) for table in list(db_header)],
         num_workers=num_workers,
@@ -125,7 +130,8 @@ def _get_attachments(
     db_name: str,
     deps: Dependencies,
     backend_interface: type[audbackend.interface.Base],
-    num_workers: int | None,
+    journal: Journal,
+    num_workers: int | str | None,
     verbose: bool,
 ):
     r"""Load attachments from backend."""
@@ -138,7 +144,8 @@ def _get_attachments(
         archive = deps.archive(path)
         version = deps.version(path)
         archive = backend_interface.join("/", db_name, "attachment", archive + ".zip")
-        backend_interface.get_archive(
+        utils.get_archive(
+            backend_interface,
             archive,
             db_root_tmp,
             version,
@@ -150,8 +157,9 @@ def _get_attachments(
             src_path,
             dst_path,
         )
+        journal.add("attachment", deps.archive(path), version)
 
-    audeer.run_tasks(
+    concurrency.run_tasks(
         job,
         params=[([path], {}) for path in paths],
         num_workers=num_workers,
@@ -168,7 +176,8 @@ def _get_media(
     db_name: str,
     deps: Dependencies,
     backend_interface: type[audbackend.interface.Base],
-    num_workers: int | None,
+    journal: Journal,
+    num_workers: int | str | None,
     verbose: bool,
 ):
     # create folder tree to avoid race condition
@@ -181,21 +190,28 @@ def _get_media(
     for file in media:
         archives.add((deps.archive(file), deps.version(file)))
 
+    # If there are less archives than workers,
+    # use remaining workers to extract files of an archive in parallel
+    member_workers = concurrency.workers_per_task(num_workers, len(archives))
+
     def job(archive: str, version: str):
-        archive = backend_interface.join("/", db_name, "media", archive + ".zip")
-        files = backend_interface.get_archive(
-            archive,
+        remote_archive = backend_interface.join("/", db_name, "media", archive + ".zip")
+        files = utils.get_archive(
+            backend_interface,
+            remote_archive,
             db_root_tmp,
             version,
             tmp_root=db_root_tmp,
+            num_workers=member_workers,
         )
         for file in files:
             audeer.move_file(
                 os.path.join(db_root_tmp, file),
                 os.path.join(db_root, file),
             )
+        journal.add("media", archive, version)
 
-    audeer.run_tasks(
+    concurrency.run_tasks(
         job,
         params=[([archive, version], {}) for archive, version in archives],
         num_workers=num_workers,
@@ -212,7 +228,7 @@ def _get_tables(
     db_name: str,
     deps: Dependencies,
     backend_interface: type[audbackend.interface.Base],
-    num_workers: int | None,
+    num_workers: int | str | None,
     verbose: bool,
 ):
     r"""Load table files from backend.
@@ -228,6 +244,10 @@ def _get_tables(
         verbose: if ``True``, show progress bar
 
     """
+    # If there are less tables than workers,
+    # use remaining workers to download large tables
+    # in parallel byte ranges
+    table_workers = concurrency.workers_per_task(num_workers, len(tables))
 
     def job(table: str):
         pkl_file = f"db.{table}.pkl"
@@ -247,21 +267,25 @@ def _get_tables(
         if csv_file in deps.tables:
             table_file = csv_file
             remote_file = backend_interface.join("/", db_name, "meta", f"{table}.zip")
-            backend_interface.get_archive(
+            utils.get_archive(
+                backend_interface,
                 remote_file,
                 db_root_tmp,
                 deps.version(table_file),
                 tmp_root=db_root_tmp,
+                num_workers=table_workers,
             )
         else:
             table_file = parquet_file
             remote_file = backend_interface.join(
                 "/", db_name, "meta", f"{table}.parquet"
             )
-            backend_interface.get_file(
+            utils.get_file(
+                backend_interface,
                 remote_file,
                 os.path.join(db_root_tmp, table_file),
                 deps.version(table_file),
+                num_workers=table_workers,
             )
 
         audeer.move_file(
@@ -269,7 +293,7 @@ def _get_tables(
             os.path.join(db_root, table_file),
         )
 
-    audeer.run_tasks(
+    concurrency.run_tasks(
         job,
         params=[([table], {}) for table in tables],
         num_workers=num_workers,
@@ -279,6 +303,33 @@ def _get_tables(
     )
 
 
+def _in_journal(
+    journal: Journal,
+    deps: Dependencies,
+    file: str,
+) -> bool:
+    r"""Check if archive of file is recorded in journal.
+
+    Args:
+        journal: journal of downloaded archives
+        deps: database dependencies
+        file: media file or attachment
+
+    Returns:
+        ``True`` if the archive containing ``file``
+        was completely downloaded before
+
+    """
+    file_type = deps.type(file)
+    if file_type == define.DEPENDENCY_TYPE["media"]:
+        entry = ("media", deps.archive(file), deps.version(file))
+    elif file_type == define.DEPENDENCY_TYPE["attachment"]:
+        entry = ("attachment", deps.archive(file), deps.version(file))
+    else:
+        return False
+    return entry in journal
+
+
 def _remove_empty_dirs(root):
     r"""Remove directories, fails if it contains non-empty sub-folders."""
     files = os.listdir(root)
@@ -299,7 +350,8 @@ def load_to(
     only_metadata: bool = False,
     pickle_tables: bool = True,
     cache_root: str = None,
-    num_workers: int | None = 1,
+    verify: bool = False,
+    num_workers: int | str | None = 1,
     verbose: bool = True,
 ) -> audformat.Database:
     r"""Load database to directory.
@@ -311,6 +363,13 @@ def load_to(
     some version of the database,
     it will upgrade to the requested version.
     Unchanged files will be skipped.
+    To detect changed files,
+    their md5 hashes are stored in the file
+    ``.checksums.parquet`` in ``root``,
+    and only calculated again
+    if size,
+    modification time,
+    or inode of a file have changed.
 
     Args:
         root: target directory
@@ -326,9 +385,16 @@ def load_to(
         cache_root: cache folder where databases are stored.
             If not set :meth:`audb.default_cache_root` is used.
             Only used to read the dependencies of the requested version
+        verify: if ``True``,
+            the md5 hashes of all files in ``root`` are calculated,
+            even if they were stored
+            for unchanged files
         num_workers: number of parallel jobs or 1 for sequential
             processing. If ``None`` will be set to the number of
-            processors on the machine multiplied by 5
+            processors on the machine multiplied by 5.
+            If ``'auto'``,
+            the number of parallel jobs is adapted while running,
+            based on the measured throughput
         verbose: show debug messages
 
     Returns:
@@ -339,6 +405,7 @@ def load_to(
         version = latest_version(name)
 
     db_root = audeer.path(root, follow_symlink=True)
+    clear_database_tmp_root(db_root)
     db_root_tmp = database_tmp_root(db_root)
 
     with shimmer(
@@ -355,6 +422,7 @@ def load_to(
             only_metadata,
             pickle_tables,
             cache_root,
+            verify,
             num_workers,
             verbose,
         )
@@ -369,6 +437,7 @@ def load_to(
             "probably there are some leftover files. "
             "This should not happen."
         )
+    remove_database_tmp_root(db_root_tmp)
 
     return db
 
@@ -381,7 +450,8 @@ def _load_to(
     only_metadata: bool,
     pickle_tables: bool,
     cache_root: str | None,
-    num_workers: int | None,
+    verify: bool,
+    num_workers: int | str | None,
     verbose: bool,
 ) -> audformat.Database:
     r"""Load database to directory without the progress animation.
@@ -400,20 +470,27 @@ def _load_to(
         version=version,
         cache_root=cache_root,
     )
+    # Archives completely downloaded
+    # by a previous, interrupted call
+    journal = Journal(os.path.join(db_root, define.DOWNLOAD_JOURNAL_FILE))
     if update:
         if only_metadata:
             files = deps.tables
         else:
             files = deps.attachments + deps.files
+        checksums = Checksums(db_root, verify=verify)
         for file in files:
             full_file = os.path.join(db_root, file)
+            if _in_journal(journal, deps, file):
+                continue
             if os.path.exists(full_file):
-                checksum = utils.md5(full_file)
+                checksum = checksums.md5(file)
                 if checksum != deps.checksum(file):
                     if os.path.isdir(full_file):
                         audeer.rmdir(full_file)
                     else:
                         os.remove(full_file)
+        checksums.save()
 
     # load database header without tables from backend
 
@@ -439,6 +516,7 @@ def _load_to(
             name,
             deps,
             backend_interface,
+            journal,
             num_workers,
             verbose,
         )
@@ -467,7 +545,7 @@ def _load_to(
     try:
         db = audformat.Database.load(
             db_root,
-            num_workers=num_workers,
+            num_workers=concurrency.resolve_num_workers(num_workers),
             verbose=verbose,
         )
     except (KeyboardInterrupt, Exception):  # pragma: no cover
@@ -490,6 +568,7 @@ def _load_to(
             name,
             deps,
             backend_interface,
+            journal,
             num_workers,
             verbose,
         )
@@ -514,7 +593,7 @@ def _load_to(
             db_root,
             storage_format=audformat.define.TableStorageFormat.PICKLE,
             update_other_formats=False,
-            num_workers=num_workers,
+            num_workers=concurrency.resolve_num_workers(num_workers),
             verbose=verbose,
         )
     else:
@@ -526,4 +605,7 @@ def _load_to(
             verbose=verbose,
         )
 
+    # all files are loaded
+    journal.clear()
+
     return db
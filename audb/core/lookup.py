@@ -0,0 +1,283 @@
+r"""Persistent cache of repository look ups and versions.
+
+The cache is stored
+in the user cache folder,
+see :func:`audb.default_cache_root`,
+independent of the ``cache_root`` argument
+of :func:`audb.load` and other functions.
+It describes repositories,
+not the content of databases,
+and depends on :attr:`audb.config.REPOSITORIES`,
+which is why it is kept per user,
+and never in a shared cache folder.
+Errors when writing or removing entries are ignored,
+e.g. if the user cache folder is read-only,
+in which case every look up is requested again.
+
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import time
+
+import audeer
+
+from audb.core import define
+from audb.core.cache import default_cache_root
+from audb.core.config import config
+from audb.core.repository import Repository
+
+
+def read_replicas(
+    name: str,
+    version: str,
+) -> list[Repository] | None:
+    r"""Read repositories containing database from persistent cache.
+
+    Entries are only used
+    if they were written
+    for the current :attr:`audb.config.REPOSITORIES`.
+    They expire after :attr:`audb.config.LOOKUP_TTL` seconds,
+    as a database might be copied
+    to further repositories.
+
+    Args:
+        name: name of database
+        version: version of database
+
+    Returns:
+        repositories containing the database,
+        or ``None`` if no valid entry was found
+
+    """
+    entry = _read(_replicas_file(name, version))
+    if entry is None or entry.get("repositories") != _repositories():
+        return None
+    if time.time() - entry["time"] >= config.LOOKUP_TTL:
+        return None
+    return [config.REPOSITORIES[index] for index in entry["replicas"]]
+
+
+def read_repository(
+    name: str,
+    version: str,
+) -> tuple[bool, Repository | None]:
+    r"""Read repository of database from persistent cache.
+
+    Entries are only used
+    if they were written
+    for the current :attr:`audb.config.REPOSITORIES`.
+    Entries stating that the database was not found
+    expire after :attr:`audb.config.LOOKUP_TTL` seconds.
+
+    Args:
+        name: name of database
+        version: version of database
+
+    Returns:
+        ``True`` and repository if an entry was found,
+        where repository is ``None``
+        if the database was not found in any repository,
+        and ``False`` and ``None`` otherwise
+
+    """
+    entry = _read(_repository_file(name, version))
+    if entry is None or entry.get("repositories") != _repositories():
+        return False, None
+    index = entry.get("repository")
+    if index is None:
+        if time.time() - entry.get("time", 0) < config.LOOKUP_TTL:
+            return True, None
+        return False, None
+    return True, config.REPOSITORIES[index]
+
+
+def read_versions(name: str) -> list[str] | None:
+    r"""Read versions of database from persistent cache.
+
+    Entries are only used
+    if they were written
+    for the current :attr:`audb.config.REPOSITORIES`.
+    They expire after :attr:`audb.config.VERSIONS_TTL` seconds,
+    unless :attr:`audb.config.OFFLINE` is ``True``.
+
+    Args:
+        name: name of database
+
+    Returns:
+        versions of database,
+        or ``None`` if no valid entry was found
+
+    """
+    entry = _read(_versions_file(name))
+    if entry is None or entry.get("repositories") != _repositories():
+        return None
+    if not config.OFFLINE and time.time() - entry["time"] >= config.VERSIONS_TTL:
+        return None
+    return entry["versions"]
+
+
+def remove_repository(
+    name: str,
+    version: str,
+):
+    r"""Remove repository of database from persistent cache.
+
+    Removes as well the repositories
+    containing the database.
+
+    Args:
+        name: name of database
+        version: version of database
+
+    """
+    for path in [_repository_file(name, version), _replicas_file(name, version)]:
+        _remove(path)
+
+
+def remove_versions(name: str):
+    r"""Remove versions of database from persistent cache.
+
+    Args:
+        name: name of database
+
+    """
+    _remove(_versions_file(name))
+
+
+def write_replicas(
+    name: str,
+    version: str,
+    repositories: list[Repository],
+):
+    r"""Write repositories containing database to persistent cache.
+
+    Args:
+        name: name of database
+        version: version of database
+        repositories: repositories containing the database
+
+    """
+    entry = {
+        "repositories": _repositories(),
+        "replicas": [config.REPOSITORIES.index(r) for r in repositories],
+        "time": time.time(),
+    }
+    _write(_replicas_file(name, version), entry)
+
+
+def write_repository(
+    name: str,
+    version: str,
+    repository: Repository | None,
+):
+    r"""Write repository of database to persistent cache.
+
+    Args:
+        name: name of database
+        version: version of database
+        repository: repository containing the database,
+            or ``None`` if it was not found in any repository
+
+    """
+    entry = {
+        "repositories": _repositories(),
+        "repository": (
+            None if repository is None else config.REPOSITORIES.index(repository)
+        ),
+        "time": time.time(),
+    }
+    _write(_repository_file(name, version), entry)
+
+
+def write_versions(
+    name: str,
+    versions: list[str],
+):
+    r"""Write versions of database to persistent cache.
+
+    Args:
+        name: name of database
+        versions: versions of database
+
+    """
+    entry = {
+        "repositories": _repositories(),
+        "versions": versions,
+        "time": time.time(),
+    }
+    _write(_versions_file(name), entry)
+
+
+def _read(path: str) -> dict | None:
+    r"""Read entry from file."""
+    try:
+        with open(path) as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        # Missing or damaged file
+        return None
+
+
+def _remove(path: str):
+    r"""Remove entry."""
+    try:
+        os.remove(path)
+    except OSError:
+        # Missing file or read-only cache
+        pass
+
+
+def _replicas_file(name: str, version: str) -> str:
+    r"""Path of cache entry of repositories containing database."""
+    return os.path.join(_root(), "replicas", name, f"{version}.json")
+
+
+def _repositories() -> list[list[str]]:
+    r"""Configured repositories as stored in cache entries."""
+    return [
+        [str(repository.name), str(repository.host), str(repository.backend)]
+        for repository in config.REPOSITORIES
+    ]
+
+
+def _repository_file(name: str, version: str) -> str:
+    r"""Path of cache entry of repository of database."""
+    return os.path.join(_root(), "repositories", name, f"{version}.json")
+
+
+def _root() -> str:
+    r"""Folder of persistent cache."""
+    return os.path.join(default_cache_root(), define.LOOKUP_CACHE_FOLDER)
+
+
+def _versions_file(name: str) -> str:
+    r"""Path of cache entry of versions of database."""
+    return os.path.join(_root(), "versions", f"{name}.json")
+
+
+def _write(path: str, entry: dict):
+    r"""Write entry to file.
+
+    The file is replaced in a single step,
+    so that other processes
+    never read a partially written entry.
+    Errors when writing the file are ignored,
+    e.g. if the cache folder is read-only.
+
+    """
+    try:
+        root = audeer.mkdir(os.path.dirname(path))
+        fd, tmp_path = tempfile.mkstemp(dir=root, suffix="~")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w") as fp:
+            json.dump(entry, fp)
+        os.replace(tmp_path, path)
+    except BaseException:  # pragma: no cover
+        os.remove(tmp_path)
+        raise
@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+import collections
+from collections.abc import Sequence
+import io
+import os
+import tempfile
+import threading
+import zipfile
+
+import numpy as np
+
+import audbackend
+import audeer
+import audiofile
+import audresample
+
+from audb.core import concurrency
+from audb.core import define
+from audb.core import utils
+from audb.core.api import latest_version
+from audb.core.config import config
+from audb.core.dependencies import Dependencies
+from audb.core.dependencies import download_dependencies
+from audb.core.dependencies import error_message_missing_object
+from audb.core.flavor import Flavor
+
+
+class _LRUCache:
+    r"""Thread-safe least recently used cache.
+
+    Args:
+        size: function returning size of an entry
+        maximum: function returning maximum size of all entries
+
+    """
+
+    def __init__(self, size, maximum):
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._size = size
+        self._maximum = maximum
+        self._total = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        r"""Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._total = 0
+
+    def get(self, key: object) -> object | None:
+        r"""Get entry and mark it as recently used."""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key: object, value: object):
+        r"""Add entry and remove least recently used entries."""
+        maximum = self._maximum()
+        size = self._size(value)
+        if size > maximum:
+            return
+        with self._lock:
+            if key in self._entries:
+                return
+            self._entries[key] = value
+            self._total += size
+            while self._total > maximum:
+                _, removed = self._entries.popitem(last=False)
+                self._total -= self._size(removed)
+
+
+# Archives read into memory,
+# limited by audb.config.MEMORY_CACHE_SIZE
+_archives = _LRUCache(len, lambda: config.MEMORY_CACHE_SIZE)
+
+# Dependency tables of recently read databases
+_dependencies = _LRUCache(lambda deps: 1, lambda: define.MEMORY_CACHE_DEPENDENCIES)
+
+
+def read_media(
+    name: str,
+    media: str | Sequence[str],
+    *,
+    version: str = None,
+    channels: int | Sequence[int] = None,
+    mixdown: bool = False,
+    sampling_rate: int = None,
+    num_workers: int | str | None = 1,
+) -> list[tuple[np.ndarray, int]]:
+    r"""Read media file(s) into memory.
+
+    In contrast to :func:`audb.load_media`,
+    no files are written to the cache,
+    except for the repository of the database,
+    see :attr:`audb.config.LOOKUP_TTL`.
+    The archives containing the media files
+    are downloaded into memory,
+    and the media files are decoded
+    directly from the archives.
+    Conversion to the requested flavor
+    is done in memory as well.
+
+    Recently used archives are kept in memory
+    up to a total size of
+    :attr:`audb.config.MEMORY_CACHE_SIZE` bytes,
+    and media files from them
+    are read without downloading them again.
+
+    Args:
+        name: name of database
+        media: read media files provided in the list
+        version: version of database
+        channels: channel selection, see :func:`audresample.remix`.
+            Note that media files with too few channels
+            will be first upsampled by repeating the existing channels
+        mixdown: apply mono mix-down
+        sampling_rate: sampling rate in Hz, one of
+            ``8000``, ``16000``, ``22050``, ``24000``, ``44100``, ``48000``
+        num_workers: number of parallel jobs or 1 for sequential
+            processing. If ``None`` will be set to the number of
+            processors on the machine multiplied by 5.
+            If ``'auto'``,
+            the number of parallel jobs is adapted while running,
+            based on the measured throughput
+
+    Returns:
+        signal and sampling rate of every media file.
+        The signal has the shape ``(channels, samples)``,
+        or ``(samples,)`` for a single channel
+
+    Raises:
+        ValueError: if a media file is requested
+            that is not part of the database
+            or that is not an audio file
+        ValueError: if a non-supported ``sampling_rate`` is requested
+
+    Examples:
+        >>> signal, sampling_rate = audb.read_media(
+        ...     "emodb",
+        ...     ["wav/03a01Fa.wav"],
+        ...     version="1.4.1",
+        ... )[0]
+        >>> sampling_rate
+        16000
+
+    """
+    media = audeer.to_list(media)
+    if len(media) == 0:
+        return []
+
+    if version is None:
+        version = latest_version(name)
+
+    flavor = Flavor(
+        channels=channels,
+        mixdown=mixdown,
+        sampling_rate=sampling_rate,
+    )
+
+    backend_interface = utils.lookup_backend(name, version)
+    deps = _get_dependencies(backend_interface, name, version)
+
+    missing = set(media) - set(deps.media)
+    if missing:
+        msg = error_message_missing_object("media", sorted(missing), name, version)
+        raise ValueError(msg)
+    not_audio = [file for file in media if deps.sampling_rate(file) == 0]
+    if not_audio:
+        raise ValueError(
+            "Only audio files can be read into memory, "
+            f"but the following media is not: {sorted(set(not_audio))}."
+        )
+
+    # Requested media files of every archive
+    archives = {}
+    for file in dict.fromkeys(media):
+        archive = (deps.archive(file), deps.version(file))
+        archives.setdefault(archive, []).append(file)
+
+    def job(archive: str, archive_version: str, files: list[str]) -> list[bytes]:
+        path = backend_interface.join("/", name, "media", archive + ".zip")
+        data = _archives.get((path, archive_version))
+        if data is None:
+            data = _get_archive(backend_interface, path, archive_version)
+            _archives.put((path, archive_version), data)
+        with zipfile.ZipFile(io.BytesIO(data)) as zf:
+            return [zf.read(file) for file in files]
+
+    data = concurrency.run_tasks(
+        job,
+        params=[
+            ([archive, archive_version, files], {})
+            for (archive, archive_version), files in archives.items()
+        ],
+        num_workers=num_workers,
+        task_description="Read media",
+    )
+    files = [file for files in archives.values() for file in files]
+    data = [buffer for buffers in data for buffer in buffers]
+
+    def read(buffer: bytes) -> tuple[np.ndarray, int]:
+        signal, sampling_rate = audiofile.read(io.BytesIO(buffer), always_2d=True)
+        if flavor.channels is not None or flavor.mixdown:
+            signal = audresample.remix(
+                signal,
+                flavor.channels,
+                flavor.mixdown,
+                upmix="repeat",
+            )
+        if flavor.sampling_rate is not None and sampling_rate != flavor.sampling_rate:
+            signal = audresample.resample(signal, sampling_rate, flavor.sampling_rate)
+            sampling_rate = flavor.sampling_rate
+        if signal.shape[0] == 1:
+            signal = signal[0]
+        return signal, sampling_rate
+
+    signals = concurrency.run_tasks(
+        read,
+        params=[([buffer], {}) for buffer in data],
+        num_workers=num_workers,
+        task_description="Decode media",
+    )
+    signals = dict(zip(files, signals))
+
+    # Return a copy for every repeated media file
+    results = []
+    returned = set()
+    for file in media:
+        signal, sampling_rate = signals[file]
+        if file in returned:
+            signal = signal.copy()
+        returned.add(file)
+        results.append((signal, sampling_rate))
+    return results
+
+
+def _get_archive(
+    backend_interface: type[audbackend.interface.Base],
+    path: str,
+    version: str,
+) -> bytes:
+    r"""Download archive into memory.
+
+    The archive is downloaded to a temporary folder
+    with :func:`audb.core.utils.get_file`
+    and read from there.
+
+    """
+    with tempfile.TemporaryDirectory() as tmp_root:
+        file = utils.get_file(
+            backend_interface,
+            path,
+            os.path.join(tmp_root, os.path.basename(path)),
+            version,
+        )
+        with open(file, "rb") as fp:
+            return fp.read()
+
+
+def _get_dependencies(
+    backend_interface: type[audbackend.interface.Base],
+    name: str,
+    version: str,
+) -> Dependencies:
+    r"""Dependency table kept in memory."""
+    deps = _dependencies.get((name, version))
+    if deps is None:
+        deps = download_dependencies(backend_interface, name, version, False)
+        _dependencies.put((name, version), deps)
+    return deps
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+import os
+import tempfile
+import threading
+
+import filelock
+
+import audbackend
+import audeer
+
+from audb.core import define
+from audb.core.repository import Repository
+
+
+class Mirror(audbackend.backend.FileSystem):
+    upstream: Repository | None = None
+    r"""Repository that is mirrored."""
+
+    def __init__(
+        self,
+        host: str,
+        repository: str,
+    ):
+        r"""Read-through mirror of a repository.
+
+        Files of published versions of databases
+        are downloaded from the :attr:`upstream` repository
+        on first request
+        and stored in the folder ``<host>/<repository>``,
+        e.g. on a network share.
+        Afterwards they are served from there.
+        If several threads or processes
+        request a missing file at the same time,
+        only one of them downloads it,
+        while the others wait for it.
+        Published versions never change,
+        but file listings,
+        versions of databases,
+        and the catalog of the repository
+        are always requested from the upstream repository,
+        as well as files that are published
+        or removed from the repository.
+        Files changed by :func:`audb.remove_media`
+        are removed from the mirror
+        that was used to change them,
+        but not from other mirrors.
+
+        The upstream repository is set
+        with :meth:`Mirror.of`,
+        which returns a backend class
+        that can be registered
+        with :meth:`audb.Repository.register`.
+
+        Args:
+            host: host directory of mirror
+            repository: repository name of mirror
+
+        Raises:
+            ValueError: if no upstream repository is set
+
+        Examples:
+            >>> upstream = audb.Repository("data-remote", "/remote", "file-system")
+            >>> audb.Repository.register("mirror", audb.Mirror.of(upstream))
+            >>> audb.Repository("data-local", "/data", "mirror")
+            Repository('data-local', '/data', 'mirror')
+
+        """
+        if self.upstream is None:
+            raise ValueError(
+                "No upstream repository is set, "
+                "use 'audb.Mirror.of()' to create a mirror backend."
+            )
+        super().__init__(host, repository)
+        self._upstream = self.upstream.create_backend_interface().backend
+        self._upstream_lock = threading.Lock()
+
+    @classmethod
+    def of(cls, upstream: Repository) -> type[Mirror]:
+        r"""Create mirror backend class of repository.
+
+        Args:
+            upstream: repository that is mirrored
+
+        Returns:
+            backend class
+
+        """
+        return type(cls.__name__, (cls,), {"upstream": upstream})
+
+    def _checksum(self, path: str) -> str:
+        r"""MD5 checksum of file."""
+        if self._is_mirrored(path):
+            return super()._checksum(path)
+        return self._remote()._checksum(path)
+
+    def _close(self):
+        r"""Close connection to upstream repository."""
+        self._upstream.close()
+
+    def _copy_file(
+        self,
+        src_path: str,
+        dst_path: str,
+        num_workers: int,
+        verbose: bool,
+    ):
+        r"""Copy file on upstream repository."""
+        self._remote()._copy_file(src_path, dst_path, num_workers, verbose)
+        self._forget(dst_path)
+
+    def _date(self, path: str) -> str:
+        r"""Last modification date of file on upstream repository."""
+        return self._remote()._date(path)
+
+    def _exists(self, path: str) -> bool:
+        r"""Check if file exists in mirror or upstream repository."""
+        return self._is_mirrored(path) or self._remote()._exists(path)
+
+    def _fetch(self, path: str):
+        r"""Download file from upstream repository if missing.
+
+        The file is downloaded to a temporary file
+        and renamed afterwards,
+        so that it is never visible partially.
+        Concurrent downloads of the same file
+        are avoided by a file lock,
+        which is released
+        when the downloading process dies.
+
+        """
+        if not self._is_cacheable(path) or self._is_mirrored(path):
+            return
+        local_path = self._expand(path)
+        root = audeer.mkdir(os.path.dirname(local_path))
+        # Lock files are stored in a hidden folder
+        # outside of the mirrored files.
+        # The lock is released by the operating system
+        # if the process is killed
+        lock_path = os.path.join(
+            self._root,
+            define.MIRROR_LOCK_FOLDER,
+            *path.strip(self.sep).split(self.sep),
+        )
+        audeer.mkdir(os.path.dirname(lock_path))
+        with filelock.FileLock(f"{lock_path}.lock", timeout=define.TIMEOUT):
+            # Another process might have downloaded it meanwhile
+            if os.path.exists(local_path):
+                return
+            fd, tmp_path = tempfile.mkstemp(dir=root, suffix="~")
+            os.close(fd)
+            try:
+                self._remote()._get_file(path, tmp_path, 1, False)
+                os.replace(tmp_path, local_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+
+    def _forget(self, path: str):
+        r"""Remove file from mirror."""
+        if self._is_mirrored(path):
+            os.remove(self._expand(path))
+
+    def _get_file(
+        self,
+        src_path: str,
+        dst_path: str,
+        num_workers: int,
+        verbose: bool,
+    ):
+        r"""Get file from mirror or upstream repository."""
+        if self._is_cacheable(src_path):
+            self._fetch(src_path)
+            super()._get_file(src_path, dst_path, num_workers, verbose)
+        else:
+            self._remote()._get_file(src_path, dst_path, num_workers, verbose)
+
+    def _get_file_stream(self, src_path: str) -> Iterator[bytes]:
+        r"""Get file from mirror or upstream repository as byte stream."""
+        if self._is_cacheable(src_path):
+            self._fetch(src_path)
+            return super()._get_file_stream(src_path)
+        return self._remote()._get_file_stream(src_path)
+
+    def _is_cacheable(self, path: str) -> bool:
+        r"""Check if file belongs to a published version.
+
+        Files are stored under
+        ``/<name>/.../<version>/<file>``
+        by :class:`audbackend.interface.Versioned`.
+
+        """
+        parts = path.split(self.sep)
+        return len(parts) > 2 and audeer.is_semantic_version(parts[-2])
+
+    def _is_mirrored(self, path: str) -> bool:
+        r"""Check if file is stored in mirror."""
+        return self._is_cacheable(path) and super()._exists(path)
+
+    def _ls(self, path: str) -> list[str]:
+        r"""List files on upstream repository."""
+        return self._remote()._ls(path)
+
+    def _ls_dirs(self, path: str) -> list[str]:
+        r"""List sub-folders on upstream repository."""
+        return self._remote()._ls_dirs(path)
+
+    def _move_file(
+        self,
+        src_path: str,
+        dst_path: str,
+        num_workers: int,
+        verbose: bool,
+    ):
+        r"""Move file on upstream repository."""
+        self._remote()._move_file(src_path, dst_path, num_workers, verbose)
+        self._forget(src_path)
+        self._forget(dst_path)
+
+    def _open(self):
+        r"""Create mirror folder.
+
+        The connection to the upstream repository
+        is only opened when it is needed.
+
+        """
+        audeer.mkdir(self._root)
+
+    def _owner(self, path: str) -> str:
+        r"""Owner of file on upstream repository."""
+        return self._remote()._owner(path)
+
+    def _put_file(
+        self,
+        src_path: str,
+        dst_path: str,
+        checksum: str,
+        verbose: bool,
+    ):
+        r"""Put file to upstream repository."""
+        self._remote()._put_file(src_path, dst_path, checksum, verbose)
+        self._forget(dst_path)
+
+    def _remote(self) -> audbackend.backend.Base:
+        r"""Upstream backend with opened connection."""
+        with self._upstream_lock:
+            if not self._upstream.opened:
+                try:
+                    self._upstream.open()
+                except audbackend.BackendError as ex:
+                    raise ex.exception
+        return self._upstream
+
+    def _remove_file(self, path: str):
+        r"""Remove file from upstream repository."""
+        self._remote()._remove_file(path)
+        self._forget(path)
+
+    def _size(self, path: str) -> int:
+        r"""Size of file in bytes."""
+        if self._is_mirrored(path):
+            return super()._size(path)
+        return self._remote()._size(path)
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Sequence
+import concurrent.futures
+import contextvars
+import threading
+
+import audformat
+
+from audb.core import define
+from audb.core.load import load
+
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    r"""Thread pool shared by all prefetch requests."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix="audb-prefetch",
+            )
+    return _executor
+
+
+class _CancelledError(Exception):
+    r"""Raised inside a running prefetch request to stop it."""
+
+
+class Prefetch:
+    def __init__(
+        self,
+        name: str,
+        **kwargs,
+    ):
+        r"""Handle of a database loaded in the background.
+
+        Returned by :func:`audb.prefetch`.
+        It behaves like a :class:`concurrent.futures.Future`
+        and provides in addition
+        the progress of the request.
+
+        Args:
+            name: name of database
+            **kwargs: keyword arguments passed on to :func:`audb.load`
+
+        """
+        self.name = name
+        r"""Name of database."""
+        self._kwargs = kwargs
+        self._lock = threading.Lock()
+        self._cancel_requested = False
+        self._num_files = None
+        self._num_loaded = 0
+        # Run in context of caller,
+        # e.g. to use its audb.Session
+        context = contextvars.copy_context()
+        self._future = _get_executor().submit(context.run, self._run)
+
+    @property
+    def progress(self) -> float:
+        r"""Fraction of requested media files stored in cache.
+
+        Is ``0.0`` as long as the requested media files are not known,
+        and ``1.0`` when the request is finished successfully.
+
+        """
+        with self._lock:
+            if self._future.done() and not self._future.exception():
+                return 1.0
+            if not self._num_files:
+                return 0.0
+            return min(1.0, self._num_loaded / self._num_files)
+
+    def add_done_callback(self, fn: Callable[[Prefetch], None]):
+        r"""Attach function called when request finishes.
+
+        Args:
+            fn: function called with the handle as argument
+
+        """
+        self._future.add_done_callback(lambda _: fn(self))
+
+    def cancel(self) -> bool:
+        r"""Cancel request.
+
+        A request that has not started yet
+        is cancelled immediately.
+        A running request stops
+        when the next media file is stored in cache.
+        Media files already stored in cache
+        are kept
+        and reused by later requests.
+
+        Returns:
+            ``False`` if request is already finished
+
+        """
+        if self._future.cancel():
+            return True
+        with self._lock:
+            if self._future.done():
+                return False
+            self._cancel_requested = True
+        return True
+
+    def cancelled(self) -> bool:
+        r"""Check if request was cancelled.
+
+        Returns:
+            ``True`` if request was cancelled
+
+        """
+        if self._future.cancelled():
+            return True
+        return self._future.done() and isinstance(
+            self._future.exception(),
+            concurrent.futures.CancelledError,
+        )
+
+    def done(self) -> bool:
+        r"""Check if request is finished or cancelled.
+
+        Returns:
+            ``True`` if request is finished or cancelled
+
+        """
+        return self._future.done()
+
+    def exception(self, timeout: float = None) -> BaseException | None:
+        r"""Exception raised by request.
+
+        Args:
+            timeout: maximum time in seconds to wait for the request
+
+        Returns:
+            exception or ``None`` if the request finished successfully
+
+        Raises:
+            concurrent.futures.CancelledError: if request was cancelled
+            TimeoutError: if request does not finish in time
+
+        """
+        if self.cancelled():
+            raise concurrent.futures.CancelledError()
+        return self._future.exception(timeout)
+
+    def result(self, timeout: float = None) -> audformat.Database | None:
+        r"""Wait for request and return database.
+
+        Args:
+            timeout: maximum time in seconds to wait for the request
+
+        Returns:
+            database object,
+            or ``None`` if the lock of the database cache folder
+            could not be acquired,
+            see :func:`audb.load`
+
+        Raises:
+            concurrent.futures.CancelledError: if request was cancelled
+            TimeoutError: if request does not finish in time
+
+        """
+        return self._future.result(timeout)
+
+    def _media_callback(self, path: str):
+        with self._lock:
+            if self._cancel_requested:
+                raise _CancelledError()
+            self._num_loaded += 1
+
+    def _run(self) -> audformat.Database | None:
+        # Find requested media files
+        # to be able to report the progress
+        kwargs = self._kwargs.copy()
+        db = load(self.name, only_metadata=True, **kwargs)
+        if db is None:
+            return None
+        with self._lock:
+            self._num_files = len(db.files)
+        try:
+            return load(self.name, media_callback=self._media_callback, **kwargs)
+        except _CancelledError:
+            raise concurrent.futures.CancelledError()
+
+
+def prefetch(
+    name: str,
+    *,
+    version: str = None,
+    bit_depth: int = None,
+    channels: int | Sequence[int] = None,
+    format: str = None,
+    mixdown: bool = False,
+    sampling_rate: int = None,
+    attachments: str | Sequence[str] = None,
+    tables: str | Sequence[str] = None,
+    media: str | Sequence[str] = None,
+    cache_root: str = None,
+    num_workers: int | str | None = 1,
+    timeout: float = define.TIMEOUT,
+) -> Prefetch:
+    r"""Load database in the background.
+
+    Starts :func:`audb.load` in a background thread
+    and returns immediately.
+    The returned handle provides the progress of the request,
+    allows to cancel it,
+    and returns the database
+    with :meth:`audb.Prefetch.result`.
+    As :func:`audb.load` is used,
+    the cache folder of the database is locked
+    while files are loaded,
+    and a later call to :func:`audb.load`
+    with the same arguments
+    waits for the prefetch request to finish
+    and loads the database from cache.
+
+    Args:
+        name: name of database
+        version: version string, latest if ``None``
+        bit_depth: bit depth, one of ``16``, ``24``, ``32``
+        channels: channel selection, see :func:`audresample.remix`
+        format: file format, one of ``'flac'``, ``'wav'``
+        mixdown: apply mono mix-down
+        sampling_rate: sampling rate in Hz, one of
+            ``8000``, ``16000``, ``22050``, ``24000``, ``44100``, ``48000``
+        attachments: load only attachment files
+            for the attachments
+            matching the regular expression
+            or provided in the list
+        tables: load only tables and misc tables
+            matching the regular expression
+            or provided in the list
+        media: load only media files
+            matching the regular expression
+            or provided in the list
+        cache_root: cache folder where databases are stored.
+            If not set :meth:`audb.default_cache_root` is used
+        num_workers: number of parallel jobs or 1 for sequential
+            processing. If ``None`` will be set to the number of
+            processors on the machine multiplied by 5.
+            If ``'auto'``,
+            the number of parallel jobs is adapted while running,
+            based on the measured throughput
+        timeout: maximum time in seconds
+            before giving up acquiring a lock to the database cache folder.
+            :meth:`audb.Prefetch.result` returns ``None`` in this case
+
+    Returns:
+        handle of request
+
+    Examples:
+        >>> request = audb.prefetch(
+        ...     "emodb",
+        ...     version="1.4.1",
+        ...     media=["wav/03a01Fa.wav"],
+        ... )
+        >>> db = request.result()
+        >>> request.progress
+        1.0
+
+    """
+    return Prefetch(
+        name,
+        version=version,
+        bit_depth=bit_depth,
+        channels=channels,
+        format=format,
+        mixdown=mixdown,
+        sampling_rate=sampling_rate,
+        attachments=attachments,
+        tables=tables,
+        media=media,
+        cache_root=cache_root,
+        num_workers=num_workers,
+        timeout=timeout,
+        verbose=False,
+    )
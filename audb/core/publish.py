@@ -1,30 +1,70 @@
 from __future__ import annotations
 
 import collections
+from collections.abc import Collection
 from collections.abc import Mapping
+from collections.abc import Sequence
+import hashlib
+import math
 import os
+import posixpath
 import re
 import shutil
 import tempfile
+import threading
+import warnings
+
+import numpy as np
+import pandas as pd
+import soundfile
 
 import audbackend
 import audeer
 import audformat
 import audiofile
 
+from audb.core import catalog
+from audb.core import concurrency
 from audb.core import define
+from audb.core import lookup
 from audb.core import utils
 from audb.core.api import dependencies
 from audb.core.api import versions as api_versions
+from audb.core.checksums import Checksums
+from audb.core.config import config
 from audb.core.dependencies import Dependencies
 from audb.core.dependencies import upload_dependencies
+from audb.core.journal import Journal
 from audb.core.repository import Repository
 from audb.core.shimmer import shimmer
 
 
+def _archive_checksum(
+    files: Sequence[str],
+    checksums: Mapping[str, str],
+) -> str:
+    r"""Checksum of archive content.
+
+    Combines names and checksums
+    of the files stored in an archive,
+    so that it changes
+    if any of them changes.
+
+    Args:
+        files: files stored in archive
+        checksums: checksums of files
+
+    Returns:
+        MD5 checksum
+
+    """
+    content = "\n".join(f"{file}\t{checksums[file]}" for file in sorted(files))
+    return hashlib.md5(content.encode()).hexdigest()
+
+
 def _check_for_duplicates(
     db: audformat.Database,
-    num_workers: int,
+    num_workers: int | str | None,
     verbose: bool,
 ):
     r"""Ensures tables do not contain duplicated index entries."""
@@ -33,7 +73,7 @@ def _check_for_duplicates(
         audformat.assert_no_duplicates(db[table_id]._df)
 
     table_ids = list(db)
-    audeer.run_tasks(
+    concurrency.run_tasks(
         job,
         params=[([table_id], {}) for table_id in table_ids],
         num_workers=num_workers,
@@ -75,14 +115,11 @@ def _check_for_missing_media(
         raise RuntimeError(error_msg)
 
 
-def _find_attachments(
+def _check_attachments(
     db: audformat.Database,
-    db_root: str,
-    version: str,
     deps: Dependencies,
-    verbose: bool,
-) -> list[str]:
-    r"""Find altered, new or removed attachments and update 'deps'."""
+):
+    r"""Check attachments and drop removed ones from 'deps'."""
     # drop removed attachments from dependency table
     removed_attachments = [
         deps._df.index[deps._df.archive == attachment_id][0]
@@ -131,184 +168,6 @@ def _find_attachments(
                     "points to an empty folder."
                 )
 
-    # add dependencies to new or updated attachments
-    attachment_ids = []
-    for attachment_id in audeer.progress_bar(
-        list(db.attachments),
-        desc="Scan attachments",
-        disable=not verbose,
-    ):
-        # use one archive per attachment ID
-        path = db.attachments[attachment_id].path
-        if not os.path.exists(audeer.path(db_root, path)):
-            if path not in deps:
-                # Raise FileNotFoundError
-                #
-                # Attachment is not in deps,
-                # but its path does not exist on disk either.
-                # We call its `files` property
-                # which raises a FileNotFoundError in this case
-                db.attachments[attachment_id].files
-        else:
-            checksum = utils.md5(audeer.path(db_root, path))
-            if path not in deps or checksum != deps.checksum(path):
-                deps._add_attachment(
-                    file=path,
-                    version=version,
-                    archive=attachment_id,
-                    checksum=checksum,
-                )
-                attachment_ids.append(attachment_id)
-
-    return list(attachment_ids)
-
-
-def _find_media(
-    db: audformat.Database,
-    db_root: str,
-    db_root_files: set[str],
-    version: str,
-    deps: Dependencies,
-    archives: Mapping[str, str],
-    num_workers: int,
-    verbose: bool,
-) -> set[str]:
-    """Find archives with new, altered or removed media and update 'deps'.
-
-    The function alters the dependency table entries of ``deps`` in place
-    by
-
-    * adding entries for new media files
-    * removing entries for removed media files
-    * updating entries for altered media files
-
-    It further collects all media archives,
-    that are affected by those media files.
-
-    Args:
-        db: database
-        db_root: path to root of database
-        db_root_files: all files in root of database
-        version: version of database
-        deps: database dependency table
-        archives: mapping of media files to archives
-        num_workers: number of workers
-        verbose: if ``True`` show progress bar
-
-    Returns:
-        media archives to be updated
-
-    Raises:
-        RuntimeError: if a newly added media file
-            has any uppercase letter in its file extension
-
-    """
-    # Media archives to update
-    media_archives = set()
-
-    # Media files in database
-    db_media = set(db.files)
-
-    removed_media = set(deps.media) - db_media
-    # Select media archives to update for removed media
-    for file in removed_media:
-        media_archives.add(deps.archive(file))
-    # Remove rows in dependency table matching removed media
-    deps._drop(removed_media)
-
-    # Limit to relevant media
-    db_media_in_root = db_media.intersection(db_root_files)
-
-    # Prepare lists to store media updates
-    add_media = []
-    update_media = []
-
-    def process_new_media(file: str):
-        """Collect dependency values for new media files in 'add_media'."""
-        ext = audeer.file_extension(file)
-        if ext.lower() != ext:
-            raise RuntimeError(
-                "The file extension of a media file must be lowercase, "
-                f"but '{file}' includes at least one uppercase letter."
-            )
-        checksum = audeer.md5(os.path.join(db_root, file))
-        archive = archives.get(file) or audeer.uid(from_string=file.replace("\\", "/"))
-        values = _media_values(db_root, file, version, archive, checksum)
-        add_media.append(values)
-
-    def process_existing_media(file: str):
-        """Collect dependency values for updated media file in 'update_media'."""
-        checksum = audeer.md5(os.path.join(db_root, file))
-        if checksum != deps.checksum(file):
-            archive = deps.archive(file)
-            values = _media_values(db_root, file, version, archive, checksum)
-            update_media.append(values)
-
-    def job(file: str) -> None:
-        if file not in deps:
-            process_new_media(file)
-        elif not deps.removed(file):
-            process_existing_media(file)
-
-    audeer.run_tasks(
-        job,
-        params=[([file], {}) for file in db_media_in_root],
-        num_workers=num_workers,
-        progress_bar=verbose,
-        task_description="Scan media",
-        maximum_refresh_time=define.MAXIMUM_REFRESH_TIME,
-    )
-
-    # Add updated and new media to dependencies with sorting for consistency
-    if update_media:
-        deps._update_media(sorted(update_media, key=lambda x: x[0]))
-    if add_media:
-        deps._add_media(sorted(add_media, key=lambda x: x[0]))
-
-    # Update media archives for new or altered media files
-    for file in deps.media:
-        if not deps.removed(file) and deps.version(file) == version:
-            media_archives.add(deps.archive(file))
-
-    return media_archives
-
-
-def _find_tables(
-    db: audformat.Database,
-    db_root: str,
-    version: str,
-    deps: Dependencies,
-    verbose: bool,
-) -> list[str]:
-    r"""Find altered, new or removed tables and update 'deps'."""
-    table_ids = list(db)
-    # PARQUET is default table,
-    # CSV file is ignored
-    # if it exists as well
-    table_files = [
-        f"db.{table}.parquet"
-        if os.path.exists(os.path.join(db_root, f"db.{table}.parquet"))
-        else f"db.{table}.csv"
-        for table in table_ids
-    ]
-
-    # release dependencies to removed tables
-    deps._drop(set(deps.tables) - set(table_files))
-
-    # new database tables
-    tables = []
-    for table, file in audeer.progress_bar(
-        zip(table_ids, table_files),
-        desc="Scan tables",
-        disable=not verbose,
-    ):
-        checksum = utils.md5(os.path.join(db_root, file))
-        if file not in deps or checksum != deps.checksum(file):
-            deps._add_meta(file, version, checksum)
-            tables.append(table)
-
-    return tables
-
 
 def _get_root_files(
     db_root: str,
@@ -326,6 +185,29 @@ def _get_root_files(
     return set(db_root_files)
 
 
+def _isin(
+    values: pd.Index | pd.Series,
+    other: Collection[str],
+) -> np.ndarray:
+    r"""Check which values are contained in other.
+
+    Same as :meth:`pandas.Index.isin`,
+    but uses a hash table of ``other``,
+    which is much faster for strings stored by pyarrow.
+
+    Args:
+        values: values to check
+        other: unique values
+
+    Returns:
+        boolean mask
+
+    """
+    if not isinstance(other, pd.Index):
+        other = pd.Index(list(other), dtype="object")
+    return other.get_indexer(values) >= 0
+
+
 def _media_values(
     root: str,
     file: str,
@@ -367,12 +249,28 @@ def _media_values(
     # Inspect media file to get audio/video metadata
     try:
         path = os.path.join(root, file)
-        bit_depth = audiofile.bit_depth(path)
-        if bit_depth is None:  # pragma: nocover (non SND files)
+        info = None
+        if format in define.HEADER_FORMATS:
+            # Parse header only once,
+            # instead of once per property
+            try:
+                info = soundfile.info(path)
+            except soundfile.LibsndfileError:
+                # libsndfile might not support the format,
+                # e.g. MP3 before libsndfile 1.1.0,
+                # in which case audiofile falls back to sox or mediainfo
+                pass
+        if info is not None:
+            bit_depth = define.SUBTYPE_BIT_DEPTHS.get(info.subtype, 0)
+            channels = info.channels
+            duration = info.duration
+            sampling_rate = info.samplerate
+        else:
+            # Bit depth is only defined for WAV and FLAC files
             bit_depth = 0
-        channels = audiofile.channels(path)
-        duration = audiofile.duration(path, sloppy=True)
-        sampling_rate = audiofile.sampling_rate(path)
+            channels = audiofile.channels(path)
+            duration = audiofile.duration(path, sloppy=True)
+            sampling_rate = audiofile.sampling_rate(path)
     except FileNotFoundError:  # pragma: nocover
         # If sox or mediafile are not installed
         # we get a FileNotFoundError error
@@ -403,84 +301,262 @@ def _media_values(
     )
 
 
-def _put_attachments(
-    attachments: list[str],
+def _pack_archives(
     db_root: str,
+    files: Sequence[str],
+) -> dict[str, str]:
+    r"""Assign media files to archives of similar size.
+
+    Files are grouped by folder.
+    Every folder is split into the smallest number of archives
+    that do not exceed :attr:`audb.config.ARCHIVE_SIZE` on average,
+    and its files are distributed
+    in order of their names,
+    so that every archive holds a similar number of bytes.
+    An archive is named after its first file,
+    as if the file was stored alone.
+
+    Args:
+        db_root: root directory of database
+        files: media files
+
+    Returns:
+        mapping of media files to archives
+
+    """
+    folders = collections.defaultdict(list)
+    for file in sorted(files):
+        folders[posixpath.dirname(file)].append(file)
+
+    mapping = {}
+    for folder_files in folders.values():
+        sizes = [os.path.getsize(os.path.join(db_root, file)) for file in folder_files]
+        total = sum(sizes)
+        num_archives = max(1, math.ceil(total / config.ARCHIVE_SIZE))
+        target = max(1, total / num_archives)
+        groups = collections.defaultdict(list)
+        offset = 0
+        for file, size in zip(folder_files, sizes):
+            # Assign file to archive
+            # containing the center of the file
+            index = min(num_archives - 1, int((offset + size / 2) // target))
+            groups[index].append(file)
+            offset += size
+        for group in groups.values():
+            archive = audeer.uid(from_string=group[0])
+            for file in group:
+                mapping[file] = archive
+    return mapping
+
+
+def _publish_attachments(
     db: audformat.Database,
+    db_root: str,
     version: str,
+    deps: Dependencies,
+    checksums: Checksums,
+    policy: Mapping[str, int],
+    journal: Journal,
     backend_interface: type[audbackend.interface.Base],
-    num_workers: int | None,
+    num_workers: int | str | None,
     verbose: bool,
 ):
-    def job(attachment_id: str):
+    r"""Upload new or altered attachments and update 'deps'.
+
+    Every attachment is uploaded
+    directly after its checksum is calculated,
+    while the checksums of the other attachments
+    are calculated in parallel.
+
+    """
+
+    def job(attachment_id: str) -> str | None:
+        # use one archive per attachment ID
+        path = db.attachments[attachment_id].path
+        if not os.path.exists(audeer.path(db_root, path)):
+            if path not in deps:
+                # Raise FileNotFoundError
+                #
+                # Attachment is not in deps,
+                # but its path does not exist on disk either.
+                # We call its `files` property
+                # which raises a FileNotFoundError in this case
+                db.attachments[attachment_id].files
+            return None
+        checksum = checksums.md5(path)
+        if path in deps and checksum == deps.checksum(path):
+            return None
         archive_file = backend_interface.join(
             "/", db.name, "attachment", attachment_id + ".zip"
         )
-        files = db.attachments[attachment_id].files
-        backend_interface.put_archive(db_root, archive_file, version, files=files)
+        entry = ("attachment", attachment_id, version, checksum)
+        if not _uploaded(journal, entry, backend_interface, archive_file):
+            files = db.attachments[attachment_id].files
+            utils.put_archive(
+                backend_interface,
+                db_root,
+                archive_file,
+                version,
+                files=files,
+                policy=policy,
+            )
+            journal.add(*entry)
+        return checksum
 
-    audeer.run_tasks(
+    attachment_ids = list(db.attachments)
+    results = concurrency.run_tasks(
         job,
-        params=[([attachment_id], {}) for attachment_id in attachments],
+        params=[([attachment_id], {}) for attachment_id in attachment_ids],
         num_workers=num_workers,
         progress_bar=verbose,
         task_description="Put attachments",
         maximum_refresh_time=define.MAXIMUM_REFRESH_TIME,
     )
+    for attachment_id, checksum in zip(attachment_ids, results):
+        if checksum is not None:
+            deps._add_attachment(
+                file=db.attachments[attachment_id].path,
+                version=version,
+                archive=attachment_id,
+                checksum=checksum,
+            )
 
 
-def _put_media(
-    media_archives: set[str],
+def _publish_media(
+    db: audformat.Database,
     db_root: str,
-    db_name: str,
+    db_root_files: set[str],
     version: str,
     previous_version: str | None,
     deps: Dependencies,
+    archives: Mapping[str, str] | str,
+    checksums: Checksums,
+    policy: Mapping[str, int],
+    journal: Journal,
     backend_interface: type[audbackend.interface.Base],
-    num_workers: int | None,
+    num_workers: int | str | None,
     verbose: bool,
 ):
     r"""Upload archives with new, altered, or removed media files.
 
-    It uploads all media files
-    and adjusts the version in ``deps`` in place.
+    Scanning media files
+    and uploading archives
+    run in separate stages
+    with ``num_workers`` jobs each.
+    An archive is uploaded
+    as soon as all its media files are scanned,
+    if it contains new or altered media files,
+    or media files were removed from it.
+    Archives waiting for upload are limited,
+    so that scanning pauses
+    if uploading cannot keep up.
+
+    The function alters the dependency table entries of ``deps`` in place
+    by
+
+    * adding entries for new media files
+    * removing entries for removed media files
+    * updating entries for altered media files
+    * adjusting the version of all media files in uploaded archives
 
     Args:
-        media_archives: media archives to upload
-        db_root: root directory of database
-        db_name: name of database
+        db: database
+        db_root: path to root of database
+        db_root_files: all files in root of database
         version: version of database
-        previous_version: previous version of database, if any.
-        deps: dependency table of database
+        previous_version: previous version of database, if any
+        deps: database dependency table
+        archives: mapping of media files to archives
+            or ``'auto'``
+        checksums: cache of checksums of files
+        policy: compression methods per format
+        journal: journal of uploaded files
         backend_interface: backend interface for file operations
-        num_workers: number of parallel workers for processing
-        verbose: whether to display progress information
+        num_workers: number of workers per stage
+        verbose: if ``True`` show progress bar
 
     Raises:
+        RuntimeError: if a newly added media file
+            has any uppercase letter in its file extension
         RuntimeError: if downloading missing media files fails
 
     """
-    if not media_archives:
-        return
+    # Media files in database
+    db_media = pd.Index(db.files)
+    df = deps._df
+    media = df[df["type"].to_numpy() == define.DEPENDENCY_TYPE["media"]]
 
-    # Create a mapping from archives to media files
-    #
-    # `defaultdict(list)` eliminates the need for dictionary initialization check
-    map_archive_to_files = collections.defaultdict(list)
-    for media_file in [f for f in deps.media if not deps.removed(f)]:
-        archive = deps.archive(media_file)
-        map_archive_to_files[archive].append(media_file)
+    # Select media archives to update for removed media
+    is_removed = ~_isin(media.index, db_media)
+    media_archives = set(media["archive"][is_removed].unique())
+    # Remove rows in dependency table matching removed media
+    deps._drop(media.index[is_removed])
+    media = media[~is_removed & (media["removed"].to_numpy() == 0)]
 
-    # Collect media files from uploaded archives
-    uploaded_media = []
+    # Limit to relevant media
+    db_media = db_media[_isin(db_media, db_root_files)]
+    existing_media = media[_isin(media.index, db_media)]
+    new_media = sorted(db_media.difference(deps._df.index))
+    for file in new_media:
+        ext = audeer.file_extension(file)
+        if ext.lower() != ext:
+            raise RuntimeError(
+                "The file extension of a media file must be lowercase, "
+                f"but '{file}' includes at least one uppercase letter."
+            )
+
+    # Assign media files to archives,
+    # before scanning them
+    if archives == "auto":
+        archives = _pack_archives(db_root, new_media)
+    scan_media = dict(zip(existing_media.index, existing_media["archive"]))
+    new_archives = collections.defaultdict(list)
+    for file in new_media:
+        archive = archives.get(file) or audeer.uid(from_string=file.replace("\\", "/"))
+        new_archives[archive].append(file)
+        scan_media[file] = archive
+    existing_checksums = dict(
+        zip(existing_media.index, existing_media["checksum"]),
+    )
+
+    # Number of media files to scan per archive
+    pending = collections.Counter(scan_media.values())
+    # Archives uploaded without scanning
+    ready_archives = sorted(media_archives - set(pending))
+
+    # Media files of archives that might be uploaded
+    candidates = media[_isin(media["archive"], media_archives | set(pending))]
+    map_archive_to_files = candidates.index.groupby(candidates["archive"])
+    # Checksums of media files of those archives,
+    # updated while scanning
+    member_checksums = dict(zip(candidates.index, candidates["checksum"]))
+
+    def archive_files(archive: str) -> list[str]:
+        """Media files stored in archive."""
+        existing_files = list(map_archive_to_files.get(archive, []))
+        return existing_files + new_archives.get(archive, [])
+
+    # Prepare lists to store media updates
+    add_media = []
+    update_media = []
+    uploaded_archives = []
+    lock = threading.Lock()
 
     def upload_archive(archive: str):
         """Upload archive to backend."""
         # Media files stored in requested archive
-        files = map_archive_to_files[archive]
-        uploaded_media.extend(files)
+        files = archive_files(archive)
 
-        archive_file = backend_interface.join("/", db_name, "media", f"{archive}.zip")
+        archive_file = backend_interface.join("/", db.name, "media", f"{archive}.zip")
+
+        # Archive uploaded by an interrupted publication
+        checksum = _archive_checksum(files, member_checksums)
+        entry = ("media", archive, version, checksum)
+        if _uploaded(journal, entry, backend_interface, archive_file):
+            with lock:
+                uploaded_archives.append(archive)
+                pbar.update()
+            return
 
         if previous_version:
             # An archive might include several media files.
@@ -530,54 +606,174 @@ def _put_media(
                             f"for archive {archive_file}: {e}"
                         )
 
-        backend_interface.put_archive(
+        utils.put_archive(
+            backend_interface,
             db_root,
             archive_file,
             version,
             files=files,
+            policy=policy,
         )
-
-    audeer.run_tasks(
-        upload_archive,
-        params=[([archive], {}) for archive in media_archives],
-        num_workers=num_workers,
-        progress_bar=verbose,
-        task_description="Put media",
+        journal.add(*entry)
+        with lock:
+            uploaded_archives.append(archive)
+            pbar.update()
+
+    def scan_file(file: str):
+        """Collect dependency values for new or altered media file."""
+        archive = scan_media[file]
+        checksum = checksums.md5(file, func=audeer.md5)
+        values = None
+        if checksum != existing_checksums.get(file):
+            values = _media_values(db_root, file, version, archive, checksum)
+        with lock:
+            member_checksums[file] = checksum
+            if values is not None:
+                if file in existing_checksums:
+                    update_media.append(values)
+                else:
+                    add_media.append(values)
+                media_archives.add(archive)
+            pending[archive] -= 1
+            ready = pending[archive] == 0 and archive in media_archives
+            pbar.update()
+            if pending[archive] == 0 and not ready:
+                # Unchanged archive
+                pbar.update()
+        if ready:
+            uploads.submit(upload_archive, archive)
+
+    with audeer.progress_bar(
+        total=len(scan_media) + len(pending) + len(ready_archives),
+        desc="Publish media",
         maximum_refresh_time=define.MAXIMUM_REFRESH_TIME,
-    )
+        disable=not verbose,
+    ) as pbar:
+        with concurrency.Stage(num_workers, task_description="Put media") as uploads:
+            with concurrency.Stage(
+                num_workers,
+                task_description="Scan media",
+            ) as scans:
+                for archive in ready_archives:
+                    uploads.submit(upload_archive, archive)
+                for file in scan_media:
+                    scans.submit(scan_file, file)
+                scans.join()
+            uploads.join()
+
+    # Add updated and new media to dependencies with sorting for consistency
+    if update_media:
+        deps._update_media(sorted(update_media, key=lambda x: x[0]))
+    if add_media:
+        deps._add_media(sorted(add_media, key=lambda x: x[0]))
     # Adjust the version in the dependency table for all uploaded media files
+    uploaded_media = [
+        file for archive in uploaded_archives for file in archive_files(archive)
+    ]
     deps._update_media_version(uploaded_media, version)
 
 
-def _put_tables(
-    tables: list[str],
+def _publish_tables(
+    db: audformat.Database,
     db_root: str,
-    db_name: str,
     version: str,
+    deps: Dependencies,
+    checksums: Checksums,
+    policy: Mapping[str, int],
+    journal: Journal,
     backend_interface: type[audbackend.interface.Base],
-    num_workers: int | None,
+    num_workers: int | str | None,
     verbose: bool,
 ):
-    def job(table: str):
-        if os.path.exists(os.path.join(db_root, f"db.{table}.parquet")):
-            file = os.path.join(db_root, f"db.{table}.parquet")
+    r"""Upload new or altered tables and update 'deps'.
+
+    Every table is uploaded
+    directly after its checksum is calculated,
+    while the checksums of the other tables
+    are calculated in parallel.
+
+    """
+    table_ids = list(db)
+    # PARQUET is default table,
+    # CSV file is ignored
+    # if it exists as well
+    table_files = [
+        f"db.{table}.parquet"
+        if os.path.exists(os.path.join(db_root, f"db.{table}.parquet"))
+        else f"db.{table}.csv"
+        for table in table_ids
+    ]
+
+    # release dependencies to removed tables
+    deps._drop(set(deps.tables) - set(table_files))
+
+    def job(table: str, file: str) -> str | None:
+        checksum = checksums.md5(file)
+        if file in deps and checksum == deps.checksum(file):
+            return None
+        if file.endswith(".parquet"):
             remote_file = backend_interface.join(
-                "/", db_name, "meta", f"{table}.parquet"
+                "/", db.name, "meta", f"{table}.parquet"
             )
-            backend_interface.put_file(file, remote_file, version)
         else:
-            file = f"db.{table}.csv"
-            archive_file = backend_interface.join("/", db_name, "meta", f"{table}.zip")
-            backend_interface.put_archive(db_root, archive_file, version, files=file)
+            remote_file = backend_interface.join("/", db.name, "meta", f"{table}.zip")
+        entry = ("table", table, version, checksum)
+        if _uploaded(journal, entry, backend_interface, remote_file):
+            return checksum
+        if file.endswith(".parquet"):
+            backend_interface.put_file(
+                os.path.join(db_root, file),
+                remote_file,
+                version,
+            )
+        else:
+            utils.put_archive(
+                backend_interface,
+                db_root,
+                remote_file,
+                version,
+                files=file,
+                policy=policy,
+            )
+        journal.add(*entry)
+        return checksum
 
-    audeer.run_tasks(
+    results = concurrency.run_tasks(
         job,
-        params=[([table], {}) for table in tables],
+        params=[([table, file], {}) for table, file in zip(table_ids, table_files)],
         num_workers=num_workers,
         progress_bar=verbose,
         task_description="Put tables",
         maximum_refresh_time=define.MAXIMUM_REFRESH_TIME,
     )
+    for file, checksum in zip(table_files, results):
+        if checksum is not None:
+            deps._add_meta(file, version, checksum)
+
+
+def _uploaded(
+    journal: Journal,
+    entry: tuple[str, ...],
+    backend_interface: type[audbackend.interface.Base],
+    path: str,
+) -> bool:
+    r"""Check if file was uploaded by an interrupted publication.
+
+    Besides the entry in the journal,
+    it is verified that the file still exists on the backend.
+
+    Args:
+        journal: journal of uploaded files
+        entry: entry of file in journal
+        backend_interface: backend interface for file operations
+        path: path of file on backend
+
+    Returns:
+        ``True`` if file was uploaded
+
+    """
+    version = entry[2]
+    return entry in journal and backend_interface.exists(path, version)
 
 
 def publish(
@@ -585,10 +781,12 @@ def publish(
     version: str,
     repository: Repository,
     *,
-    archives: Mapping[str, str] = None,
+    archives: Mapping[str, str] | str = None,
+    compression: str | Mapping[str, str] = None,
     previous_version: str | None = "latest",
     cache_root: str = None,
-    num_workers: int | None = 1,
+    verify: bool = False,
+    num_workers: int | str | None = 1,
     verbose: bool = True,
 ) -> Dependencies:
     r"""Publish database.
@@ -638,9 +836,27 @@ def publish(
     but you might need overwrite permissions
     in addition to write permissions
     on the backend.
+    Attachments, tables, and media archives
+    that have been uploaded
+    are recorded in the file ``.upload`` in ``db_root``
+    and are not uploaded again,
+    as long as they have not changed
+    and still exist on the backend.
+    The header of the database is uploaded last,
+    so that the version becomes visible
+    only after the publication is complete.
 
     :mod:`audb` uses md5 hashes of the database files
     to check if they have changed.
+    The hashes are stored
+    in the file ``.checksums.parquet`` in ``db_root``,
+    together with size,
+    modification time,
+    and inode of every file,
+    and are only calculated again
+    for files where one of them has changed.
+    Use ``verify=True``
+    to calculate the hashes of all files.
     Be aware that for certain file formats,
     like parquet,
     md5 hashes might differ
@@ -673,7 +889,25 @@ def publish(
             Can be used to bundle files into archives,
             which will speed up communication with the server
             if the database contains many small files.
-            Archive name must not include an extension
+            Archive name must not include an extension.
+            If ``'auto'``,
+            new media files are bundled
+            with other new media files in the same folder
+            into archives of about
+            :attr:`audb.config.ARCHIVE_SIZE` bytes.
+            Media files that are already part of the database
+            stay in their archives
+        compression: compression of files in archives.
+            ``'store'`` adds files uncompressed,
+            ``'deflate'`` compresses them.
+            Can be a dictionary mapping file formats,
+            e.g. ``'wav'``,
+            to one of them.
+            If ``None``,
+            formats that are already compressed,
+            like FLAC, MP3, MP4, or Opus,
+            are stored,
+            and all other formats are deflated
         previous_version: specifies the version
             this publication should be based on.
             If ``'latest'``
@@ -684,9 +918,16 @@ def publish(
         cache_root: cache folder where databases are stored.
             If not set :meth:`audb.default_cache_root` is used.
             Only used to read the dependencies of the previous version
+        verify: if ``True``,
+            the md5 hashes of all files are calculated,
+            even if they were stored
+            for unchanged files
         num_workers: number of parallel jobs or 1 for sequential
             processing. If ``None`` will be set to the number of
-            processors on the machine multiplied by 5
+            processors on the machine multiplied by 5.
+            If ``'auto'``,
+            the number of parallel jobs is adapted while running,
+            based on the measured throughput
         verbose: show debug messages
 
     Returns:
@@ -716,6 +957,9 @@ def publish(
         ValueError: if ``version`` or ``previous_version``
             cannot be parsed by :class:`audeer.StrictVersion`
         ValueError: if ``previous_version`` >= ``version``
+        ValueError: if ``archives`` is a string other than ``'auto'``
+        ValueError: if ``compression`` contains
+            a compression other than ``'deflate'`` or ``'store'``
         ValueError: if ``repository`` has a non-supported backend
 
     """
@@ -730,11 +974,16 @@ def publish(
             "'previous_version' needs to be smaller than 'version', "
             f"but yours is {previous_version} >= {version}."
         )
+    if isinstance(archives, str) and archives != "auto":
+        raise ValueError(
+            f"'archives' needs to be a dictionary or 'auto', but yours is '{archives}'."
+        )
+    policy = utils.compression_policy(compression)
 
     db = audformat.Database.load(
         db_root,
         load_data=False,
-        num_workers=num_workers,
+        num_workers=concurrency.resolve_num_workers(num_workers),
         verbose=verbose,
     )
 
@@ -750,8 +999,10 @@ def publish(
             version,
             repository,
             archives,
+            policy,
             previous_version,
             cache_root,
+            verify,
             num_workers,
             verbose,
         )
@@ -764,10 +1015,12 @@ def _publish(
     db_root: str,
     version: str,
     repository: Repository,
-    archives: Mapping[str, str] | None,
+    archives: Mapping[str, str] | str | None,
+    policy: Mapping[str, int],
     previous_version: str | None,
     cache_root: str | None,
-    num_workers: int | None,
+    verify: bool,
+    num_workers: int | str | None,
     verbose: bool,
 ) -> Dependencies:
     r"""Publish database without the progress animation.
@@ -795,7 +1048,9 @@ def _publish(
     if previous_version == "latest":
         # Resolve to the latest version of the database.
         # We search the union of ``audb.config.REPOSITORIES`` + ``repository``.
-        all_versions = audeer.sort_versions(list(set(api_versions(db.name) + versions)))
+        all_versions = audeer.sort_versions(
+            list(set(api_versions(db.name, refresh=True) + versions))
+        )
         previous_version = all_versions[-1] if len(all_versions) > 0 else None
     # Check previous_version is in same repository
     if previous_version is not None and previous_version not in versions:
@@ -870,7 +1125,7 @@ def _publish(
     db = audformat.Database.load(
         db_root,
         load_data=True,
-        num_workers=num_workers,
+        num_workers=concurrency.resolve_num_workers(num_workers),
         verbose=verbose,
     )
 
@@ -926,66 +1181,91 @@ def _publish(
     # check archives
     archives = archives or {}
 
+    checksums = Checksums(db_root, verify=verify)
+    journal = Journal(os.path.join(db_root, define.UPLOAD_JOURNAL_FILE))
+
     with backend_interface.backend:
-        # publish attachments
-        attachments = _find_attachments(db, db_root, version, deps, verbose)
-        _put_attachments(
-            attachments,
-            db_root,
-            db,
-            version,
-            backend_interface,
-            num_workers,
-            verbose,
-        )
+        try:
+            # publish attachments
+            _check_attachments(db, deps)
+            _publish_attachments(
+                db,
+                db_root,
+                version,
+                deps,
+                checksums,
+                policy,
+                journal,
+                backend_interface,
+                num_workers,
+                verbose,
+            )
 
-        # publish tables
-        tables = _find_tables(db, db_root, version, deps, verbose)
-        _put_tables(
-            tables,
-            db_root,
-            db.name,
-            version,
-            backend_interface,
-            num_workers,
-            verbose,
-        )
+            # publish tables
+            _publish_tables(
+                db,
+                db_root,
+                version,
+                deps,
+                checksums,
+                policy,
+                journal,
+                backend_interface,
+                num_workers,
+                verbose,
+            )
 
-        # publish media
-        media_archives = _find_media(
-            db,
-            db_root,
-            db_root_files,
-            version,
-            deps,
-            archives,
-            num_workers,
-            verbose,
-        )
-        _put_media(
-            media_archives,
-            db_root,
-            db.name,
-            version,
-            previous_version,
-            deps,
-            backend_interface,
-            num_workers,
-            verbose,
-        )
+            # publish media
+            _publish_media(
+                db,
+                db_root,
+                db_root_files,
+                version,
+                previous_version,
+                deps,
+                archives,
+                checksums,
+                policy,
+                journal,
+                backend_interface,
+                num_workers,
+                verbose,
+            )
+        finally:
+            # Store checksums also if publication is interrupted,
+            # so that a restart does not calculate them again
+            checksums.save()
 
         # publish dependencies and header
         upload_dependencies(backend_interface, deps, db_root, db.name, version)
+        local_header = os.path.join(db_root, define.HEADER_FILE)
+        remote_header = backend_interface.join("/", db.name, define.HEADER_FILE)
         try:
-            local_header = os.path.join(db_root, define.HEADER_FILE)
-            remote_header = backend_interface.join("/", db.name, define.HEADER_FILE)
             backend_interface.put_file(local_header, remote_header, version)
-        except Exception:  # pragma: no cover
+        except Exception:
             # after the header is published
             # the new version becomes visible,
             # so if something goes wrong here
             # we better clean up
             if backend_interface.exists(remote_header, version):
                 backend_interface.remove_file(remote_header, version)
+            raise
+
+        # The version is published,
+        # the catalog is only a hint
+        # and its update must not hide the publication
+        try:
+            catalog.add(backend_interface.backend, db.name, version, deps)
+        except Exception as ex:
+            warnings.warn(
+                f"Could not add version '{version}' of database '{db.name}' "
+                f"to the catalog of repository '{repository.name}': {ex}",
+                category=UserWarning,
+            )
+
+    # Forget that the version was not found
+    lookup.remove_repository(db.name, version)
+    lookup.remove_versions(db.name)
+    journal.clear()
 
     return deps
@@ -0,0 +1,374 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Sequence
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import audbackend
+
+from audb.core import define
+from audb.core.repository import Repository
+
+
+_COLUMNS = ("requests", "failures", "latency", "throughput", "healthy")
+
+
+class _Statistics:
+    r"""Latency and throughput per repository.
+
+    Repositories are identified by host and name,
+    so that a backend object
+    can be assigned to its repository.
+
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def estimate(self, key: tuple[str, str], size: float) -> float | None:
+        r"""Expected duration in seconds to download ``size`` bytes.
+
+        Returns ``None``
+        if the latency of the repository is unknown.
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["latency"] is None:
+                return None
+            latency = entry["latency"]
+            throughput = entry["throughput"]
+        if throughput is None or size == 0:
+            return latency
+        return latency + size / throughput
+
+    def fail(self, key: tuple[str, str]):
+        r"""Store failed request."""
+        with self._lock:
+            entry = self._entry(key)
+            entry["requests"] += 1
+            entry["failures"] += 1
+            entry["failed"] = time.monotonic()
+
+    def healthy(self, key: tuple[str, str]) -> bool:
+        r"""Check if repository did not fail recently."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["failed"] is None:
+                return True
+            return time.monotonic() - entry["failed"] >= define.REPLICA_COOLDOWN
+
+    def observe(
+        self,
+        key: tuple[str, str],
+        *,
+        latency: float = None,
+        size: int = None,
+        duration: float = None,
+    ):
+        r"""Store successful request.
+
+        Latency is measured by requests
+        that transfer no data,
+        throughput by downloads of files
+        of at least ``define.REPLICA_MIN_SIZE`` bytes.
+        Both are averaged exponentially,
+        so that recent requests dominate.
+
+        """
+        with self._lock:
+            entry = self._entry(key)
+            entry["requests"] += 1
+            entry["failed"] = None
+            if latency is not None:
+                entry["latency"] = _average(entry["latency"], latency)
+                entry["probed"] = time.monotonic()
+            if size is not None and size >= define.REPLICA_MIN_SIZE:
+                transfer = max(duration - (entry["latency"] or 0), 1e-6)
+                entry["throughput"] = _average(entry["throughput"], size / transfer)
+
+    def probed(self, key: tuple[str, str]) -> bool:
+        r"""Check if latency was measured recently."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["probed"] is None:
+                return False
+            return time.monotonic() - entry["probed"] < define.REPLICA_PROBE_INTERVAL
+
+    def reset(self):
+        r"""Remove all statistics."""
+        with self._lock:
+            self._entries = {}
+
+    def throughput(self, key: tuple[str, str]) -> float | None:
+        r"""Throughput of repository in bytes per second."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry["throughput"]
+
+    def to_frame(self) -> pd.DataFrame:
+        r"""Statistics as data frame."""
+        with self._lock:
+            keys = sorted(self._entries)
+            entries = [self._entries[key] for key in keys]
+            data = {
+                "requests": [entry["requests"] for entry in entries],
+                "failures": [entry["failures"] for entry in entries],
+                "latency": [_nan(entry["latency"]) for entry in entries],
+                "throughput": [_nan(entry["throughput"]) for entry in entries],
+            }
+        data["healthy"] = [self.healthy(key) for key in keys]
+        index = pd.MultiIndex.from_tuples(
+            [(name, host) for host, name in keys],
+            names=["repository", "host"],
+        )
+        df = pd.DataFrame(data, index=index, columns=list(_COLUMNS))
+        return df.astype({"requests": "int64", "failures": "int64", "healthy": "bool"})
+
+    def _entry(self, key: tuple[str, str]) -> dict:
+        r"""Entry of repository, created if missing."""
+        if key not in self._entries:
+            self._entries[key] = {
+                "requests": 0,
+                "failures": 0,
+                "latency": None,
+                "throughput": None,
+                "failed": None,
+                "probed": None,
+            }
+        return self._entries[key]
+
+
+_statistics = _Statistics()
+
+
+def fail(backend: audbackend.backend.Base | Repository):
+    r"""Store failed request to repository.
+
+    The repository is considered unhealthy
+    for ``define.REPLICA_COOLDOWN`` seconds.
+
+    Args:
+        backend: backend or repository
+
+    """
+    _statistics.fail(_key(backend))
+
+
+def observe(
+    backend: audbackend.backend.Base | Repository,
+    *,
+    latency: float = None,
+    size: int = None,
+    duration: float = None,
+):
+    r"""Store successful request to repository.
+
+    Args:
+        backend: backend or repository
+        latency: duration in seconds
+            of a request that transferred no data
+        size: number of downloaded bytes
+        duration: duration in seconds of download
+
+    """
+    _statistics.observe(_key(backend), latency=latency, size=size, duration=duration)
+
+
+def probed(repository: Repository) -> bool:
+    r"""Check if latency of repository was measured recently.
+
+    Args:
+        repository: repository
+
+    Returns:
+        ``True`` if latency was measured
+        within the last ``define.REPLICA_PROBE_INTERVAL`` seconds
+
+    """
+    return _statistics.probed(_key(repository))
+
+
+def rank(repositories: Sequence[Repository]) -> list[Repository]:
+    r"""Sort repositories by expected download duration.
+
+    Healthy repositories come first,
+    sorted by the expected duration
+    to download ``define.REPLICA_REFERENCE_SIZE`` bytes.
+    Repositories without measured latency
+    keep their order from ``repositories``
+    after the measured ones.
+
+    Args:
+        repositories: repositories containing the same database
+
+    Returns:
+        sorted repositories
+
+    """
+
+    def key(n: int) -> tuple[bool, float, int]:
+        repository = repositories[n]
+        estimate = _statistics.estimate(
+            _key(repository),
+            define.REPLICA_REFERENCE_SIZE,
+        )
+        return (
+            not _statistics.healthy(_key(repository)),
+            np.inf if estimate is None else estimate,
+            n,
+        )
+
+    return [repositories[n] for n in sorted(range(len(repositories)), key=key)]
+
+
+def repository_statistics(*, reset: bool = False) -> pd.DataFrame:
+    r"""Statistics of repositories.
+
+    If a database is stored in several repositories,
+    :attr:`audb.config.FASTEST_REPLICA`
+    and :attr:`audb.config.STRIPE_REPLICAS`
+    select the repositories to download from
+    by their latency and throughput.
+    This function returns for every requested repository
+    the number of requests and failed requests,
+    the average latency in seconds,
+    the average throughput in bytes per second,
+    and if the repository is considered healthy,
+    i.e. if no request failed within the last minute.
+
+    Args:
+        reset: if ``True``,
+            statistics are removed after returning them
+
+    Returns:
+        table with statistics per repository
+
+    Examples:
+        >>> df = audb.repository_statistics()
+        >>> list(df.columns)
+        ['requests', 'failures', 'latency', 'throughput', 'healthy']
+
+    """
+    df = _statistics.to_frame()
+    if reset:
+        _statistics.reset()
+    return df
+
+
+class Stripe:
+    r"""Distribute downloads across replicas.
+
+    Every download is assigned to the healthy replica
+    that is expected to finish it first,
+    given its throughput
+    and the bytes it is still downloading.
+    If a download fails on a replica,
+    it is repeated on the next one.
+
+    Args:
+        backend_interfaces: backend interfaces of repositories
+            containing the same database
+
+    """
+
+    def __init__(
+        self,
+        backend_interfaces: Sequence[type[audbackend.interface.Base]],
+    ):
+        self._backend_interfaces = list(backend_interfaces)
+        self._pending = [0.0] * len(self._backend_interfaces)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        r"""Number of replicas."""
+        return len(self._backend_interfaces)
+
+    def run(
+        self,
+        func: Callable[[type[audbackend.interface.Base]], object],
+        size: float,
+    ) -> object:
+        r"""Run download on a replica.
+
+        Args:
+            func: download function,
+                called with the backend interface of the replica
+            size: expected size of download in bytes
+
+        Returns:
+            result of ``func``
+
+        """
+        candidates = list(range(len(self._backend_interfaces)))
+        while True:
+            with self._lock:
+                n = min(candidates, key=lambda n: self._finish(n, candidates, size))
+                self._pending[n] += size
+            try:
+                return func(self._backend_interfaces[n])
+            except Exception as ex:
+                candidates.remove(n)
+                # A replica might miss a file
+                # that another one contains
+                if not candidates or not isinstance(
+                    ex,
+                    (audbackend.BackendError, OSError),
+                ):
+                    raise
+            finally:
+                with self._lock:
+                    self._pending[n] -= size
+
+    def _finish(
+        self,
+        n: int,
+        candidates: Sequence[int],
+        size: float,
+    ) -> tuple[bool, float, int]:
+        r"""Unhealthy flag and expected finish time of download on replica.
+
+        Replicas with unknown throughput
+        are assumed to be as fast
+        as the average of the others.
+
+        """
+        throughputs = [
+            _statistics.throughput(_key(self._backend_interfaces[m].backend))
+            for m in candidates
+        ]
+        known = [throughput for throughput in throughputs if throughput is not None]
+        throughput = throughputs[candidates.index(n)]
+        if throughput is None:
+            throughput = np.mean(known) if known else 1.0
+        key = _key(self._backend_interfaces[n].backend)
+        return (
+            not _statistics.healthy(key),
+            (self._pending[n] + size) / throughput,
+            n,
+        )
+
+
+def _average(average: float | None, value: float) -> float:
+    r"""Exponential moving average."""
+    if average is None:
+        return value
+    weight = define.REPLICA_AVERAGE_WEIGHT
+    return weight * value + (1 - weight) * average
+
+
+def _key(backend: audbackend.backend.Base | Repository) -> tuple[str, str]:
+    r"""Host and name of repository."""
+    if isinstance(backend, Repository):
+        return str(backend.host), str(backend.name)
+    return str(backend.host), str(backend.repository)
+
+
+def _nan(value: float | None) -> float:
+    r"""Replace missing value by NaN."""
+    return np.nan if value is None else value
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import collections
+from collections.abc import Callable
+import concurrent.futures
+import random
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import audbackend
+
+from audb.core import concurrency
+from audb.core import define
+from audb.core.config import config
+
+
+# Error codes of object storages,
+# that will not change when a request is repeated
+_PERMANENT_ERROR_CODES = ("AccessDenied", "NoSuchBucket", "NoSuchKey")
+
+# Errors that will not change when a request is repeated
+_PERMANENT_ERRORS = (
+    FileNotFoundError,
+    IsADirectoryError,
+    NotADirectoryError,
+    PermissionError,
+    ValueError,
+)
+
+_COUNTERS = ("requests", "retries", "failures", "timeouts", "hedges", "hedge_wins")
+
+
+class _Statistics:
+    r"""Statistics of backend requests per operation."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def add(self, operation: str, counter: str):
+        r"""Increase counter of operation by one."""
+        with self._lock:
+            self._counters[operation][counter] += 1
+
+    def observe(self, operation: str, latency: float):
+        r"""Store duration of a successful request."""
+        with self._lock:
+            self._latencies[operation].append(latency)
+
+    def latency(self, operation: str, percentile: float) -> float | None:
+        r"""Percentile of latencies of operation.
+
+        Returns ``None``
+        as long as less than ``define.HEDGE_MIN_REQUESTS``
+        requests were observed.
+
+        """
+        with self._lock:
+            latencies = list(self._latencies[operation])
+        if len(latencies) < define.HEDGE_MIN_REQUESTS:
+            return None
+        return float(np.percentile(latencies, percentile))
+
+    def reset(self):
+        r"""Remove all statistics."""
+        with self._lock:
+            self._counters = collections.defaultdict(
+                lambda: dict.fromkeys(_COUNTERS, 0)
+            )
+            self._latencies = collections.defaultdict(
+                lambda: collections.deque(maxlen=define.LATENCY_WINDOW)
+            )
+
+    def to_frame(self) -> pd.DataFrame:
+        r"""Statistics as data frame."""
+        with self._lock:
+            operations = sorted(self._counters)
+            data = {
+                counter: [self._counters[op][counter] for op in operations]
+                for counter in _COUNTERS
+            }
+            for percentile in (50, 99):
+                data[f"p{percentile}"] = [
+                    float(np.percentile(self._latencies[op], percentile))
+                    if self._latencies[op]
+                    else np.nan
+                    for op in operations
+                ]
+        df = pd.DataFrame(data, index=pd.Index(operations, name="operation"))
+        return df.astype({counter: "int64" for counter in _COUNTERS})
+
+
+_statistics = _Statistics()
+
+
+def backend_statistics(*, reset: bool = False) -> pd.DataFrame:
+    r"""Statistics of backend requests.
+
+    Requests to a backend,
+    e.g. to download a media archive,
+    are retried if they fail
+    with a transient error,
+    see :attr:`audb.config.BACKEND_RETRIES`.
+    They can be aborted after a timeout,
+    see :attr:`audb.config.BACKEND_TIMEOUT`,
+    and be duplicated if they are slow,
+    see :attr:`audb.config.BACKEND_HEDGE_PERCENTILE`.
+    This function returns for every type of request
+    how often this happened,
+    and the 50th and 99th percentile
+    of the duration of successful requests in seconds.
+
+    Args:
+        reset: if ``True``,
+            statistics are removed after returning them
+
+    Returns:
+        table with statistics per operation
+
+    Examples:
+        >>> df = audb.backend_statistics()
+        >>> list(df.columns)
+        ['requests', 'retries', 'failures', 'timeouts', 'hedges', 'hedge_wins', 'p50', 'p99']
+
+    """  # noqa: E501
+    df = _statistics.to_frame()
+    if reset:
+        _statistics.reset()
+    return df
+
+
+def call(
+    func: Callable,
+    *args,
+    operation: str,
+    concurrent: bool = False,
+    discard: Callable[[object], None] = None,
+    **kwargs,
+) -> object:
+    r"""Call backend function with retries, timeout and hedging.
+
+    A failed request is repeated
+    up to :attr:`audb.config.BACKEND_RETRIES` times
+    if the error is transient,
+    waiting a random time
+    up to :attr:`audb.config.BACKEND_BACKOFF` seconds
+    before the first retry,
+    and up to twice as long before every further retry.
+
+    Timeouts and hedged requests
+    start another attempt
+    while the first one might still be running.
+    They are only applied
+    if ``concurrent`` is ``True``,
+    i.e. if attempts of the request
+    can run at the same time
+    without affecting each other.
+    Abandoned attempts finish in the background,
+    and their results are passed to ``discard``.
+
+    Args:
+        func: backend function
+        *args: positional arguments of ``func``
+        operation: name of operation in statistics
+        concurrent: if attempts can run concurrently
+        discard: function called with the result
+            of every abandoned attempt
+            that finishes successfully
+        **kwargs: keyword arguments of ``func``
+
+    Returns:
+        result of ``func``
+
+    Raises:
+        TimeoutError: if all attempts exceeded
+            :attr:`audb.config.BACKEND_TIMEOUT`
+
+    """
+    retries = config.BACKEND_RETRIES
+    for attempt in range(retries + 1):
+        _statistics.add(operation, "requests")
+        start = time.perf_counter()
+        try:
+            if concurrent and concurrent_attempts():
+                result = _race(func, args, kwargs, operation, discard)
+            else:
+                result = func(*args, **kwargs)
+        except Exception as ex:
+            if attempt == retries or not _is_transient(ex):
+                _statistics.add(operation, "failures")
+                raise
+            _statistics.add(operation, "retries")
+            # Random delay avoids
+            # that concurrent requests are retried at the same time
+            time.sleep(random.uniform(0, config.BACKEND_BACKOFF * 2**attempt))
+            continue
+        _statistics.observe(operation, time.perf_counter() - start)
+        return result
+
+
+def concurrent_attempts() -> bool:
+    r"""Check if timeouts or hedged requests are enabled.
+
+    Returns:
+        ``True`` if attempts of a request
+        might run concurrently
+
+    """
+    return (
+        config.BACKEND_TIMEOUT is not None
+        or config.BACKEND_HEDGE_PERCENTILE is not None
+    )
+
+
+def _is_transient(ex: Exception) -> bool:
+    r"""Check if request might succeed when repeated."""
+    if isinstance(ex, audbackend.BackendError):
+        ex = ex.exception
+    elif not isinstance(ex, (ConnectionError, InterruptedError, TimeoutError)):
+        return False
+    if isinstance(ex, _PERMANENT_ERRORS):
+        return False
+    return getattr(ex, "code", None) not in _PERMANENT_ERROR_CODES
+
+
+def _race(
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+    operation: str,
+    discard: Callable[[object], None] | None,
+) -> object:
+    r"""Run attempt of request with timeout and hedging.
+
+    If the attempt takes longer
+    than the configured percentile
+    of the duration of previous requests,
+    a second attempt is started,
+    and the result of the attempt
+    that finishes first is returned.
+    Attempts that are not finished
+    when the timeout is reached
+    are abandoned.
+
+    """
+    timeout = config.BACKEND_TIMEOUT
+    hedge_delay = None
+    if config.BACKEND_HEDGE_PERCENTILE is not None:
+        hedge_delay = _statistics.latency(operation, config.BACKEND_HEDGE_PERCENTILE)
+
+    first, started = _start(func, args, kwargs)
+    # Waiting for a free thread
+    # does not count as duration of the request
+    started.wait()
+    deadline = None if timeout is None else time.perf_counter() + timeout
+    pending = {first}
+    error = None
+    while pending:
+        wait = None if deadline is None else max(0, deadline - time.perf_counter())
+        if hedge_delay is not None:
+            wait = hedge_delay if wait is None else min(wait, hedge_delay)
+        done, pending = concurrent.futures.wait(
+            pending,
+            timeout=wait,
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        for future in done:
+            if future.exception() is None:
+                if future is not first:
+                    _statistics.add(operation, "hedge_wins")
+                _abandon((done | pending) - {future}, discard)
+                return future.result()
+            error = future.exception()
+        if pending and deadline is not None and time.perf_counter() >= deadline:
+            _statistics.add(operation, "timeouts")
+            _abandon(pending, discard)
+            raise TimeoutError(
+                f"Backend request did not finish within {timeout} seconds."
+            )
+        if pending and hedge_delay is not None:
+            # Start a duplicate of the slow request
+            _statistics.add(operation, "hedges")
+            pending.add(_start(func, args, kwargs)[0])
+            hedge_delay = None
+    raise error
+
+
+def _abandon(
+    futures: set[concurrent.futures.Future],
+    discard: Callable[[object], None] | None,
+):
+    r"""Discard results of attempts when they finish."""
+    if discard is None:
+        return
+
+    def callback(future: concurrent.futures.Future):
+        if future.exception() is None:
+            discard(future.result())
+
+    for future in futures:
+        future.add_done_callback(callback)
+
+
+# Threads running attempts of requests,
+# leaving room for a duplicate of every request
+# when ``num_workers=None`` is used
+_executor = concurrent.futures.ThreadPoolExecutor(
+    2 * concurrency.max_workers(),
+    thread_name_prefix="audb-backend",
+)
+
+
+def _start(
+    func: Callable,
+    args: tuple,
+    kwargs: dict,
+) -> tuple[concurrent.futures.Future, threading.Event]:
+    r"""Run function in a thread of the executor.
+
+    Returns:
+        future of result,
+        and event that is set
+        when the function starts running
+
+    """
+    started = threading.Event()
+
+    def run():
+        started.set()
+        return func(*args, **kwargs)
+
+    return _executor.submit(run), started
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Hashable
+import contextvars
+import importlib
+import threading
+
+
+# Session used by the current thread or task,
+# see Session.__enter__()
+_current = contextvars.ContextVar("audb_session", default=None)
+
+
+def _method(module: str, name: str) -> Callable:
+    r"""Create session method calling a top-level function.
+
+    The function is imported on first use,
+    as most of them depend on this module.
+
+    """
+
+    def method(self, *args, **kwargs):
+        func = getattr(importlib.import_module(module), name)
+        token = _current.set(self)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _current.reset(token)
+
+    method.__name__ = name
+    method.__qualname__ = f"Session.{name}"
+    method.__doc__ = f"Same as :func:`audb.{name}`, but uses the session."
+    return method
+
+
+class Session:
+    def __init__(self):
+        r"""Session reusing backends and metadata of databases.
+
+        Every call of a function like :func:`audb.load`
+        looks up the repository of the requested database,
+        opens a new connection to its backend,
+        and reads the header and dependency table
+        from the cache.
+        A session remembers the repository,
+        keeps the backend open,
+        and keeps the header,
+        dependency table
+        and available versions
+        of every database in memory.
+        This helps when many requests are made,
+        e.g. in a service
+        or when iterating over :func:`audb.stream`.
+
+        All top-level functions,
+        like :func:`audb.load`,
+        are available as methods of the session.
+        Inside a ``with`` statement,
+        the session is used by all functions
+        called in the same thread,
+        and it is closed at the end.
+
+        As the versions of databases
+        are only requested once per session,
+        databases published while a session is open
+        might not be visible in that session.
+
+        Examples:
+            >>> with audb.Session() as session:
+            ...     deps = session.dependencies("emodb", version="1.4.1")
+            ...     db = audb.load(
+            ...         "emodb",
+            ...         version="1.4.1",
+            ...         only_metadata=True,
+            ...         verbose=False,
+            ...     )
+            >>> db.name
+            'emodb'
+
+        """
+        self._lock = threading.Lock()
+        self._entries = {}
+        self._locks = {}
+        self._tokens = []
+
+    def __enter__(self) -> Session:
+        r"""Use session in current thread."""
+        self._tokens.append(_current.set(self))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        r"""Stop using and close session."""
+        _current.reset(self._tokens.pop())
+        self.close()
+
+    def close(self):
+        r"""Close backends and remove stored metadata."""
+        with self._lock:
+            entries = self._entries
+            self._entries = {}
+            self._locks = {}
+        for (kind, _), value in entries.items():
+            if kind == "backend":
+                value[1].backend.close()
+
+    def _get(
+        self,
+        kind: str,
+        key: Hashable,
+        func: Callable[[], object],
+    ) -> object:
+        r"""Get stored value or create it once."""
+        key = (kind, key)
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key]
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            with self._lock:
+                if key in self._entries:
+                    return self._entries[key]
+            value = func()
+            with self._lock:
+                self._entries[key] = value
+            return value
+
+    available = _method("audb.core.api", "available")
+    cached = _method("audb.core.api", "cached")
+    dependencies = _method("audb.core.api", "dependencies")
+    exists = _method("audb.core.api", "exists")
+    flavor_path = _method("audb.core.api", "flavor_path")
+    latest_version = _method("audb.core.api", "latest_version")
+    load = _method("audb.core.load", "load")
+    load_attachment = _method("audb.core.load", "load_attachment")
+    load_media = _method("audb.core.load", "load_media")
+    load_table = _method("audb.core.load", "load_table")
+    load_to = _method("audb.core.load_to", "load_to")
+    prefetch = _method("audb.core.prefetch", "prefetch")
+    publish = _method("audb.core.publish", "publish")
+    read_media = _method("audb.core.memory", "read_media")
+    remove_media = _method("audb.core.api", "remove_media")
+    repository = _method("audb.core.api", "repository")
+    stream = _method("audb.core.stream", "stream")
+    versions = _method("audb.core.api", "versions")
+
+
+def cached(
+    kind: str,
+    key: Hashable,
+    func: Callable[[], object],
+    *,
+    copy: Callable[[object], object] = None,
+) -> object:
+    r"""Get value from current session.
+
+    If no session is used,
+    ``func`` is called.
+
+    Args:
+        kind: kind of value, e.g. ``'dependencies'``
+        key: key identifying the value
+        func: function creating the value
+        copy: function copying the value.
+            If given,
+            callers of the session get a copy
+            of the stored value
+
+    Returns:
+        value
+
+    """
+    session = _current.get()
+    if session is None:
+        return func()
+    value = session._get(kind, key, func)
+    if copy is not None:
+        value = copy(value)
+    return value
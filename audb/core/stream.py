@@ -128,7 +128,7 @@ class DatabaseIterator(audformat.Database, metaclass=abc.ABCMeta):
         sampling_rate: int,
         full_path: bool,
         cache_root: str,
-        num_workers: int | None,
+        num_workers: int | str | None,
         timeout: float,
         verbose: bool,
     ):
@@ -427,7 +427,7 @@ def stream(
     sampling_rate: int = None,
     full_path: bool = True,
     cache_root: str = None,
-    num_workers: int | None = 1,
+    num_workers: int | str | None = 1,
     timeout: float = define.TIMEOUT,
     verbose: bool = True,
 ) -> DatabaseIterator:
@@ -487,7 +487,10 @@ def stream(
             If not set :meth:`audb.default_cache_root` is used
         num_workers: number of parallel jobs or 1 for sequential
             processing. If ``None`` will be set to the number of
-            processors on the machine multiplied by 5
+            processors on the machine multiplied by 5.
+            If ``'auto'``,
+            the number of parallel jobs is adapted while running,
+            based on the measured throughput
         timeout: maximum time in seconds
             before giving up acquiring a lock to the database cache folder.
             ``None`` is returned in this case
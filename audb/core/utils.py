@@ -1,7 +1,13 @@
+from collections.abc import Mapping
 from collections.abc import Sequence
+import concurrent.futures
 import contextlib
 import os
+import tempfile
+import threading
+import time
 import warnings
+import zipfile
 
 import pyarrow.parquet as parquet
 
@@ -9,12 +15,63 @@ import audbackend
 import audeer
 import audformat
 
+from audb.core import concurrency
 from audb.core import define
+from audb.core import lookup
+from audb.core import replicas
+from audb.core import retry
+from audb.core import session
+from audb.core.cache import clear_database_tmp_root
 from audb.core.config import config
 from audb.core.lock import FolderLock
 from audb.core.repository import Repository
 
 
+def compression_policy(
+    compression: str | Mapping[str, str] | None = None,
+) -> dict[str, int]:
+    r"""Compression method of files in archives per format.
+
+    Files in formats that are already compressed,
+    see ``define.COMPRESSED_FORMATS``,
+    are stored without compression by default,
+    all other files are deflated.
+
+    Args:
+        compression: ``'deflate'`` or ``'store'``
+            to use the same compression for all formats,
+            or dictionary mapping formats
+            to one of them
+            to change the default
+            for those formats
+
+    Returns:
+        dictionary mapping formats
+        to compression methods of :mod:`zipfile`,
+        with the key ``""`` holding the method
+        of all other formats
+
+    Raises:
+        ValueError: if a compression is not supported
+
+    """
+    methods = {"deflate": zipfile.ZIP_DEFLATED, "store": zipfile.ZIP_STORED}
+    policy = {format: zipfile.ZIP_STORED for format in define.COMPRESSED_FORMATS}
+    policy[""] = zipfile.ZIP_DEFLATED
+    if compression is None:
+        return policy
+    if isinstance(compression, str):
+        compression = {format: compression for format in policy}
+    for format, method in compression.items():
+        if method not in define.COMPRESSION:
+            raise ValueError(
+                f"Compression must be one of {list(define.COMPRESSION)}, "
+                f"but '{method}' was provided for format '{format}'."
+            )
+        policy[format.lower()] = methods[method]
+    return policy
+
+
 def database_is_complete(db_root: str) -> bool:
     r"""Check if a database is completely cached.
 
@@ -82,6 +139,284 @@ def database_is_complete_in_header(db: audformat.Database) -> bool:
     return db.meta.get("audb", {}).get("complete", False)
 
 
+def find_replicas(
+    name: str,
+    version: str,
+) -> list[Repository]:
+    r"""Look up all repositories containing database.
+
+    All repositories in :attr:`config.REPOSITORIES`
+    are requested in parallel,
+    which measures their latency as well.
+    The result is stored in the user cache folder
+    for :attr:`config.LOOKUP_TTL` seconds,
+    see :func:`audb.core.lookup.read_replicas`.
+    Afterwards,
+    only repositories containing the database
+    are requested again
+    to measure their latency,
+    if it was not measured recently.
+
+    Args:
+        name: database name
+        version: version string
+
+    Returns:
+        repositories containing the database,
+        in the order of :attr:`config.REPOSITORIES`
+
+    Raises:
+        RuntimeError: if database is not found
+
+    """
+    repositories = lookup.read_replicas(name, version)
+    if repositories is None:
+        candidates = config.REPOSITORIES
+    else:
+        candidates = [r for r in repositories if not replicas.probed(r)]
+    header = f"/{name}/{define.HEADER_FILE}"
+
+    def job(repository: Repository) -> bool | None:
+        try:
+            backend_interface = repository.create_backend_interface()
+            with backend_interface.backend:
+                return _probe(backend_interface, header, version)
+        except (audbackend.BackendError, ValueError):
+            replicas.fail(repository)
+            return None
+
+    results = dict(
+        zip(
+            candidates,
+            concurrency.run_tasks(
+                job,
+                params=[([repository], {}) for repository in candidates],
+                num_workers=max(1, len(candidates)),
+            ),
+        )
+    )
+    if repositories is not None:
+        return repositories
+
+    repositories = [r for r in candidates if results[r]]
+    if None not in results.values():
+        if repositories:
+            lookup.write_replicas(name, version, repositories)
+        else:
+            lookup.write_repository(name, version, None)
+    if not repositories:
+        raise RuntimeError(f"Cannot find version '{version}' for database '{name}'.")
+    return repositories
+
+
+def get_file(
+    backend_interface: type[audbackend.interface.Base],
+    src_path: str,
+    dst_path: str,
+    version: str,
+    *,
+    num_workers: int = 1,
+    verbose: bool = False,
+) -> str:
+    r"""Get file from backend.
+
+    If ``num_workers`` is larger than ``1``,
+    the backend may download the file
+    in parallel byte ranges.
+    The request is retried on transient errors,
+    see :func:`audb.core.retry.call`.
+    The duration of the download is stored
+    to select the fastest repository,
+    see :mod:`audb.core.replicas`.
+    If timeouts or hedged requests are enabled,
+    every attempt downloads the file
+    to its own temporary folder
+    next to ``dst_path``,
+    and only the file of the successful attempt
+    is moved to ``dst_path``.
+    This ensures that abandoned attempts
+    do not write into folders
+    that are already removed or reused.
+
+    Args:
+        backend_interface: backend interface
+        src_path: path to file on backend
+        dst_path: destination path to local file
+        version: version of file
+        num_workers: number of parallel jobs
+        verbose: show debug messages
+
+    Returns:
+        full path to local file
+
+    """
+    start = time.perf_counter()
+    try:
+        dst_path = _get_file(
+            backend_interface,
+            src_path,
+            dst_path,
+            version,
+            num_workers=num_workers,
+            verbose=verbose,
+        )
+    except Exception as ex:
+        if retry._is_transient(ex):
+            replicas.fail(backend_interface.backend)
+        raise
+    replicas.observe(
+        backend_interface.backend,
+        size=os.path.getsize(dst_path),
+        duration=time.perf_counter() - start,
+    )
+    return dst_path
+
+
+def _get_file(
+    backend_interface: type[audbackend.interface.Base],
+    src_path: str,
+    dst_path: str,
+    version: str,
+    *,
+    num_workers: int,
+    verbose: bool,
+) -> str:
+    r"""Get file from backend with retries."""
+    if not retry.concurrent_attempts():
+        return retry.call(
+            backend_interface.get_file,
+            src_path,
+            dst_path,
+            version,
+            num_workers=num_workers,
+            verbose=verbose,
+            operation="get_file",
+        )
+
+    # Download attempts next to destination,
+    # so that the final move is a rename
+    # on the same file system
+    dst_root = audeer.mkdir(os.path.dirname(dst_path))
+
+    def attempt() -> str:
+        tmp_root = tempfile.mkdtemp(prefix=".audb-", dir=dst_root)
+        try:
+            return backend_interface.get_file(
+                src_path,
+                os.path.join(tmp_root, os.path.basename(dst_path)),
+                version,
+                num_workers=num_workers,
+                verbose=verbose,
+            )
+        except BaseException:
+            audeer.rmdir(tmp_root)
+            raise
+
+    def discard(path: str):
+        audeer.rmdir(os.path.dirname(path))
+
+    path = retry.call(
+        attempt,
+        operation="get_file",
+        concurrent=True,
+        discard=discard,
+    )
+    try:
+        os.replace(path, dst_path)
+    finally:
+        discard(path)
+    return dst_path
+
+
+def get_archive(
+    backend_interface: type[audbackend.interface.Base],
+    src_path: str,
+    dst_root: str,
+    version: str,
+    *,
+    tmp_root: str,
+    num_workers: int = 1,
+) -> list[str]:
+    r"""Get archive from backend and extract it.
+
+    For ``num_workers=1``
+    the archive is extracted while it is downloaded
+    with :meth:`audbackend.interface.Versioned.get_archive`,
+    unless timeouts or hedged requests are enabled,
+    as they require that attempts can run concurrently.
+    Otherwise,
+    the archive is downloaded to ``tmp_root`` first,
+    with ``num_workers`` parallel byte ranges,
+    if supported by the backend,
+    and its members are extracted in parallel,
+    as extraction of a single large archive
+    would otherwise be limited
+    to a single CPU core.
+
+    Args:
+        backend_interface: backend interface
+        src_path: path to archive on backend
+        dst_root: local destination directory
+        version: version of archive
+        tmp_root: directory under which archive is temporarily stored
+        num_workers: number of parallel jobs
+            used to extract the members of the archive
+
+    Returns:
+        extracted files
+
+    """
+    if num_workers == 1 and not retry.concurrent_attempts():
+        return retry.call(
+            backend_interface.get_archive,
+            src_path,
+            dst_root,
+            version,
+            tmp_root=tmp_root,
+            operation="get_archive",
+        )
+
+    with tempfile.TemporaryDirectory(dir=tmp_root) as tmp:
+        archive = os.path.join(tmp, os.path.basename(src_path))
+        get_file(
+            backend_interface,
+            src_path,
+            archive,
+            version,
+            num_workers=num_workers,
+        )
+
+        with zipfile.ZipFile(archive, "r") as zf:
+            members = zf.infolist()
+        # create folder tree to avoid race condition
+        # in os.makedirs when members are extracted
+        mkdir_tree([member.filename for member in members], dst_root)
+
+        # Distribute members by size
+        # across ``num_workers`` jobs
+        # which each use their own file handle
+        chunks = [[] for _ in range(min(num_workers, max(1, len(members))))]
+        members_by_size = sorted(members, key=lambda m: m.file_size, reverse=True)
+        for n, member in enumerate(members_by_size):
+            chunks[n % len(chunks)].append(member)
+
+        def job(chunk: list[zipfile.ZipInfo]):
+            with zipfile.ZipFile(archive, "r") as zf:
+                for member in chunk:
+                    zf.extract(member, dst_root)
+
+        concurrency.run_tasks(
+            job,
+            params=[([chunk], {}) for chunk in chunks],
+            num_workers=len(chunks),
+        )
+
+    files = [member.filename for member in members]
+    if os.name == "nt":  # pragma: no cover
+        files = [file.replace("/", os.path.sep) for file in files]
+    return files
+
+
 def legacy_complete(db_root: str, db: audformat.Database) -> bool:
     r"""Create a ``.complete`` file from a legacy header flag.
 
@@ -120,7 +455,9 @@ def lock_cache(
     as a complete database is never modified
     and therefore does not need to be locked.
     Otherwise a :class:`audb.core.lock.FolderLock`
-    for ``db_root`` is returned.
+    for ``db_root`` is acquired,
+    and leftover temporary folders
+    of interrupted downloads are removed.
 
     Args:
         db_root: database cache folder
@@ -133,7 +470,21 @@ def lock_cache(
     """
     if database_is_complete(db_root):
         return contextlib.nullcontext()
-    return FolderLock(db_root, timeout=timeout)
+    return _lock_incomplete_cache(db_root, timeout)
+
+
+@contextlib.contextmanager
+def _lock_incomplete_cache(
+    db_root: str,
+    timeout: float,
+):
+    r"""Lock cache folder and remove leftover temporary folders."""
+    with FolderLock(db_root, timeout=timeout):
+        # No other download of the database can run,
+        # so temporary folders are leftovers
+        # of interrupted downloads
+        clear_database_tmp_root(db_root)
+        yield
 
 
 def is_empty(path: str) -> bool:
@@ -157,7 +508,9 @@ def lookup_backend(
     r"""Return backend of requested database.
 
     If the database is stored in several repositories,
-    only the first one is considered.
+    only the first one is considered,
+    or the fastest one
+    if :attr:`config.FASTEST_REPLICA` is ``True``.
     The order of the repositories to look for the database
     is given by :attr:`config.REPOSITORIES`.
 
@@ -216,6 +569,97 @@ def mkdir_tree(
         audeer.mkdir(root, folder)
 
 
+def put_archive(
+    backend_interface: type[audbackend.interface.Base],
+    src_root: str,
+    dst_path: str,
+    version: str,
+    *,
+    files: str | Sequence[str],
+    policy: Mapping[str, int],
+):
+    r"""Create ZIP archive and put it on backend.
+
+    Same as :meth:`audbackend.interface.Versioned.put_archive`,
+    but compresses every file
+    with the method selected by its format.
+    As ZIP archives store the compression method
+    of every member,
+    they can be extracted
+    independent of the policy.
+
+    Args:
+        backend_interface: backend interface
+        src_root: local root directory of files
+        dst_path: path to archive on backend
+        version: version of archive
+        files: files relative to ``src_root``
+        policy: compression methods per format,
+            see :func:`compression_policy`
+
+    """
+    if isinstance(files, str):
+        files = [files]
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = os.path.join(tmp, os.path.basename(dst_path))
+        with zipfile.ZipFile(archive, "w") as zf:
+            for file in files:
+                format = audeer.file_extension(file).lower()
+                zf.write(
+                    os.path.join(src_root, file),
+                    arcname=file.replace(os.path.sep, "/"),
+                    compress_type=policy.get(format, policy[""]),
+                )
+        backend_interface.put_file(archive, dst_path, version)
+
+
+@contextlib.contextmanager
+def replica_backends(
+    name: str,
+    version: str,
+    backend_interface: type[audbackend.interface.Base],
+) -> replicas.Stripe:
+    r"""Context manager to distribute downloads across repositories.
+
+    If :attr:`config.STRIPE_REPLICAS` is ``True``,
+    the backends of all repositories
+    containing the database are opened,
+    and closed again when the context is left.
+    Repositories that cannot be reached are skipped.
+
+    Args:
+        name: database name
+        version: version string
+        backend_interface: backend of selected repository
+
+    Yields:
+        object distributing downloads
+        across the backends
+
+    """
+    backend_interfaces = [backend_interface]
+    if config.STRIPE_REPLICAS:
+        backend = backend_interface.backend
+        for repository in find_replicas(name, version):
+            if (str(repository.host), repository.name) == (
+                str(backend.host),
+                backend.repository,
+            ):
+                continue
+            try:
+                other = repository.create_backend_interface()
+                other.backend.open()
+            except (audbackend.BackendError, ValueError):
+                replicas.fail(repository)
+                continue
+            backend_interfaces.append(other)
+    try:
+        yield replicas.Stripe(backend_interfaces)
+    finally:
+        for other in backend_interfaces[1:]:
+            other.backend.close()
+
+
 def _lookup(
     name: str,
     version: str,
@@ -224,23 +668,182 @@ def _lookup(
 
     Returns repository, version and backend object.
 
+    Concurrent look ups of the same database
+    share a single request
+    to find the repository,
+    but every caller gets its own backend object.
+    Inside a :class:`audb.Session`
+    the backend object is reused
+    until the session is closed.
+
     """
-    for repository in config.REPOSITORIES:
+    return session.cached(
+        "backend",
+        (name, version, tuple(config.REPOSITORIES)),
+        lambda: _lookup_shared(name, version),
+    )
+
+
+def _lookup_shared(
+    name: str,
+    version: str,
+) -> tuple[Repository, type[audbackend.interface.Base]]:
+    r"""Look up database sharing concurrent requests."""
+    key = (name, version)
+    with _lookups_lock:
+        future = _lookups.get(key)
+        in_progress = future is not None
+        if not in_progress:
+            future = concurrent.futures.Future()
+            _lookups[key] = future
+    if in_progress:
+        repository = future.result()
+        backend_interface = repository.create_backend_interface()
+        backend_interface.backend.open()
+        return repository, backend_interface
+
+    try:
+        repository, backend_interface = _lookup_repositories(name, version)
+    except BaseException as ex:
+        future.set_exception(ex)
+        raise
+    else:
+        future.set_result(repository)
+    finally:
+        with _lookups_lock:
+            _lookups.pop(key)
+    return repository, backend_interface
+
+
+# Look ups in progress,
+# see _lookup_shared()
+_lookups = {}
+_lookups_lock = threading.Lock()
+
+
+def _lookup_repositories(
+    name: str,
+    version: str,
+) -> tuple[Repository, type[audbackend.interface.Base]]:
+    r"""Look up database in all repositories in parallel.
+
+    The first repository in :attr:`config.REPOSITORIES`
+    containing the database is selected,
+    but all repositories are requested at the same time.
+    If :attr:`config.FASTEST_REPLICA` is ``True``,
+    the fastest repository is selected instead,
+    see :func:`_lookup_fastest`.
+    The result is stored in the user cache folder
+    and reused by later look ups,
+    see :mod:`audb.core.lookup`.
+
+    """
+    found, repository = lookup.read_repository(name, version)
+    if found and repository is None:
+        raise RuntimeError(f"Cannot find version '{version}' for database '{name}'.")
+    if config.FASTEST_REPLICA:
+        return _lookup_fastest(name, version)
+    if found:
         try:
             backend_interface = repository.create_backend_interface()
             backend_interface.backend.open()
+            return repository, backend_interface
         except (audbackend.BackendError, ValueError):
-            continue
+            # Fall back to look up in all repositories
+            pass
+
+    repositories = config.REPOSITORIES
+    # Repositories that could not be requested,
+    # which means the database might still exist
+    unreachable = []
+
+    def job(repository: Repository) -> type[audbackend.interface.Base] | None:
+        try:
+            backend_interface = repository.create_backend_interface()
+            backend_interface.backend.open()
+        except (audbackend.BackendError, ValueError):
+            unreachable.append(repository)
+            return None
 
         header = backend_interface.join("/", name, "db.yaml")
-        if backend_interface.exists(header, version, suppress_backend_errors=True):
-            return repository, backend_interface
+        try:
+            exists = _probe(backend_interface, header, version)
+        except audbackend.BackendError:
+            unreachable.append(repository)
+            exists = False
+        if exists:
+            return backend_interface
         else:
             backend_interface.backend.close()
+            return None
+
+    def close(future: concurrent.futures.Future):
+        # Close backend of repository that is not selected
+        if future.exception() is None and future.result() is not None:
+            future.result().backend.close()
+
+    pool = concurrent.futures.ThreadPoolExecutor(max(1, len(repositories)))
+    futures = [pool.submit(job, repository) for repository in repositories]
+    # Do not wait for repositories after the selected one
+    pool.shutdown(wait=False)
+    for n, (repository, future) in enumerate(zip(repositories, futures)):
+        backend_interface = future.result()
+        if backend_interface is not None:
+            for other in futures[n + 1 :]:
+                other.add_done_callback(close)
+            lookup.write_repository(name, version, repository)
+            return repository, backend_interface
 
+    if not unreachable:
+        lookup.write_repository(name, version, None)
     raise RuntimeError(f"Cannot find version '{version}' for database '{name}'.")
 
 
+def _lookup_fastest(
+    name: str,
+    version: str,
+) -> tuple[Repository, type[audbackend.interface.Base]]:
+    r"""Look up fastest repository containing database.
+
+    Repositories are ranked
+    by their health and measured speed,
+    see :func:`audb.core.replicas.rank`.
+
+    """
+    for repository in replicas.rank(find_replicas(name, version)):
+        try:
+            backend_interface = repository.create_backend_interface()
+            backend_interface.backend.open()
+            return repository, backend_interface
+        except (audbackend.BackendError, ValueError):
+            replicas.fail(repository)
+    raise RuntimeError(
+        f"Cannot reach any repository containing version '{version}' "
+        f"of database '{name}'."
+    )
+
+
+def _probe(
+    backend_interface: type[audbackend.interface.Base],
+    path: str,
+    version: str,
+) -> bool:
+    r"""Check if file exists and measure latency of backend.
+
+    Raises:
+        BackendError: if backend cannot be requested
+
+    """
+    start = time.perf_counter()
+    try:
+        exists = backend_interface.exists(path, version)
+    except audbackend.BackendError:
+        replicas.fail(backend_interface.backend)
+        raise
+    replicas.observe(backend_interface.backend, latency=time.perf_counter() - start)
+    return exists
+
+
 def timeout_warning():
     warnings.warn(
         define.TIMEOUT_MSG,
@@ -0,0 +1,106 @@
+# /// script
+# dependencies = [
+#   "audb",
+#   "tabulate",
+# ]
+#
+# [tool.uv.sources]
+# audb = { path = "../", editable = true }
+# ///
+
+import os
+import tempfile
+import time
+import types
+
+import numpy as np
+import pandas as pd
+import tabulate
+
+import audeer
+import audiofile
+
+import audb
+from audb.core.checksums import Checksums
+from audb.core.journal import Journal
+from audb.core.publish import _publish_media
+
+
+print(f"audb v{audb.__version__}")
+
+num_changed = 10  # added and removed media files
+results = pd.DataFrame(columns=["result"])
+results.index.name = "number of media files"
+
+for num_rows in [10_000, 100_000, 1_000_000]:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_root = audeer.mkdir(tmp, "db")
+        audeer.mkdir(tmp, "host", "repo")
+        repository = audb.Repository("repo", audeer.path(tmp, "host"), "file-system")
+
+        # Dependency table of previous version,
+        # with media files stored in one archive per file
+        files = [f"audio/{n:07d}.wav" for n in range(num_rows)]
+        deps = audb.Dependencies()
+        deps._add_media(
+            [
+                (
+                    file,
+                    f"archive-{n}",
+                    16,
+                    1,
+                    f"{n:032x}",
+                    1.0,
+                    "wav",
+                    0,
+                    16000,
+                    audb.core.define.DEPENDENCY_TYPE["media"],
+                    "1.0.0",
+                )
+                for n, file in enumerate(files)
+            ]
+        )
+
+        # Database loaded with only_metadata=True,
+        # some media files are removed,
+        # and some are added
+        new_files = [f"new/{n}.wav" for n in range(num_changed)]
+        for file in new_files:
+            path = audeer.path(db_root, file)
+            audeer.mkdir(os.path.dirname(path))
+            audiofile.write(path, np.zeros((1, 16000)), 16000)
+        db = types.SimpleNamespace(
+            name="benchmark",
+            files=pd.Index(files[num_changed:] + new_files),
+        )
+
+        backend_interface = repository.create_backend_interface()
+        t0 = time.time()
+        with backend_interface.backend:
+            _publish_media(
+                db,
+                db_root,
+                set(new_files),
+                "2.0.0",
+                None,
+                deps,
+                {},
+                Checksums(db_root),
+                audb.core.utils.compression_policy(),
+                Journal(os.path.join(db_root, audb.core.define.UPLOAD_JOURNAL_FILE)),
+                backend_interface,
+                1,
+                False,
+            )
+        t = time.time() - t0
+        assert len(deps.media) == num_rows
+        results.at[f"{num_rows:,}", "result"] = t
+
+print(
+    tabulate.tabulate(
+        results,
+        headers="keys",
+        tablefmt="github",
+        floatfmt=".3f",
+    )
+)
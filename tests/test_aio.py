@@ -0,0 +1,96 @@
+import asyncio
+import os
+
+import pandas as pd
+import pytest
+
+import audformat
+import audformat.testing
+
+import audb
+
+
+DB_NAME = "test_aio"
+DB_VERSION = "1.0.0"
+
+
+@pytest.fixture(
+    scope="module",
+    autouse=True,
+)
+def db(tmpdir_factory, persistent_repository):
+    r"""Publish a single database."""
+    db_root = tmpdir_factory.mktemp(DB_VERSION)
+    db = audformat.testing.create_db(minimal=True)
+    db.name = DB_NAME
+    db.schemes["speaker"] = audformat.Scheme(
+        labels={"a": {"age": 20}, "b": {"age": 30}},
+    )
+    audformat.testing.add_table(
+        db,
+        "table",
+        "filewise",
+        num_files=[0, 1, 2, 3],
+        columns={"speaker": ("speaker", None)},
+    )
+    db.save(db_root)
+    audformat.testing.create_audio_files(db)
+    audb.publish(db_root, DB_VERSION, persistent_repository, verbose=False)
+    return db
+
+
+def test_dependencies(db):
+    async def main():
+        return await asyncio.gather(
+            *[audb.aio.dependencies(DB_NAME, version=DB_VERSION) for _ in range(10)]
+        )
+
+    deps = asyncio.run(main())
+    expected = audb.dependencies(DB_NAME, version=DB_VERSION)
+    for d in deps:
+        assert d == expected
+    # Callers do not share the same object
+    assert len({id(d) for d in deps}) == len(deps)
+
+
+def test_load_media(db):
+    media = list(db.files)
+
+    async def main():
+        return await asyncio.gather(
+            *[audb.aio.load_media(DB_NAME, file, version=DB_VERSION) for file in media]
+        )
+
+    paths = asyncio.run(main())
+    assert len(paths) == len(media)
+    for file, path in zip(media, paths):
+        assert len(path) == 1
+        assert path[0].endswith(os.path.normpath(file))
+        assert os.path.exists(path[0])
+
+    # Errors are raised inside the coroutine
+    with pytest.raises(ValueError):
+        asyncio.run(audb.aio.load_media(DB_NAME, "non-existing", version=DB_VERSION))
+
+
+@pytest.mark.parametrize("map", [None, {"speaker": "age"}])
+def test_load_table(db, map):
+    async def main():
+        return await asyncio.gather(
+            *[
+                audb.aio.load_table(DB_NAME, "table", version=DB_VERSION, map=map)
+                for _ in range(5)
+            ]
+        )
+
+    dfs = asyncio.run(main())
+    expected = audb.load_table(
+        DB_NAME,
+        "table",
+        version=DB_VERSION,
+        map=map,
+        verbose=False,
+    )
+    for df in dfs:
+        pd.testing.assert_frame_equal(df, expected)
+    assert len({id(df) for df in dfs}) == len(dfs)
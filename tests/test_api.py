@@ -1,4 +1,5 @@
 import concurrent.futures
+import time
 
 import pytest
 
@@ -405,6 +406,65 @@ def test_versions(tmpdir, repository):
     assert audb.versions(name) == [version]
 
 
+def test_repository_lookup(tmpdir, repository, monkeypatch):
+    """Test look up of database in several repositories.
+
+    All repositories are requested at the same time,
+    but the first one containing the database is selected.
+    Concurrent look ups share a single request.
+
+    """
+    name = "mydb"
+    version = "1.0.0"
+    build_dir = audeer.mkdir(tmpdir, "build")
+    db = audformat.Database(name)
+    db.save(build_dir)
+    second_repository = audb.Repository(
+        name=repository.name,
+        host=audeer.mkdir(tmpdir, "host"),
+        backend="file-system",
+    )
+    audeer.mkdir(second_repository.host, second_repository.name)
+    for repo in [second_repository, repository]:
+        audb.publish(build_dir, version, repo, verbose=False)
+    non_existing_repository = audb.Repository(
+        name="non-existing-repo",
+        host="non-existing-host",
+        backend="file-system",
+    )
+    audb.config.REPOSITORIES = [
+        non_existing_repository,
+        repository,
+        second_repository,
+    ]
+    assert audb.repository(name, version) == repository
+
+    calls = []
+    lookup_repositories = audb.core.utils._lookup_repositories
+
+    def slow_lookup(*args):
+        calls.append(args)
+        time.sleep(0.2)
+        return lookup_repositories(*args)
+
+    monkeypatch.setattr(audb.core.utils, "_lookup_repositories", slow_lookup)
+    with concurrent.futures.ThreadPoolExecutor(4) as pool:
+        futures = [
+            pool.submit(audb.core.utils._lookup, name, version) for _ in range(4)
+        ]
+        results = [future.result() for future in futures]
+    assert len(calls) == 1
+    assert all(repo == repository for repo, _ in results)
+    # Every caller gets its own backend
+    backends = [backend_interface.backend for _, backend_interface in results]
+    assert len({id(backend) for backend in backends}) == 4
+    for backend in backends:
+        backend.close()
+
+    with pytest.raises(RuntimeError, match="Cannot find version"):
+        audb.core.utils._lookup(name, "2.0.0")
+
+
 @pytest.mark.slow
 def test_lazy_import():
     """Test that heavy dependencies are not imported with 'import audb'.
@@ -480,7 +540,7 @@ def test_dir():
         "__path__",
         "__spec__",
     ]
-    submodules = [audb.core, audb.info]
+    submodules = [audb.aio, audb.core, audb.info]
     for submodule in submodules:
         for attr in submodule_standard_attrs:
             err_msg = f"Missing standard attribute '{attr}' in submodule '{submodule}'"
@@ -509,13 +569,17 @@ def test_public_api_accessible():
 
     # Functions from other modules
     other_functions = [
+        "backend_statistics",
         "default_cache_root",
         "load",
         "load_attachment",
         "load_media",
         "load_table",
         "load_to",
+        "prefetch",
         "publish",
+        "read_media",
+        "repository_statistics",
         "stream",
     ]
     for name in other_functions:
@@ -523,7 +587,16 @@ def test_public_api_accessible():
         assert callable(attr), f"audb.{name} should be callable"
 
     # Classes
-    classes = ["Dependencies", "Flavor", "Repository", "DatabaseIterator"]
+    classes = [
+        "Dependencies",
+        "Flavor",
+        "LazyDatabase",
+        "Mirror",
+        "Prefetch",
+        "Repository",
+        "Session",
+        "DatabaseIterator",
+    ]
     for name in classes:
         attr = getattr(audb, name)
         assert isinstance(attr, type), f"audb.{name} should be a class"
@@ -532,6 +605,7 @@ def test_public_api_accessible():
     assert audb.config is not None
 
     # Submodules
+    assert isinstance(audb.aio, types.ModuleType)
     assert isinstance(audb.core, types.ModuleType)
     assert isinstance(audb.info, types.ModuleType)
 
@@ -90,53 +90,49 @@ def test_cached_name(cache):
     assert len(df) == 0
 
 
-def test_database_tmp_root_cleanup(tmpdir):
-    """Test that database_tmp_root cleans up leftover tmp folders."""
+def test_database_tmp_root(tmpdir):
+    """Test temporary folders of downloads."""
     db_root = str(tmpdir / "db_root")
     tmp_root = db_root + "~"
 
+    from audb.core.cache import database_tmp_root
+    from audb.core.cache import remove_database_tmp_root
+
+    # Every download gets its own folder,
+    # and does not remove files of other downloads
+    tmp1 = database_tmp_root(db_root)
+    file = audeer.touch(tmp1, "file.txt")
+    tmp2 = database_tmp_root(db_root)
+    assert tmp1 != tmp2
+    assert os.path.dirname(tmp1) == os.path.dirname(tmp2) == tmp_root
+    assert os.path.exists(file)
+
+    # Parent folder is removed with the last download
+    remove_database_tmp_root(tmp2)
+    assert not os.path.exists(tmp2)
+    assert os.path.exists(tmp1)
+    remove_database_tmp_root(tmp1)
+    assert not os.path.exists(tmp_root)
+
+
+def test_database_tmp_root_cleanup(tmpdir):
+    """Test that leftover tmp folders are removed when locking."""
+    db_root = audeer.mkdir(tmpdir, "db_root")
+    tmp_root = db_root + "~"
+
     # Create tmp folder with some leftover files
     # (simulating an interrupted download)
-    audeer.mkdir(tmp_root)
-    leftover_file = os.path.join(tmp_root, "leftover.txt")
-    with open(leftover_file, "w") as f:
-        f.write("leftover content")
-    leftover_dir = os.path.join(tmp_root, "leftover_dir")
-    audeer.mkdir(leftover_dir)
-    nested_file = os.path.join(leftover_dir, "nested.txt")
-    with open(nested_file, "w") as f:
-        f.write("nested content")
-
-    # Verify leftover files exist
-    assert os.path.exists(tmp_root)
+    leftover_dir = audeer.mkdir(tmp_root, "leftover_dir")
+    leftover_file = audeer.touch(leftover_dir, "leftover.txt")
     assert os.path.exists(leftover_file)
-    assert os.path.exists(leftover_dir)
-    assert os.path.exists(nested_file)
 
-    # Call database_tmp_root - should clean up old tmp folder
-    from audb.core.cache import database_tmp_root
+    # Locking a complete database does not remove temporary folders,
+    # as other processes might load its header without locking
+    audeer.touch(db_root, audb.core.define.COMPLETE_FILE)
+    with audb.core.utils.lock_cache(db_root):
+        assert os.path.exists(leftover_file)
+    os.remove(os.path.join(db_root, audb.core.define.COMPLETE_FILE))
 
-    result_tmp_root = database_tmp_root(db_root)
-
-    # Verify tmp folder was cleaned and recreated empty
-    assert result_tmp_root == tmp_root
-    assert os.path.exists(tmp_root)
-    assert not os.path.exists(leftover_file)
-    assert not os.path.exists(leftover_dir)
-    assert not os.path.exists(nested_file)
-    # Verify tmp folder is empty
-    assert len(os.listdir(tmp_root)) == 0
-
-    # Test calling it again - should handle already empty tmp folder
-    result_tmp_root2 = database_tmp_root(db_root)
-    assert result_tmp_root2 == tmp_root
-    assert os.path.exists(tmp_root)
-    assert len(os.listdir(tmp_root)) == 0
-
-    # Test when tmp folder doesn't exist at all
-    audeer.rmdir(tmp_root)
-    assert not os.path.exists(tmp_root)
-    result_tmp_root3 = database_tmp_root(db_root)
-    assert result_tmp_root3 == tmp_root
-    assert os.path.exists(tmp_root)
-    assert len(os.listdir(tmp_root)) == 0
+    # Locking an incomplete database removes leftovers
+    with audb.core.utils.lock_cache(db_root):
+        assert not os.path.exists(tmp_root)
@@ -0,0 +1,164 @@
+import json
+import os
+
+import pytest
+
+import audbackend
+import audeer
+import audformat.testing
+
+import audb
+
+
+def publish(tmpdir, repository, name, version, num_files=2):
+    r"""Publish database with a single table."""
+    db_root = audeer.mkdir(tmpdir, name, version)
+    db = audformat.testing.create_db(minimal=True)
+    db.name = name
+    audformat.testing.add_table(db, "table", "filewise", num_files=num_files)
+    db.save(db_root)
+    audformat.testing.create_audio_files(db, file_duration="1s")
+    audb.publish(db_root, version, repository, previous_version=None, verbose=False)
+
+
+def read_catalog(repository):
+    r"""Read catalog from file-system repository."""
+    path = audeer.path(repository.host, repository.name, "catalog.json")
+    with open(path) as fp:
+        return json.load(fp)["databases"]
+
+
+def remove_catalog(repository):
+    r"""Remove catalog to mimic repository published with older audb."""
+    os.remove(audeer.path(repository.host, repository.name, "catalog.json"))
+
+
+def test_catalog(tmpdir, repository, monkeypatch):
+    publish(tmpdir, repository, "db-a", "1.0.0")
+    publish(tmpdir, repository, "db-a", "2.0.0", num_files=3)
+    publish(tmpdir, repository, "db-b", "1.0.0")
+    assert read_catalog(repository) == {
+        "db-a": {
+            "1.0.0": {"files": 2, "tables": 1, "duration": 2.0},
+            "2.0.0": {"files": 3, "tables": 1, "duration": 3.0},
+        },
+        "db-b": {
+            "1.0.0": {"files": 2, "tables": 1, "duration": 2.0},
+        },
+    }
+
+    # Headers of versions in catalog
+    # are not requested
+    exists = audbackend.backend.FileSystem.exists
+    headers = []
+
+    def counted_exists(self, path, *args, **kwargs):
+        if path.endswith("/db.yaml"):
+            headers.append(path)
+        return exists(self, path, *args, **kwargs)
+
+    monkeypatch.setattr(audbackend.backend.FileSystem, "exists", counted_exists)
+    df = audb.available()
+    assert headers == []
+    assert list(df.index) == ["db-a", "db-a", "db-b"]
+    assert list(df["version"]) == ["1.0.0", "2.0.0", "1.0.0"]
+    assert audb.versions("db-a") == ["1.0.0", "2.0.0"]
+    assert audb.latest_version("db-b") == "1.0.0"
+    assert audb.versions("db-c") == []
+
+
+def test_catalog_missing_version(tmpdir, repository):
+    # Catalog is only a hint,
+    # e.g. a version published with an older audb
+    # is not part of it
+    publish(tmpdir, repository, "db-a", "1.0.0")
+    publish(tmpdir, repository, "db-a", "2.0.0")
+    publish(tmpdir, repository, "db-b", "1.0.0")
+    databases = read_catalog(repository)
+    del databases["db-a"]["2.0.0"]
+    del databases["db-b"]
+    path = audeer.path(repository.host, repository.name, "catalog.json")
+    with open(path, "w") as fp:
+        json.dump({"databases": databases}, fp)
+
+    df = audb.available()
+    assert list(df.index) == ["db-a", "db-a", "db-b"]
+    assert list(df["version"]) == ["1.0.0", "2.0.0", "1.0.0"]
+    assert audb.versions("db-a", refresh=True) == ["1.0.0", "2.0.0"]
+    assert audb.versions("db-b", refresh=True) == ["1.0.0"]
+
+
+def test_catalog_old_repository(tmpdir, repository):
+    publish(tmpdir, repository, "db-a", "1.0.0")
+    publish(tmpdir, repository, "db-b", "1.0.0")
+    remove_catalog(repository)
+
+    # Versions are collected from the backend
+    assert list(audb.available().index) == ["db-a", "db-b"]
+    assert audb.versions("db-a", refresh=True) == ["1.0.0"]
+    assert audb.versions("db-c", refresh=True) == []
+
+    # Catalog is created by next publication
+    publish(tmpdir, repository, "db-a", "2.0.0")
+    assert read_catalog(repository) == {
+        "db-a": {
+            "1.0.0": {},
+            "2.0.0": {"files": 2, "tables": 1, "duration": 2.0},
+        },
+        "db-b": {"1.0.0": {}},
+    }
+
+
+def test_catalog_old_repository_unreachable(tmpdir, repository, monkeypatch):
+    publish(tmpdir, repository, "db-a", "1.0.0")
+    remove_catalog(repository)
+
+    def failing_versions(self, *args, **kwargs):
+        raise audbackend.BackendError(ConnectionError())
+
+    monkeypatch.setattr(audbackend.interface.Versioned, "versions", failing_versions)
+    assert audb.versions("db-a") == []
+    # Incomplete result is not stored
+    assert audb.core.lookup.read_versions("db-a") is None
+
+
+def test_catalog_concurrent_publication(tmpdir, repository, monkeypatch):
+    publish(tmpdir, repository, "db-a", "1.0.0")
+    write = audb.core.catalog._write
+    calls = []
+
+    def overwritten_write(backend, databases):
+        calls.append(databases)
+        if len(calls) == 1:
+            # Concurrent publication overwrites catalog
+            # with an older state
+            databases = {"db-a": {"1.0.0": databases["db-a"]["1.0.0"]}}
+        write(backend, databases)
+
+    monkeypatch.setattr(audb.core.catalog, "_write", overwritten_write)
+    publish(tmpdir, repository, "db-a", "2.0.0")
+    assert len(calls) == 2
+    assert audb.versions("db-a") == ["1.0.0", "2.0.0"]
+
+
+def test_catalog_error(tmpdir, repository, monkeypatch):
+    # Failed update of catalog does not hide published version
+    publish(tmpdir, repository, "db-a", "1.0.0")
+
+    def failing_move_file(self, *args, **kwargs):
+        raise audbackend.BackendError(ConnectionError())
+
+    monkeypatch.setattr(audbackend.backend.FileSystem, "move_file", failing_move_file)
+    with pytest.warns(UserWarning, match="to the catalog of repository"):
+        publish(tmpdir, repository, "db-a", "2.0.0")
+    assert audb.versions("db-a") == ["1.0.0", "2.0.0"]
+    assert list(audb.available()["version"]) == ["1.0.0", "2.0.0"]
+    assert list(read_catalog(repository)["db-a"]) == ["1.0.0"]
+
+
+def test_catalog_database_name(tmpdir, repository):
+    # Catalog does not interfere with database of same name
+    publish(tmpdir, repository, "catalog", "1.0.0")
+    assert audb.versions("catalog") == ["1.0.0"]
+    db = audb.load("catalog", version="1.0.0", verbose=False)
+    assert len(db.files) == 2
@@ -0,0 +1,147 @@
+import hashlib
+import os
+import time
+
+import pytest
+
+import audeer
+import audformat.testing
+
+import audb
+from audb.core.checksums import Checksums
+
+
+DB_NAME = "test_checksums"
+
+
+def make_old(root):
+    r"""Set modification time of all files in root one hour back."""
+    past = time.time() - 3600
+    for file in audeer.list_file_names(root, recursive=True, hidden=True):
+        os.utime(file, (past, past))
+
+
+def md5(file):
+    r"""MD5 checksum of file."""
+    with open(file, "rb") as fp:
+        return hashlib.md5(fp.read()).hexdigest()
+
+
+@pytest.fixture
+def hashed(monkeypatch):
+    r"""Record media files for which MD5 checksums are calculated."""
+    calls = []
+    md5 = audeer.md5
+
+    def recorded_md5(file, *args, **kwargs):
+        if file.endswith(".wav"):
+            calls.append(file)
+        return md5(file, *args, **kwargs)
+
+    monkeypatch.setattr(audeer, "md5", recorded_md5)
+    return calls
+
+
+def test_checksums(tmpdir, hashed, monkeypatch):
+    root = audeer.mkdir(tmpdir, "root")
+    a = audeer.path(root, "a.wav")
+    b = audeer.path(root, "b.wav")
+    for file in [a, b]:
+        with open(file, "w") as fp:
+            fp.write(file)
+    audeer.mkdir(root, "folder")
+    audeer.touch(root, "folder", "c.wav")
+    make_old(root)
+
+    checksums = Checksums(root)
+    assert checksums.path == audeer.path(root, ".checksums.parquet")
+    assert checksums.md5("a.wav") == md5(a)
+    assert checksums.md5("b.wav") == md5(b)
+    checksums.md5("folder")
+    checksums.save()
+    assert hashed == [a, b]
+
+    # Checksums of unchanged files are not calculated
+    hashed.clear()
+    checksums = Checksums(root)
+    assert checksums.md5("a.wav") == md5(a)
+    assert checksums.md5("b.wav") == md5(b)
+    assert hashed == []
+    # unless they are verified
+    Checksums(root, verify=True).md5("a.wav")
+    assert hashed == [a]
+    # or it is a folder
+    folders = []
+    checksums.md5("folder", func=folders.append)
+    assert folders == [audeer.path(root, "folder")]
+
+    # Changed file
+    with open(a, "w") as fp:
+        fp.write("changed")
+    hashed.clear()
+    checksums = Checksums(root)
+    assert checksums.md5("a.wav") == md5(a)
+    assert checksums.md5("b.wav") == md5(b)
+    assert hashed == [a]
+    # Recently changed file is not stored
+    checksums.save()
+    hashed.clear()
+    checksums = Checksums(root)
+    checksums.md5("a.wav")
+    checksums.md5("b.wav")
+    assert hashed == [a]
+
+    # Damaged cache file is ignored
+    with open(audeer.path(root, ".checksums.parquet"), "w") as fp:
+        fp.write("damaged")
+    hashed.clear()
+    Checksums(root).md5("b.wav")
+    assert hashed == [b]
+
+    # Cache file cannot be written
+    def failing_mkstemp(*args, **kwargs):
+        raise PermissionError()
+
+    monkeypatch.setattr("tempfile.mkstemp", failing_mkstemp)
+    Checksums(root).save()
+    assert audeer.list_file_names(root, hidden=True) == [
+        audeer.path(root, ".checksums.parquet"),
+        audeer.path(root, "a.wav"),
+        audeer.path(root, "b.wav"),
+    ]
+
+
+def test_checksums_publish(tmpdir, repository, hashed):
+    db_root = audeer.mkdir(tmpdir, "db")
+    db = audformat.testing.create_db(minimal=True)
+    db.name = DB_NAME
+    audformat.testing.add_table(db, "table", "filewise", num_files=3)
+    db.save(db_root)
+    audformat.testing.create_audio_files(db)
+    make_old(db_root)
+    audb.publish(db_root, "1.0.0", repository, verbose=False)
+    assert len(hashed) == 3
+    assert os.path.exists(audeer.path(db_root, ".checksums.parquet"))
+
+    # Checksums of unchanged files are not calculated
+    hashed.clear()
+    audb.publish(db_root, "2.0.0", repository, verbose=False)
+    assert hashed == []
+
+    hashed.clear()
+    audb.publish(db_root, "3.0.0", repository, verify=True, verbose=False)
+    assert len(hashed) == 3
+
+    # Database is updated with stored checksums
+    build_root = audeer.mkdir(tmpdir, "build")
+    audb.load_to(build_root, DB_NAME, version="1.0.0", verbose=False)
+    make_old(build_root)
+    hashed.clear()
+    audb.load_to(build_root, DB_NAME, version="2.0.0", verbose=False)
+    assert len(hashed) == 3
+    hashed.clear()
+    audb.load_to(build_root, DB_NAME, version="3.0.0", verbose=False)
+    assert hashed == []
+    hashed.clear()
+    audb.load_to(build_root, DB_NAME, version="3.0.0", verify=True, verbose=False)
+    assert len(hashed) == 3
@@ -0,0 +1,76 @@
+import concurrent.futures
+import threading
+
+import pytest
+
+from audb.core.coalesce import Coalescer
+
+
+def test_coalescer():
+    coalescer = Coalescer()
+    started = threading.Event()
+    release = threading.Event()
+    batches = []
+
+    def process(requests):
+        if not batches:
+            started.set()
+            release.wait()
+        batches.append(requests)
+        return [
+            ValueError(item) if item == "error" else [item.upper()]
+            for (item,) in requests
+        ]
+
+    with concurrent.futures.ThreadPoolExecutor(4) as pool:
+        first = pool.submit(coalescer.submit, "key", ["a"], process)
+        started.wait()
+        futures = [
+            pool.submit(coalescer.submit, "key", [item], process)
+            for item in ["b", "c", "error"]
+        ]
+        group = coalescer._groups["key"]
+        while len(group.queue) < 3:
+            pass
+        release.set()
+
+        assert first.result() == ["A"]
+        assert futures[0].result() == ["B"]
+        assert futures[1].result() == ["C"]
+        with pytest.raises(ValueError, match="error"):
+            futures[2].result()
+
+    # Requests that arrived while first batch was processed
+    # are processed as a single batch
+    assert batches == [[["a"]], [["b"], ["c"], ["error"]]]
+    # Groups without requests are removed
+    assert coalescer._groups == {}
+
+
+def test_coalescer_error():
+    def process(requests):
+        raise RuntimeError()
+
+    with pytest.raises(RuntimeError):
+        Coalescer().submit("key", ["a"], process)
+
+
+def test_coalescer_timeout():
+    coalescer = Coalescer()
+    started = threading.Event()
+    release = threading.Event()
+
+    def process(requests):
+        started.set()
+        release.wait()
+        return [items for items in requests]
+
+    with concurrent.futures.ThreadPoolExecutor(1) as pool:
+        first = pool.submit(coalescer.submit, "key", ["a"], process)
+        started.wait()
+        with pytest.raises(TimeoutError):
+            coalescer.submit("key", ["b"], process, timeout=0.05)
+        assert coalescer._groups["key"].queue == []
+        release.set()
+        assert first.result() == ["a"]
+    assert coalescer._groups == {}
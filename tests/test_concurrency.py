@@ -0,0 +1,237 @@
+import os
+import threading
+import time
+
+import pytest
+
+import audeer
+import audformat.testing
+
+import audb
+from audb.core.concurrency import AdaptiveWorkers
+from audb.core.concurrency import Stage
+from audb.core.concurrency import max_workers
+from audb.core.concurrency import resolve_num_workers
+from audb.core.concurrency import run_tasks
+from audb.core.concurrency import workers_per_task
+
+
+def test_adaptive_workers():
+    workers = AdaptiveWorkers(initial=4, minimum=1, maximum=6, tolerance=0.1)
+    assert workers.workers == 4
+
+    # First window always increases
+    workers._update(throughput=10, latency=1)
+    assert workers.workers == 5
+    # Increase while throughput does not drop
+    workers._update(throughput=10, latency=1)
+    assert workers.workers == 6
+    # Do not exceed maximum
+    workers._update(throughput=20, latency=1)
+    assert workers.workers == 6
+    # Halve if throughput drops
+    workers._update(throughput=10, latency=1)
+    assert workers.workers == 3
+    # Halve if latency grows without gaining throughput
+    workers._update(throughput=10, latency=2)
+    assert workers.workers == 1
+    # Do not fall below minimum
+    workers._update(throughput=1, latency=2)
+    assert workers.workers == 1
+    assert workers.throughput == 1
+    assert workers.latency == 2
+
+    # Initial value is clipped
+    assert AdaptiveWorkers(initial=10, maximum=2).workers == 2
+    assert AdaptiveWorkers(initial=0, minimum=2).workers == 2
+
+
+def test_adaptive_workers_observe():
+    workers = AdaptiveWorkers(initial=2, maximum=4)
+    workers.observe(0.1)
+    assert workers.throughput is None
+    workers.observe(0.1)
+    assert workers.throughput is not None
+    assert workers.latency == pytest.approx(0.1)
+    assert workers.workers == 3
+
+
+def test_resolve_num_workers():
+    assert resolve_num_workers("auto") == os.cpu_count()
+    assert resolve_num_workers(None) is None
+    assert resolve_num_workers(3) == 3
+
+
+@pytest.mark.parametrize(
+    "num_workers, num_tasks, expected",
+    [
+        (1, 1, 1),
+        (1, 3, 1),
+        (8, 3, 2),
+        (8, 0, 8),
+        (None, 1, max_workers()),
+        ("auto", 1, os.cpu_count()),
+    ],
+)
+def test_workers_per_task(num_workers, num_tasks, expected):
+    assert workers_per_task(num_workers, num_tasks) == expected
+
+
+@pytest.mark.parametrize("num_workers", [1, 3, None, "auto"])
+def test_run_tasks(num_workers):
+    running = []
+    max_running = []
+    lock = threading.Lock()
+
+    def job(x, *, power):
+        with lock:
+            running.append(x)
+            max_running.append(len(running))
+        time.sleep(0.001)
+        with lock:
+            running.remove(x)
+        return x**power
+
+    params = [([x], {"power": 2}) for x in range(50)]
+    results = run_tasks(
+        job,
+        params,
+        num_workers=num_workers,
+        task_description="test_run_tasks",
+    )
+    assert results == [x**2 for x in range(50)]
+    if num_workers == 1:
+        assert max(max_running) == 1
+
+
+def test_run_tasks_error():
+    def job(x):
+        if x == 3:
+            raise ValueError("error")
+        return x
+
+    with pytest.raises(ValueError, match="error"):
+        run_tasks(job, [([x], {}) for x in range(10)], num_workers="auto")
+
+
+@pytest.mark.parametrize("num_workers", [1, 3, None, "auto"])
+def test_stage(num_workers):
+    results = []
+    lock = threading.Lock()
+
+    def second(x):
+        with lock:
+            results.append(x)
+
+    def first(x):
+        time.sleep(0.001)
+        stage2.submit(second, x**2)
+
+    with Stage(num_workers, task_description="test_stage") as stage2:
+        with Stage(num_workers, task_description="test_stage") as stage1:
+            for x in range(50):
+                stage1.submit(first, x)
+            stage1.join()
+        stage2.join()
+    assert sorted(results) == [x**2 for x in range(50)]
+
+
+def test_stage_queue_size():
+    # Submit blocks while queue is full
+    started = threading.Event()
+    release = threading.Event()
+    submitted = []
+
+    def job():
+        started.set()
+        release.wait()
+
+    with Stage(1, queue_size=2) as stage:
+
+        def submit():
+            for n in range(3):
+                stage.submit(job)
+                submitted.append(n)
+
+        thread = threading.Thread(target=submit)
+        thread.start()
+        started.wait()
+        time.sleep(0.05)
+        assert submitted == [0, 1]
+        release.set()
+        thread.join()
+        stage.join()
+    assert submitted == [0, 1, 2]
+
+
+def test_stage_error():
+    def job(x):
+        if x == 3:
+            raise ValueError("error")
+
+    # Error is raised by join()
+    with Stage(1) as stage:
+        for x in range(5):
+            stage.submit(job, x)
+        with pytest.raises(ValueError, match="error"):
+            stage.join()
+        # and by submit()
+        with pytest.raises(ValueError, match="error"):
+            stage.submit(job, 0)
+
+    # Waiting tasks are canceled
+    finished = []
+    with pytest.raises(ValueError, match="error"):
+        with Stage(1, queue_size=10) as stage:
+            stage.submit(job, 3)
+            for x in range(5):
+                stage.submit(finished.append, x)
+            stage.join()
+    assert finished == []
+
+
+def test_num_workers_auto(tmpdir, repository):
+    name = "test_num_workers_auto"
+    version = "1.0.0"
+    db_root = audeer.mkdir(tmpdir, "db")
+    db = audformat.testing.create_db(minimal=True)
+    db.name = name
+    audformat.testing.add_table(db, "table", "filewise", num_files=10)
+    db.save(db_root)
+    audformat.testing.create_audio_files(db)
+
+    audb.publish(db_root, version, repository, num_workers="auto", verbose=False)
+
+    db = audb.load(name, version=version, num_workers="auto", verbose=False)
+    assert len(db.files) == 10
+    for file in db.files:
+        assert os.path.exists(file)
+
+    db = audb.load_to(
+        audeer.path(tmpdir, "raw"),
+        name,
+        version=version,
+        num_workers="auto",
+        verbose=False,
+    )
+    assert len(db.files) == 10
+
+    paths = audb.load_media(
+        name,
+        db.files[:2],
+        version=version,
+        sampling_rate=8000,
+        num_workers="auto",
+        verbose=False,
+    )
+    assert len(paths) == 2
+
+    db = audb.stream(
+        name,
+        "table",
+        version=version,
+        batch_size=5,
+        num_workers="auto",
+        verbose=False,
+    )
+    assert len(next(db)) == 5
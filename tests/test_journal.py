@@ -0,0 +1,37 @@
+import os
+
+import audeer
+
+from audb.core.journal import Journal
+
+
+def test_journal(tmpdir):
+    path = audeer.path(tmpdir, "journal")
+    journal = Journal(path)
+    assert len(journal) == 0
+    assert not os.path.exists(path)
+
+    journal.add("media", "archive", "1.0.0")
+    journal.add("media", "archive", "1.0.0")
+    journal.add("attachment", "archive", "1.0.0")
+    assert len(journal) == 2
+    assert ("media", "archive", "1.0.0") in journal
+    assert ["media", "archive", "1.0.0"] in journal
+    assert ("media", "archive", "2.0.0") not in journal
+
+    # Entries are restored from file,
+    # incomplete last line is ignored
+    with open(path, "a") as fp:
+        fp.write("media\tincomplete")
+    journal = Journal(path)
+    assert len(journal) == 2
+    assert ("media", "incomplete") not in journal
+    journal.add("media", "other", "1.0.0")
+    journal = Journal(path)
+    assert len(journal) == 3
+    assert ("media", "other", "1.0.0") in journal
+
+    journal.clear()
+    assert len(journal) == 0
+    assert not os.path.exists(path)
+    journal.clear()
@@ -1,11 +1,16 @@
+import concurrent.futures
 import os
 import random
 import shutil
+import threading
+import time
+import zipfile
 
 import numpy as np
 import pandas as pd
 import pytest
 
+import audbackend
 import audeer
 import audformat.testing
 import audiofile
@@ -621,6 +626,200 @@ def test_load_media(cache, version, media, format):
     assert paths2 == paths
 
 
+def test_load_media_concurrent(monkeypatch):
+    # Concurrent requests for the same database
+    # are merged and download every archive only once
+    version = "1.0.0"
+    deps = audb.dependencies(DB_NAME, version=version)
+    db_root = audb.core.load.database_cache_root(DB_NAME, version, None, audb.Flavor())
+    requests = [
+        ["audio/001.wav"],
+        ["audio/002.wav"],
+        ["audio/001.wav", "audio/003.wav"],
+        ["audio/004.wav", "audio/004.wav"],
+        ["audio/001.wav", "non-existing.wav"],
+    ]
+
+    # Block first request
+    # until all other requests are queued
+    get_archive = audbackend.interface.Versioned.get_archive
+    queued = threading.Event()
+    archives = []
+
+    def blocking_get_archive(self, src_path, *args, **kwargs):
+        if "/media/" in src_path:
+            if not archives:
+                queued.wait()
+            archives.append(src_path)
+        return get_archive(self, src_path, *args, **kwargs)
+
+    monkeypatch.setattr(
+        audbackend.interface.Versioned,
+        "get_archive",
+        blocking_get_archive,
+    )
+
+    def job(media):
+        return audb.load_media(DB_NAME, media, version=version, verbose=False)
+
+    with concurrent.futures.ThreadPoolExecutor(len(requests)) as pool:
+        futures = [pool.submit(job, requests[0])]
+        while not archives and not os.path.exists(db_root):
+            time.sleep(0.01)
+        futures += [pool.submit(job, media) for media in requests[1:]]
+        (group,) = audb.core.load._media_requests._groups.values()
+        while len(group.queue) < len(requests) - 1:
+            time.sleep(0.01)
+        queued.set()
+
+        for media, future in zip(requests[:-1], futures[:-1]):
+            assert future.result() == [os.path.join(db_root, file) for file in media]
+        with pytest.raises(ValueError, match="non-existing.wav"):
+            futures[-1].result()
+
+    expected = {deps.archive(file) for media in requests[:-1] for file in media}
+    assert len(archives) == len(set(archives)) == len(expected)
+
+
+def test_load_media_timeout():
+    version = "1.0.0"
+    db_root = audb.core.load.database_cache_root(DB_NAME, version, None, audb.Flavor())
+    audeer.mkdir(db_root)
+    with audb.core.lock.FolderLock(db_root):
+        with pytest.warns(UserWarning, match=audb.core.define.TIMEOUT_MSG):
+            paths = audb.load_media(
+                DB_NAME,
+                ["audio/001.wav"],
+                version=version,
+                timeout=0,
+                verbose=False,
+            )
+    assert paths is None
+
+
+@pytest.mark.parametrize(
+    "channels, mixdown, sampling_rate",
+    [
+        (None, False, None),
+        ([0, 0], False, None),
+        (None, True, 8000),
+    ],
+)
+def test_read_media(cache, monkeypatch, channels, mixdown, sampling_rate):
+    version = "1.0.0"
+    media = ["audio/001.wav", "audio/003.wav", "audio/001.wav"]
+    audb.core.memory._archives.clear()
+    audb.core.memory._dependencies.clear()
+
+    get_archive = audb.core.memory._get_archive
+    archives = []
+
+    def recording_get_archive(backend_interface, path, version):
+        archives.append(path)
+        return get_archive(backend_interface, path, version)
+
+    monkeypatch.setattr(audb.core.memory, "_get_archive", recording_get_archive)
+
+    signals = audb.read_media(
+        DB_NAME,
+        media,
+        version=version,
+        channels=channels,
+        mixdown=mixdown,
+        sampling_rate=sampling_rate,
+        num_workers=pytest.NUM_WORKERS,
+    )
+    # Nothing is written to the cache,
+    # besides the repository of the database
+    assert audeer.list_file_names(cache, recursive=True) == [
+        audeer.path(cache, ".lookup", "repositories", DB_NAME, f"{version}.json")
+    ]
+    assert len(archives) == 2
+    # Repeated media files are returned as copies
+    assert signals[2][0] is not signals[0][0]
+    np.testing.assert_equal(signals[2][0], signals[0][0])
+
+    paths = audb.load_media(
+        DB_NAME,
+        media,
+        version=version,
+        channels=channels,
+        mixdown=mixdown,
+        sampling_rate=sampling_rate,
+        verbose=False,
+    )
+    for (signal, sr), path in zip(signals, paths):
+        expected_signal, expected_sr = audiofile.read(path)
+        assert sr == expected_sr
+        np.testing.assert_allclose(signal, expected_signal, atol=1e-4)
+
+    # Archives are kept in memory
+    # if memory cache is enabled
+    audb.read_media(DB_NAME, media[:1], version=version)
+    assert len(archives) == 3
+    monkeypatch.setattr(audb.config, "MEMORY_CACHE_SIZE", 2**30)
+    audb.read_media(DB_NAME, media[:1], version=version)
+    audb.read_media(DB_NAME, media[:1], version=version)
+    assert len(archives) == 4
+    audb.core.memory._archives.clear()
+
+    assert audb.read_media(DB_NAME, [], version=version) == []
+
+    # Every archive is opened once
+    # for all requested media files it contains
+    zip_file = zipfile.ZipFile
+    opened = []
+
+    def recording_zip_file(*args, **kwargs):
+        opened.append(args)
+        return zip_file(*args, **kwargs)
+
+    monkeypatch.setattr(audb.core.memory.zipfile, "ZipFile", recording_zip_file)
+    deps = audb.dependencies(DB_NAME, version=version)
+    media = ["audio/001.wav", "audio/002.wav"]
+    assert deps.archive(media[0]) == deps.archive(media[1])
+    assert len(audb.read_media(DB_NAME, media, version=version)) == 2
+    assert len(opened) == 1
+
+
+def test_read_media_error(monkeypatch):
+    with pytest.raises(ValueError, match="non-existing.wav"):
+        audb.read_media(DB_NAME, ["non-existing.wav"])
+
+    def failing_get_file(self, src_path, *args, **kwargs):
+        raise FileNotFoundError(src_path)
+
+    audb.core.memory._archives.clear()
+    monkeypatch.setattr(audbackend.backend.FileSystem, "_get_file", failing_get_file)
+    with pytest.raises(audbackend.BackendError):
+        audb.read_media(DB_NAME, ["audio/001.wav"], version="1.0.0")
+
+    with pytest.raises(ValueError, match="Only audio files"):
+        monkeypatch.setattr(audb.Dependencies, "sampling_rate", lambda self, file: 0)
+        audb.read_media(DB_NAME, ["audio/001.wav"], version="1.0.0")
+
+
+def test_read_media_lru_cache():
+    cache = audb.core.memory._LRUCache(len, lambda: 4)
+    cache.put("a", b"12")
+    cache.put("b", b"3")
+    assert cache.get("a") == b"12"
+    cache.put("c", b"45")
+    # Least recently used entry is removed
+    assert cache.get("b") is None
+    assert cache.get("a") == b"12"
+    assert cache.get("c") == b"45"
+    # Entries larger than the cache are not stored
+    cache.put("d", b"12345")
+    assert cache.get("d") is None
+    # Existing entries are not replaced
+    cache.put("a", b"6")
+    assert cache.get("a") == b"12"
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+
+
 @pytest.mark.parametrize("pickle_tables", [True, False])
 @pytest.mark.parametrize("name, version, table", [(DB_NAME, "1.0.0", "emotion")])
 class TestLoadPickle:
@@ -993,3 +1192,359 @@ def test_repository(persistent_repository, name, version, error, error_msg):
     else:
         repository = audb.repository(name, version)
         assert repository == persistent_repository
+
+
+def test_load_to_resume(tmpdir, monkeypatch):
+    version = "1.0.0"
+    db_root = audeer.path(tmpdir, "raw")
+
+    # Interrupt download after first media archive
+    get_archive = audbackend.interface.Versioned.get_archive
+    media_archives = []
+
+    def interrupted_get_archive(self, src_path, *args, **kwargs):
+        if "/media/" in src_path:
+            if media_archives:
+                raise KeyboardInterrupt
+            media_archives.append(src_path)
+        return get_archive(self, src_path, *args, **kwargs)
+
+    monkeypatch.setattr(
+        audbackend.interface.Versioned,
+        "get_archive",
+        interrupted_get_archive,
+    )
+    with pytest.raises(KeyboardInterrupt):
+        audb.load_to(db_root, DB_NAME, version=version, verbose=False)
+    journal_file = audeer.path(db_root, audb.core.define.DOWNLOAD_JOURNAL_FILE)
+    assert os.path.exists(journal_file)
+    monkeypatch.undo()
+
+    # Media files of completely downloaded archives
+    # are not verified again
+    md5 = audb.core.utils.md5
+    checked_files = []
+
+    def counted_md5(path, *args, **kwargs):
+        checked_files.append(path)
+        return md5(path, *args, **kwargs)
+
+    monkeypatch.setattr(audb.core.utils, "md5", counted_md5)
+    db = audb.load_to(db_root, DB_NAME, version=version, verbose=False)
+    assert not any(file.endswith(".wav") for file in checked_files)
+    for file in db.files:
+        assert os.path.exists(audeer.path(db_root, file))
+    assert not os.path.exists(journal_file)
+
+
+@pytest.mark.parametrize("sampling_rate", [None, 8000])
+def test_load_parallel_extraction(tmpdir, monkeypatch, sampling_rate):
+    # If there are less archives than workers,
+    # the members of an archive are extracted in parallel
+    version = "1.0.0"
+    media = ["audio/001.wav", "audio/002.wav"]
+    deps = audb.dependencies(DB_NAME, version=version)
+    assert deps.archive(media[0]) == deps.archive(media[1])
+
+    get_archive = audb.core.utils.get_archive
+    calls = []
+
+    def recording_get_archive(backend_interface, src_path, *args, **kwargs):
+        if "/media/" in src_path:
+            calls.append(kwargs["num_workers"])
+        return get_archive(backend_interface, src_path, *args, **kwargs)
+
+    monkeypatch.setattr(audb.core.utils, "get_archive", recording_get_archive)
+
+    db = audb.load(
+        DB_NAME,
+        version=version,
+        media=media,
+        sampling_rate=sampling_rate,
+        num_workers=4,
+        full_path=False,
+        verbose=False,
+    )
+    assert calls == [4]
+    assert list(db.files) == media
+    for file in db.files:
+        path = os.path.join(db.root, file)
+        assert os.path.exists(path)
+        if sampling_rate is not None:
+            assert audiofile.sampling_rate(path) == sampling_rate
+
+    # Same result as sequential extraction
+    db_root = audeer.path(tmpdir, "raw")
+    db_root_parallel = audeer.path(tmpdir, "raw-parallel")
+    remote = f"/{DB_NAME}/media/{deps.archive(media[0])}.zip"
+    backend_interface = audb.core.utils.lookup_backend(DB_NAME, version)
+    files = get_archive(
+        backend_interface,
+        remote,
+        audeer.mkdir(db_root),
+        version,
+        tmp_root=audeer.mkdir(tmpdir, "tmp"),
+    )
+    files_parallel = get_archive(
+        backend_interface,
+        remote,
+        audeer.mkdir(db_root_parallel),
+        version,
+        tmp_root=audeer.mkdir(tmpdir, "tmp"),
+        num_workers=4,
+    )
+    assert sorted(files_parallel) == sorted(files)
+    for file in files:
+        assert audb.core.utils.md5(
+            os.path.join(db_root_parallel, file)
+        ) == audb.core.utils.md5(os.path.join(db_root, file))
+
+
+@pytest.mark.parametrize("num_workers", [1, 4])
+def test_load_ranged_download(monkeypatch, num_workers):
+    # Record number of byte ranges of downloaded files
+    get_file = audbackend.interface.Versioned.get_file
+    parts = {}
+
+    def recording_get_file(self, src_path, *args, **kwargs):
+        parts[src_path] = kwargs.get("num_workers", 1)
+        return get_file(self, src_path, *args, **kwargs)
+
+    monkeypatch.setattr(audbackend.interface.Versioned, "get_file", recording_get_file)
+
+    db = audb.load(
+        DB_NAME,
+        version="1.0.0",
+        media=["audio/001.wav"],
+        tables=["files"],
+        num_workers=num_workers,
+        verbose=False,
+    )
+    assert db["files"].get().shape[0] == 1
+    assert os.path.exists(db.files[0])
+    media = [path for path in parts if "/media/" in path]
+    tables = [path for path in parts if "/meta/" in path]
+    if num_workers == 1:
+        # Archives are extracted while streamed
+        assert media == []
+        assert tables == []
+    else:
+        assert [parts[path] for path in media] == [num_workers]
+        assert len(tables) == 2
+
+
+@pytest.mark.parametrize(
+    "order",
+    [
+        None,
+        "table",
+        "smallest-first",
+        lambda file: file != "audio/004.wav",
+    ],
+)
+def test_load_order(monkeypatch, order):
+    version = "1.0.0"
+    deps = audb.dependencies(DB_NAME, version=version)
+
+    # Record order of downloaded archives
+    get_archive = audbackend.interface.Versioned.get_archive
+    archives = []
+
+    def recording_get_archive(self, src_path, *args, **kwargs):
+        if "/media/" in src_path:
+            archives.append(os.path.basename(src_path)[:-4])
+        return get_archive(self, src_path, *args, **kwargs)
+
+    monkeypatch.setattr(
+        audbackend.interface.Versioned,
+        "get_archive",
+        recording_get_archive,
+    )
+
+    paths = []
+    db = audb.load(
+        DB_NAME,
+        version=version,
+        order=order,
+        media_callback=paths.append,
+        full_path=False,
+        verbose=False,
+    )
+    assert sorted(paths) == sorted([os.path.join(db.root, file) for file in db.files])
+    assert sorted(archives) == sorted(set(deps.archive(file) for file in db.files))
+
+    if order == "table":
+        expected = list(dict.fromkeys([deps.archive(file) for file in db.files]))
+        assert archives == expected
+    elif order == "smallest-first":
+        sizes = audb.core.load._archive_sizes(deps)
+        sizes = [sizes[(archive, version)] for archive in archives]
+        assert sizes == sorted(sizes)
+    elif order is not None:
+        assert archives[0] == deps.archive("audio/004.wav")
+
+
+def test_load_order_table(tmpdir, monkeypatch, repository):
+    # Archives are downloaded in the order
+    # of the rows of the tables,
+    # which is different from the sorted order of db.files
+    name = "test_load_order_table"
+    version = "1.0.0"
+    db_root = audeer.mkdir(tmpdir, "db")
+    db = audformat.Database(name)
+    db.schemes["scheme"] = audformat.Scheme("int")
+    files = ["c.wav", "a.wav", "b.wav", "d.wav"]
+    db["table1"] = audformat.Table(audformat.filewise_index(files[:3]))
+    db["table1"]["column"] = audformat.Column(scheme_id="scheme")
+    db["table2"] = audformat.Table(audformat.filewise_index(files[3:]))
+    db["table2"]["column"] = audformat.Column(scheme_id="scheme")
+    for file in files:
+        audiofile.write(os.path.join(db_root, file), np.zeros((1, 8000)), 8000)
+    db.save(db_root)
+    audb.publish(db_root, version, repository, verbose=False)
+    deps = audb.dependencies(name, version=version)
+
+    get_archive = audbackend.interface.Versioned.get_archive
+    archives = []
+
+    def recording_get_archive(self, src_path, *args, **kwargs):
+        if "/media/" in src_path:
+            archives.append(os.path.basename(src_path)[:-4])
+        return get_archive(self, src_path, *args, **kwargs)
+
+    monkeypatch.setattr(
+        audbackend.interface.Versioned,
+        "get_archive",
+        recording_get_archive,
+    )
+
+    audb.load(name, version=version, order="table", verbose=False)
+    assert archives == [deps.archive(file) for file in files]
+
+
+def test_load_media_callback():
+    # Files copied from other cached version
+    db = audb.load(DB_NAME, version="1.0.0", verbose=False)
+    paths = []
+    db = audb.load(
+        DB_NAME,
+        version="1.1.0",
+        format="wav",
+        media_callback=paths.append,
+        verbose=False,
+    )
+    assert sorted(paths) == sorted(db.files)
+
+    # Files from completely cached database
+    paths = []
+    db = audb.load(
+        DB_NAME,
+        version="1.1.0",
+        format="wav",
+        media_callback=paths.append,
+        verbose=False,
+    )
+    assert sorted(paths) == sorted(db.files)
+
+    # Files partially in cache
+    paths = []
+    db = audb.load(
+        DB_NAME,
+        version="1.0.0",
+        media=["audio/001.wav", "audio/002.wav"],
+        sampling_rate=16000,
+        verbose=False,
+    )
+    db = audb.load(
+        DB_NAME,
+        version="1.0.0",
+        sampling_rate=16000,
+        media_callback=paths.append,
+        verbose=False,
+    )
+    assert sorted(paths) == sorted(db.files)
+
+
+def test_load_order_error():
+    error_msg = "Order 'largest-first' is not supported."
+    with pytest.raises(ValueError, match=error_msg):
+        audb.load(DB_NAME, version="1.0.0", order="largest-first")
+
+
+@pytest.mark.parametrize("full_path", [True, False])
+@pytest.mark.parametrize("format", [None, "flac"])
+def test_load_lazy_media(monkeypatch, full_path, format):
+    version = "1.0.0"
+
+    # Count downloaded archives
+    get_archive = audbackend.interface.Versioned.get_archive
+    archives = []
+
+    def recording_get_archive(self, src_path, *args, **kwargs):
+        if "/media/" in src_path:
+            archives.append(src_path)
+        return get_archive(self, src_path, *args, **kwargs)
+
+    monkeypatch.setattr(
+        audbackend.interface.Versioned,
+        "get_archive",
+        recording_get_archive,
+    )
+
+    db = audb.load(
+        DB_NAME,
+        version=version,
+        format=format,
+        full_path=full_path,
+        lazy_media=True,
+        verbose=False,
+    )
+    assert isinstance(db, audb.LazyDatabase)
+    assert archives == []
+    expected = audb.load(
+        DB_NAME,
+        version=version,
+        format=format,
+        full_path=full_path,
+        only_metadata=True,
+        verbose=False,
+    )
+    assert list(db.files) == list(expected.files)
+    for file in db.files:
+        path = file if full_path else os.path.join(db.root, file)
+        assert not os.path.exists(path)
+
+    # "audio/001.wav" and "audio/002.wav" are stored in the same archive,
+    # request them from several threads
+    files = list(db.files[:2]) * 5
+    with concurrent.futures.ThreadPoolExecutor(max_workers=10) as pool:
+        paths = list(pool.map(db.audb_path, files))
+    assert len(archives) == 1
+    for path in paths:
+        assert os.path.isabs(path)
+        assert os.path.exists(path)
+    if full_path:
+        assert paths[:2] == files[:2]
+
+    # Load remaining files
+    paths = [db.audb_path(file) for file in db.files]
+    deps = audb.dependencies(DB_NAME, version=version)
+    assert len(archives) == len({deps.archive(file) for file in deps.media})
+    assert all(os.path.exists(path) for path in paths)
+    assert len(archives) == len(set(archives))
+
+    with pytest.raises(ValueError, match="Could not find the media file"):
+        db.audb_path("non-existing.wav")
+
+
+def test_load_lazy_media_error(monkeypatch):
+    db = audb.load(DB_NAME, version="1.0.0", lazy_media=True, verbose=False)
+
+    # Lock could not be acquired
+    monkeypatch.setattr(db, "_load_media", lambda files: None)
+    with pytest.raises(RuntimeError, match="Lock could not be acquired"):
+        db.audb_path(db.files[0])
+
+    # Failed request can be repeated
+    monkeypatch.undo()
+    assert os.path.exists(db.audb_path(db.files[0]))
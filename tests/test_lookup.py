@@ -0,0 +1,247 @@
+import os
+
+import pytest
+
+import audbackend
+import audeer
+import audformat.testing
+
+import audb
+
+
+DB_NAME = "test_lookup"
+
+
+@pytest.fixture
+def versions(monkeypatch):
+    r"""Record requests listing versions of a database."""
+    calls = []
+    original_versions = audbackend.interface.Versioned.versions
+
+    def counted_versions(self, path, *args, **kwargs):
+        calls.append(path)
+        return original_versions(self, path, *args, **kwargs)
+
+    monkeypatch.setattr(audbackend.interface.Versioned, "versions", counted_versions)
+    return calls
+
+
+@pytest.fixture
+def exists(monkeypatch):
+    r"""Record requests checking if a database version exists."""
+    calls = []
+    original_exists = audbackend.interface.Versioned.exists
+
+    def counted_exists(self, path, *args, **kwargs):
+        if path.endswith("/db.yaml"):
+            calls.append(path)
+        return original_exists(self, path, *args, **kwargs)
+
+    monkeypatch.setattr(audbackend.interface.Versioned, "exists", counted_exists)
+    return calls
+
+
+def publish(tmpdir, repository, version):
+    r"""Publish minimal database."""
+    db_root = audeer.mkdir(tmpdir, version)
+    db = audformat.testing.create_db(minimal=True)
+    db.name = DB_NAME
+    db.save(db_root)
+    audb.publish(
+        db_root,
+        version,
+        repository,
+        previous_version=None,
+        verbose=False,
+    )
+
+
+def test_lookup(tmpdir, repository, exists):
+    publish(tmpdir, repository, "1.0.0")
+    entry = audeer.path(
+        audb.default_cache_root(),
+        ".lookup",
+        "repositories",
+        DB_NAME,
+        "1.0.0.json",
+    )
+    assert not os.path.exists(entry)
+
+    audb.load(DB_NAME, version="1.0.0", only_metadata=True, verbose=False)
+    assert os.path.exists(entry)
+    assert len(exists) == 1
+
+    # Repository is taken from cache
+    audb.load(DB_NAME, version="1.0.0", only_metadata=True, verbose=False)
+    assert audb.repository(DB_NAME, "1.0.0") == repository
+    assert len(exists) == 1
+
+    # Entries are ignored for other repositories
+    other_host = audeer.mkdir(tmpdir, "other")
+    audeer.mkdir(other_host, "other")
+    other_repository = audb.Repository("other", other_host, "file-system")
+    audb.config.REPOSITORIES = [other_repository, repository]
+    assert audb.repository(DB_NAME, "1.0.0") == repository
+    assert len(exists) == 3
+
+
+def test_lookup_cache_root(tmpdir, repository, exists, monkeypatch):
+    publish(tmpdir, repository, "1.0.0")
+    lookup_root = audeer.path(audb.default_cache_root(), ".lookup")
+
+    # Look ups are stored in user cache folder,
+    # independent of cache_root
+    cache_root = audeer.mkdir(tmpdir, "cache")
+    audb.load(
+        DB_NAME,
+        version="1.0.0",
+        only_metadata=True,
+        cache_root=cache_root,
+        verbose=False,
+    )
+    assert os.path.exists(lookup_root)
+    assert not os.path.exists(audeer.path(cache_root, ".lookup"))
+    assert len(exists) == 1
+
+    # Look ups are not stored
+    # if the user cache folder cannot be written
+    audeer.rmdir(lookup_root)
+    mkdir = audeer.mkdir
+
+    def failing_mkdir(path, *args, **kwargs):
+        if ".lookup" in path:
+            raise PermissionError(path)
+        return mkdir(path, *args, **kwargs)
+
+    monkeypatch.setattr(audeer, "mkdir", failing_mkdir)
+    audb.repository(DB_NAME, "1.0.0")
+    audb.repository(DB_NAME, "1.0.0")
+    assert not os.path.exists(lookup_root)
+    assert len(exists) == 3
+    audb.core.lookup.remove_versions(DB_NAME)
+
+
+def test_lookup_not_found(tmpdir, repository, exists, monkeypatch):
+    publish(tmpdir, repository, "1.0.0")
+    error_msg = "Cannot find version '2.0.0' for database 'test_lookup'."
+    with pytest.raises(RuntimeError, match=error_msg):
+        audb.load(DB_NAME, version="2.0.0", verbose=False)
+    assert len(exists) == 1
+
+    # Failed look up is remembered
+    with pytest.raises(RuntimeError, match=error_msg):
+        audb.load(DB_NAME, version="2.0.0", verbose=False)
+    assert len(exists) == 1
+
+    # until it expires
+    with monkeypatch.context() as m:
+        m.setattr(audb.config, "LOOKUP_TTL", 0)
+        with pytest.raises(RuntimeError, match=error_msg):
+            audb.load(DB_NAME, version="2.0.0", verbose=False)
+    assert len(exists) > 1
+
+    # or the version is published
+    publish(tmpdir, repository, "2.0.0")
+    db = audb.load(DB_NAME, version="2.0.0", only_metadata=True, verbose=False)
+    assert db.name == DB_NAME
+
+
+def test_lookup_unreachable(tmpdir, repository, monkeypatch):
+    publish(tmpdir, repository, "1.0.0")
+    entry = audeer.path(
+        audb.default_cache_root(),
+        ".lookup",
+        "repositories",
+        DB_NAME,
+        "1.0.0.json",
+    )
+
+    def failing_exists(self, *args, **kwargs):
+        raise audbackend.BackendError(ConnectionError())
+
+    # Failed look up is not remembered
+    # if repository cannot be reached
+    with monkeypatch.context() as m:
+        m.setattr(audbackend.interface.Versioned, "exists", failing_exists)
+        with pytest.raises(RuntimeError):
+            audb.load(DB_NAME, version="1.0.0", verbose=False)
+    assert not os.path.exists(entry)
+
+    audb.load(DB_NAME, version="1.0.0", only_metadata=True, verbose=False)
+    assert os.path.exists(entry)
+
+    # Look up is repeated
+    # if repository from cache cannot be opened
+    original_open = audbackend.backend.FileSystem.open
+    calls = []
+
+    def failing_open(self):
+        calls.append(self)
+        if len(calls) == 1:
+            raise audbackend.BackendError(ConnectionError())
+        return original_open(self)
+
+    monkeypatch.setattr(audbackend.backend.FileSystem, "open", failing_open)
+    assert audb.core.utils.lookup_backend(DB_NAME, "1.0.0") is not None
+    assert len(calls) == 2
+
+
+def test_versions(tmpdir, repository, versions, monkeypatch):
+    publish(tmpdir, repository, "1.0.0")
+    versions.clear()
+    assert audb.versions(DB_NAME) == ["1.0.0"]
+    assert len(versions) == 1
+
+    # Versions are taken from cache
+    assert audb.versions(DB_NAME) == ["1.0.0"]
+    assert audb.latest_version(DB_NAME) == "1.0.0"
+    assert len(versions) == 1
+
+    # unless refresh is requested
+    assert audb.latest_version(DB_NAME, refresh=True) == "1.0.0"
+    assert len(versions) == 2
+
+    # or they expire
+    with monkeypatch.context() as m:
+        m.setattr(audb.config, "VERSIONS_TTL", 0)
+        assert audb.versions(DB_NAME) == ["1.0.0"]
+    assert len(versions) == 3
+
+    # Publishing a version removes them from cache
+    publish(tmpdir, repository, "2.0.0")
+    versions.clear()
+    assert audb.versions(DB_NAME) == ["1.0.0", "2.0.0"]
+    assert len(versions) == 1
+
+
+def test_versions_offline(tmpdir, repository, versions, monkeypatch):
+    publish(tmpdir, repository, "1.0.0")
+    publish(tmpdir, repository, "2.0.0")
+    audb.load(DB_NAME, version="1.0.0", only_metadata=True, verbose=False)
+    assert audb.versions(DB_NAME) == ["1.0.0", "2.0.0"]
+    versions.clear()
+
+    monkeypatch.setattr(audb.config, "OFFLINE", True)
+    monkeypatch.setattr(audb.config, "VERSIONS_TTL", 0)
+    # Stored versions are used regardless of their age
+    assert audb.versions(DB_NAME) == ["1.0.0", "2.0.0"]
+    # Without stored versions,
+    # versions found in cache are used
+    audb.core.lookup.remove_versions(DB_NAME)
+    assert audb.versions(DB_NAME) == ["1.0.0"]
+    assert audb.latest_version(DB_NAME, refresh=True) == "1.0.0"
+    assert versions == []
+
+
+def test_versions_unreachable(tmpdir, repository, monkeypatch):
+    publish(tmpdir, repository, "1.0.0")
+
+    def failing_versions(self, *args, **kwargs):
+        raise audbackend.BackendError(ConnectionError())
+
+    # Versions are not stored
+    # if repository cannot be reached
+    with monkeypatch.context() as m:
+        m.setattr(audbackend.interface.Versioned, "versions", failing_versions)
+        assert audb.versions(DB_NAME) == []
+    assert audb.versions(DB_NAME) == ["1.0.0"]
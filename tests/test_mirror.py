@@ -0,0 +1,185 @@
+import concurrent.futures
+import os
+import time
+
+import pytest
+
+import audbackend
+import audeer
+import audformat.testing
+
+import audb
+
+
+DB_NAME = "test_mirror"
+
+
+@pytest.fixture
+def upstream(tmpdir, repository):
+    r"""Repository with a published database."""
+    db_root = audeer.mkdir(tmpdir, "db")
+    db = audformat.testing.create_db(minimal=True)
+    db.name = DB_NAME
+    audformat.testing.add_table(db, "table", "filewise", num_files=3)
+    db.save(db_root)
+    audformat.testing.create_audio_files(db)
+    audb.publish(db_root, "1.0.0", repository, verbose=False)
+    return repository
+
+
+@pytest.fixture
+def mirror(tmpdir, upstream, monkeypatch):
+    r"""Mirror of upstream repository as only repository."""
+    monkeypatch.setitem(
+        audb.Repository.backend_registry,
+        "mirror",
+        audb.Mirror.of(upstream),
+    )
+    repository = audb.Repository("mirror", audeer.path(tmpdir, "mirror"), "mirror")
+    monkeypatch.setattr(audb.config, "REPOSITORIES", [repository])
+    return repository
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    r"""Record files downloaded from upstream repository."""
+    calls = []
+    get_file = audbackend.backend.FileSystem._get_file
+
+    def recorded_get_file(self, src_path, *args):
+        if not isinstance(self, audb.Mirror):
+            calls.append(src_path)
+        return get_file(self, src_path, *args)
+
+    monkeypatch.setattr(audbackend.backend.FileSystem, "_get_file", recorded_get_file)
+    return calls
+
+
+def test_mirror(tmpdir, mirror, downloads):
+    db = audb.load(DB_NAME, version="1.0.0", verbose=False)
+    assert len(db.files) == 3
+    mirrored_files = [
+        file
+        for file in audeer.list_file_names(
+            audeer.path(mirror.host, mirror.name),
+            recursive=True,
+        )
+        if "/.locks/" not in file
+    ]
+    # Header, dependency table, table and media archives
+    assert len(mirrored_files) == 6
+    assert len(downloads) == 6
+
+    # Files are served from mirror
+    audb.config.CACHE_ROOT = audeer.mkdir(tmpdir, "other-cache")
+    audb.load(DB_NAME, version="1.0.0", verbose=False)
+    audb.read_media(DB_NAME, "audio/001.wav", version="1.0.0")
+    assert len(downloads) == 6
+
+    # Publishing through the mirror
+    # uploads to the upstream repository
+    db_root = audeer.mkdir(tmpdir, "db-2.0.0")
+    audb.load_to(db_root, DB_NAME, version="1.0.0", verbose=False)
+    audb.publish(db_root, "2.0.0", mirror, verbose=False)
+    assert audb.versions(DB_NAME) == ["1.0.0", "2.0.0"]
+    audb.config.REPOSITORIES = [mirror.backend_registry["mirror"].upstream]
+    assert audb.versions(DB_NAME, refresh=True) == ["1.0.0", "2.0.0"]
+
+
+def test_mirror_backend(mirror):
+    backend_interface = mirror.create_backend_interface()
+    media_path = f"/{DB_NAME}/1.0.0/db.yaml"
+    with backend_interface.backend as backend:
+        upstream_backend = backend._upstream
+        # Not yet mirrored
+        assert backend.exists(media_path)
+        assert backend.checksum(media_path) == upstream_backend.checksum(media_path)
+        assert backend._size(media_path) == upstream_backend._size(media_path)
+        assert backend.date(media_path) == upstream_backend.date(media_path)
+        assert backend.owner(media_path) == upstream_backend.owner(media_path)
+        assert backend.ls(f"/{DB_NAME}/") == upstream_backend.ls(f"/{DB_NAME}/")
+        # Mirrored
+        data = b"".join(backend._get_file_stream(media_path))
+        assert data == b"".join(upstream_backend._get_file_stream(media_path))
+        assert backend.checksum(media_path) == upstream_backend.checksum(media_path)
+        assert backend._size(media_path) == upstream_backend._size(media_path)
+        assert b"".join(backend._get_file_stream("/catalog.json")) == b"".join(
+            upstream_backend._get_file_stream("/catalog.json")
+        )
+
+        # Changed files are removed from mirror
+        backend.copy_file(media_path, f"/{DB_NAME}/1.0.1/db.yaml")
+        backend.move_file(f"/{DB_NAME}/1.0.1/db.yaml", f"/{DB_NAME}/1.0.2/db.yaml")
+        backend.remove_file(media_path)
+        assert not backend.exists(media_path)
+        assert not os.path.exists(backend._expand(media_path))
+        assert backend.exists(f"/{DB_NAME}/1.0.2/db.yaml")
+        assert upstream_backend.opened
+    assert not upstream_backend.opened
+
+
+def test_mirror_concurrent_downloads(mirror, monkeypatch):
+    backend_interface = mirror.create_backend_interface()
+    path = f"/{DB_NAME}/db.yaml"
+    get_file = audbackend.backend.FileSystem._get_file
+    calls = []
+
+    def slow_get_file(self, src_path, *args):
+        if not isinstance(self, audb.Mirror):
+            calls.append(src_path)
+            time.sleep(0.2)
+        return get_file(self, src_path, *args)
+
+    monkeypatch.setattr(audbackend.backend.FileSystem, "_get_file", slow_get_file)
+
+    def job(n):
+        return backend_interface.get_file(path, f"{mirror.host}-{n}.yaml", "1.0.0")
+
+    with backend_interface.backend:
+        with concurrent.futures.ThreadPoolExecutor(4) as pool:
+            files = list(pool.map(job, range(4)))
+    assert calls == [f"/{DB_NAME}/1.0.0/db.yaml"]
+    assert all(os.path.exists(file) for file in files)
+
+
+def test_mirror_lock(mirror, monkeypatch):
+    # Lock file left by a killed process
+    # does not block downloads
+    monkeypatch.setattr(audb.core.define, "TIMEOUT", 1)
+    root = audeer.path(mirror.host, mirror.name)
+    lock_file = audeer.path(root, ".locks", DB_NAME, "1.0.0", "db.yaml.lock")
+    audeer.touch(audeer.mkdir(os.path.dirname(lock_file)), "db.yaml.lock")
+    db = audb.load(DB_NAME, version="1.0.0", only_metadata=True, verbose=False)
+    assert db.name == DB_NAME
+    # Lock files are not stored next to mirrored files
+    files = audeer.list_file_names(root, recursive=True, hidden=True)
+    files = [file for file in files if "/.locks/" not in file]
+    # Header, dependency table and table
+    assert len(files) == 3
+    assert not any(file.endswith(".lock") for file in files)
+
+
+def test_mirror_errors(mirror, monkeypatch):
+    with pytest.raises(ValueError, match="No upstream repository"):
+        audb.Mirror("host", "repository")
+
+    backend_interface = mirror.create_backend_interface()
+    with backend_interface.backend as backend:
+        # Failed download leaves no file in mirror
+        with pytest.raises(audbackend.BackendError):
+            backend.get_file(f"/{DB_NAME}/9.0.0/db.yaml", "db.yaml")
+        files = audeer.list_file_names(backend._root, recursive=True)
+        assert [file for file in files if "/.locks/" not in file] == []
+
+    # Upstream repository cannot be opened
+    missing = audb.Repository("missing", "missing-host", "file-system")
+    monkeypatch.setitem(
+        audb.Repository.backend_registry,
+        "mirror",
+        audb.Mirror.of(missing),
+    )
+    backend_interface = mirror.create_backend_interface()
+    with backend_interface.backend as backend:
+        with pytest.raises(audbackend.BackendError) as ex:
+            backend.exists(f"/{DB_NAME}/1.0.0/db.yaml")
+        assert isinstance(ex.value.exception, FileNotFoundError)
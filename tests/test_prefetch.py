@@ -0,0 +1,132 @@
+import concurrent.futures
+import threading
+
+import pytest
+
+import audbackend
+import audformat
+import audformat.testing
+
+import audb
+
+
+DB_NAME = "test_prefetch"
+DB_VERSION = "1.0.0"
+
+
+@pytest.fixture(
+    scope="module",
+    autouse=True,
+)
+def db(tmpdir_factory, persistent_repository):
+    r"""Publish a single database."""
+    db_root = tmpdir_factory.mktemp(DB_VERSION)
+    db = audformat.testing.create_db(minimal=True)
+    db.name = DB_NAME
+    audformat.testing.add_table(db, "table1", "filewise", num_files=[0, 1, 2])
+    audformat.testing.add_table(db, "table2", "filewise", num_files=[3, 4])
+    db.save(db_root)
+    audformat.testing.create_audio_files(db)
+    audb.publish(db_root, DB_VERSION, persistent_repository, verbose=False)
+    return db
+
+
+@pytest.mark.parametrize(
+    "tables, expected_files",
+    [
+        (None, 5),
+        ("table2", 2),
+    ],
+)
+def test_prefetch(tables, expected_files):
+    finished = []
+    request = audb.prefetch(
+        DB_NAME,
+        version=DB_VERSION,
+        tables=tables,
+        sampling_rate=8000,
+    )
+    request.add_done_callback(finished.append)
+    db = request.result()
+    assert request.done()
+    assert not request.cancelled()
+    assert request.exception() is None
+    assert request.progress == 1.0
+    assert finished == [request]
+    assert len(db.files) == expected_files
+
+    # Load from cache
+    expected = audb.load(
+        DB_NAME,
+        version=DB_VERSION,
+        tables=tables,
+        sampling_rate=8000,
+        verbose=False,
+    )
+    assert db == expected
+    assert list(db.files) == list(expected.files)
+
+    # Request is already finished
+    assert not request.cancel()
+
+
+def test_prefetch_cancel(monkeypatch):
+    started = threading.Event()
+    cancelled = threading.Event()
+    get_archive = audbackend.interface.Versioned.get_archive
+
+    def blocking_get_archive(self, src_path, *args, **kwargs):
+        if "/media/" in src_path:
+            started.set()
+            cancelled.wait()
+        return get_archive(self, src_path, *args, **kwargs)
+
+    monkeypatch.setattr(
+        audbackend.interface.Versioned,
+        "get_archive",
+        blocking_get_archive,
+    )
+
+    request = audb.prefetch(DB_NAME, version=DB_VERSION)
+    started.wait()
+    assert not request.done()
+    assert request.progress == 0.0
+    assert request.cancel()
+    cancelled.set()
+
+    with pytest.raises(concurrent.futures.CancelledError):
+        request.result()
+    with pytest.raises(concurrent.futures.CancelledError):
+        request.exception()
+    assert request.done()
+    assert request.cancelled()
+    assert request.progress == 0.0
+
+
+def test_prefetch_cancel_pending(monkeypatch):
+    # Block the executor to cancel a request before it starts
+    blocked = threading.Event()
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    executor.submit(blocked.wait)
+    monkeypatch.setattr(audb.core.prefetch, "_get_executor", lambda: executor)
+
+    request = audb.prefetch(DB_NAME, version=DB_VERSION)
+    assert request.cancel()
+    assert request.cancelled()
+    assert request.done()
+    blocked.set()
+    executor.shutdown()
+
+
+def test_prefetch_error():
+    request = audb.prefetch(DB_NAME, version=DB_VERSION, media="non-existing")
+    assert isinstance(request.exception(), ValueError)
+    assert request.progress == 0.0
+    with pytest.raises(ValueError):
+        request.result()
+
+
+def test_prefetch_timeout(monkeypatch):
+    monkeypatch.setattr(audb.core.prefetch, "load", lambda *args, **kwargs: None)
+    request = audb.prefetch(DB_NAME, version=DB_VERSION)
+    assert request.result() is None
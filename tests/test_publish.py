@@ -2,10 +2,14 @@ import filecmp
 import os
 import re
 import shutil
+import time
+import types
+import zipfile
 
 import numpy as np
 import pandas as pd
 import pytest
+import soundfile
 
 import audbackend
 import audeer
@@ -470,6 +474,50 @@ def test_publish(tmpdir, dbs, persistent_repository, version):
             assert deps.sampling_rate(file) == audiofile.sampling_rate(path)
 
 
+def test_publish_archives_auto(tmpdir, repository, monkeypatch):
+    name = "test_publish_archives_auto"
+    db_root = audeer.mkdir(tmpdir, "db")
+    files = [f"a/{n}.wav" for n in range(4)] + [f"b/{n}.wav" for n in range(2)]
+    audeer.mkdir(db_root, "a")
+    audeer.mkdir(db_root, "b")
+    for file in files:
+        audiofile.write(audeer.path(db_root, file), np.zeros((1, 1000)), 8000)
+    size = os.path.getsize(audeer.path(db_root, files[0]))
+    db = audformat.Database(name)
+    db["table"] = audformat.Table(audformat.filewise_index(files))
+    db.save(db_root)
+
+    # Files of a folder are split into archives
+    # holding two files each
+    monkeypatch.setattr(audb.config, "ARCHIVE_SIZE", 2 * size)
+    deps = audb.publish(db_root, "1.0.0", repository, archives="auto", verbose=False)
+    archives = [deps.archive(file) for file in files]
+    assert archives[0] == archives[1]
+    assert archives[2] == archives[3]
+    assert archives[4] == archives[5]
+    assert len(set(archives)) == 3
+    assert archives[0] == audeer.uid(from_string="a/0.wav")
+
+    # Archives of existing files are preserved
+    audb.load_to(db_root, name, version="1.0.0", only_metadata=True, verbose=False)
+    new_files = ["a/4.wav", "b/2.wav"]
+    for file in new_files:
+        audiofile.write(audeer.path(db_root, file), np.zeros((1, 1000)), 8000)
+    db = audformat.Database.load(db_root)
+    db["table"].extend_index(audformat.filewise_index(new_files), inplace=True)
+    db.save(db_root)
+    deps = audb.publish(db_root, "2.0.0", repository, archives="auto", verbose=False)
+    assert [deps.archive(file) for file in files] == archives
+    assert [deps.version(file) for file in files] == ["1.0.0"] * 6
+    assert deps.archive("a/4.wav") not in archives
+    assert deps.archive("b/2.wav") not in archives
+    assert deps.version("a/4.wav") == "2.0.0"
+
+    error_msg = "'archives' needs to be a dictionary or 'auto', but yours is 'all'."
+    with pytest.raises(ValueError, match=error_msg):
+        audb.publish(db_root, "3.0.0", repository, archives="all")
+
+
 def test_publish_attachment(tmpdir, repository):
     # Create database (path does not need to exist)
     file_path = "attachments/file.txt"
@@ -1183,6 +1231,313 @@ def test_publish_error_version(tmpdir, repository):
         audb.publish(db_path, "2.0.0", repository, previous_version="1.0.0?")
 
 
+@pytest.mark.parametrize(
+    "compression, expected",
+    [
+        (None, {"wav": zipfile.ZIP_DEFLATED, "flac": zipfile.ZIP_STORED}),
+        ("store", {"wav": zipfile.ZIP_STORED, "flac": zipfile.ZIP_STORED}),
+        ("deflate", {"wav": zipfile.ZIP_DEFLATED, "flac": zipfile.ZIP_DEFLATED}),
+        ({"WAV": "store"}, {"wav": zipfile.ZIP_STORED, "flac": zipfile.ZIP_STORED}),
+    ],
+)
+def test_publish_compression(tmpdir, repository, compression, expected):
+    name = "test_publish_compression"
+    db_root = audeer.mkdir(tmpdir, "db")
+    signal = np.random.uniform(-1, 1, (1, 8000))
+    audiofile.write(audeer.path(db_root, "f1.wav"), signal, 8000)
+    audiofile.write(audeer.path(db_root, "f2.flac"), signal, 8000)
+    db = audformat.Database(name)
+    db["table"] = audformat.Table(audformat.filewise_index(["f1.wav", "f2.flac"]))
+    db.save(db_root)
+
+    audb.publish(
+        db_root,
+        "1.0.0",
+        repository,
+        archives={"f1.wav": "archive", "f2.flac": "archive"},
+        compression=compression,
+        verbose=False,
+    )
+    archive = audeer.path(
+        repository.host,
+        repository.name,
+        name,
+        "media",
+        "1.0.0",
+        "archive.zip",
+    )
+    with zipfile.ZipFile(archive) as zf:
+        compress_types = {
+            audeer.file_extension(info.filename): info.compress_type
+            for info in zf.infolist()
+        }
+    assert compress_types == expected
+
+    # Archives are extracted
+    # independent of compression
+    for num_workers in [1, 2]:
+        audb.config.CACHE_ROOT = audeer.mkdir(tmpdir, "cache", str(num_workers))
+        db = audb.load(name, version="1.0.0", num_workers=num_workers, verbose=False)
+        for file in db.files:
+            assert filecmp.cmp(file, audeer.path(db_root, os.path.basename(file)))
+
+
+def test_publish_compression_error(tmpdir, repository):
+    error_msg = (
+        "Compression must be one of ['deflate', 'store'], "
+        "but 'zstd' was provided for format 'wav'."
+    )
+    with pytest.raises(ValueError, match=re.escape(error_msg)):
+        audb.publish(tmpdir, "1.0.0", repository, compression={"wav": "zstd"})
+
+
+def test_publish_media_header(tmpdir, repository, monkeypatch):
+    # Header of media file is read once
+    db_root = audeer.mkdir(tmpdir, "db")
+    files = ["f.wav", "f.flac", "f.ogg", "f-float.wav", "f-broken.wav"]
+    signal = np.random.uniform(-1, 1, (2, 8000))
+    for file in files[:3]:
+        audiofile.write(audeer.path(db_root, file), signal, 16000, bit_depth=24)
+    audiofile.write(audeer.path(db_root, files[3]), signal, 16000, bit_depth=32)
+    audeer.touch(db_root, files[4])
+    db = audformat.Database("test_publish_media_header")
+    db["table"] = audformat.Table(audformat.filewise_index(files))
+    db.save(db_root)
+
+    info = soundfile.info
+    calls = []
+
+    def recorded_info(file, *args, **kwargs):
+        calls.append(file)
+        return info(file, *args, **kwargs)
+
+    expected = {
+        file: (
+            audiofile.bit_depth(audeer.path(db_root, file)) or 0,
+            audiofile.channels(audeer.path(db_root, file)),
+            audiofile.duration(audeer.path(db_root, file), sloppy=True),
+            audiofile.sampling_rate(audeer.path(db_root, file)),
+        )
+        for file in files[:4]
+    }
+    expected[files[4]] = (0, 0, 0.0, 0)
+    monkeypatch.setattr(soundfile, "info", recorded_info)
+    deps = audb.publish(db_root, "1.0.0", repository, verbose=False)
+    for file in files[:4]:
+        assert calls.count(audeer.path(db_root, file)) == 1
+    # Unreadable header is passed on to audiofile
+    assert calls.count(audeer.path(db_root, files[4])) > 1
+    for file in files:
+        assert (
+            deps.bit_depth(file),
+            deps.channels(file),
+            deps.duration(file),
+            deps.sampling_rate(file),
+        ) == expected[file]
+
+
+def test_publish_media_header_unsupported(tmpdir, repository, monkeypatch):
+    # Format not supported by libsndfile
+    # is read with audiofile
+    db_root = audeer.mkdir(tmpdir, "db")
+    file = "f.ogg"
+    path = audeer.path(db_root, file)
+    audiofile.write(path, np.zeros((2, 8000)), 16000)
+    db = audformat.Database("test_publish_media_header_unsupported")
+    db["table"] = audformat.Table(audformat.filewise_index([file]))
+    db.save(db_root)
+
+    def failing_info(file):
+        raise soundfile.LibsndfileError(1, prefix="Error opening: ")
+
+    monkeypatch.setattr(
+        audb.core.publish,
+        "soundfile",
+        types.SimpleNamespace(info=failing_info, LibsndfileError=RuntimeError),
+    )
+    deps = audb.publish(db_root, "1.0.0", repository, verbose=False)
+    assert deps.bit_depth(file) == 0
+    assert deps.channels(file) == 2
+    assert deps.duration(file) == audiofile.duration(path, sloppy=True)
+    assert deps.sampling_rate(file) == 16000
+
+
+def test_publish_pipeline(tmpdir, repository, monkeypatch):
+    # Archives are uploaded
+    # while other media files are still scanned
+    db_root = audeer.mkdir(tmpdir, "db")
+    db = audformat.testing.create_db(minimal=True)
+    db.name = "test_publish_pipeline"
+    audformat.testing.add_table(db, "table", "filewise", num_files=10)
+    db.save(db_root)
+    audformat.testing.create_audio_files(db)
+
+    events = []
+    md5 = audeer.md5
+    put_archive = audb.core.utils.put_archive
+
+    def recorded_md5(file, *args, **kwargs):
+        if file.endswith(".wav"):
+            time.sleep(0.02)
+            events.append("scan")
+        return md5(file, *args, **kwargs)
+
+    def recorded_put_archive(backend_interface, src_root, dst_path, *args, **kwargs):
+        if "/media/" in dst_path:
+            events.append("put")
+        return put_archive(backend_interface, src_root, dst_path, *args, **kwargs)
+
+    monkeypatch.setattr(audeer, "md5", recorded_md5)
+    monkeypatch.setattr(audb.core.utils, "put_archive", recorded_put_archive)
+    deps = audb.publish(db_root, "1.0.0", repository, verbose=False)
+    assert events.count("scan") == 10
+    assert events.count("put") == 10
+    assert events.index("put") < len(events) - events[::-1].index("scan") - 1
+    assert all(deps.version(file) == "1.0.0" for file in db.files)
+
+    # Failed upload stops publication
+    def failing_put_archive(backend_interface, src_root, dst_path, *args, **kwargs):
+        if "/media/" in dst_path:
+            raise audbackend.BackendError(ConnectionError())
+        return put_archive(backend_interface, src_root, dst_path, *args, **kwargs)
+
+    monkeypatch.setattr(audb.core.utils, "put_archive", failing_put_archive)
+    audiofile.write(audeer.path(db_root, db.files[0]), np.ones((1, 100)), 8000)
+    with pytest.raises(audbackend.BackendError):
+        audb.publish(db_root, "2.0.0", repository, verbose=False)
+    assert audb.versions(db.name) == ["1.0.0"]
+
+
+def test_publish_header_error(tmpdir, repository, monkeypatch):
+    # Failed upload of header stops publication
+    db_root = audeer.mkdir(tmpdir, "db")
+    db = audformat.testing.create_db(minimal=True)
+    db.name = "test_publish_header_error"
+    db.save(db_root)
+    put_file = audbackend.interface.Versioned.put_file
+
+    def failing_put_file(self, src_path, dst_path, version, *args, **kwargs):
+        put_file(self, src_path, dst_path, version, *args, **kwargs)
+        if dst_path.endswith("/db.yaml"):
+            raise audbackend.BackendError(ConnectionError())
+
+    monkeypatch.setattr(audbackend.interface.Versioned, "put_file", failing_put_file)
+    with pytest.raises(audbackend.BackendError):
+        audb.publish(db_root, "1.0.0", repository, verbose=False)
+    assert audb.versions(db.name) == []
+
+
+def test_publish_resume(tmpdir, repository, monkeypatch):
+    # Rerunning an interrupted publication
+    # does not upload finished files again
+    db_root = audeer.mkdir(tmpdir, "db")
+    db = audformat.testing.create_db(minimal=True)
+    db.name = "test_publish_resume"
+    audformat.testing.add_table(db, "table", "filewise", num_files=5)
+    db.attachments["file"] = audformat.Attachment("extra/file.txt")
+    audeer.touch(audeer.mkdir(db_root, "extra"), "file.txt")
+    db.save(db_root, storage_format="csv")
+    audformat.testing.create_audio_files(db)
+    # Set modification time back,
+    # so that checksums are stored
+    past = time.time() - 3600
+    for file in audeer.list_file_names(db_root, recursive=True):
+        os.utime(file, (past, past))
+    journal_file = audeer.path(db_root, ".upload")
+
+    uploads = []
+    put_archive = audb.core.utils.put_archive
+
+    def failing_put_archive(backend_interface, src_root, dst_path, *args, **kwargs):
+        if dst_path.endswith(f"{db.files[3]}.zip"):
+            raise audbackend.BackendError(ConnectionError())
+        uploads.append(dst_path)
+        return put_archive(backend_interface, src_root, dst_path, *args, **kwargs)
+
+    archives = {file: file for file in db.files}
+    monkeypatch.setattr(audb.core.utils, "put_archive", failing_put_archive)
+    with pytest.raises(audbackend.BackendError):
+        audb.publish(
+            db_root,
+            "1.0.0",
+            repository,
+            archives=archives,
+            num_workers=1,
+            verbose=False,
+        )
+    assert audb.versions(db.name) == []
+    assert sorted(uploads) == [
+        f"/{db.name}/attachment/file.zip",
+        f"/{db.name}/media/{db.files[0]}.zip",
+        f"/{db.name}/media/{db.files[1]}.zip",
+        f"/{db.name}/media/{db.files[2]}.zip",
+        f"/{db.name}/meta/table.zip",
+    ]
+    with open(journal_file) as fp:
+        entries = [line.split("\t")[:3] for line in fp.read().splitlines()]
+    assert sorted(entries) == [
+        ["attachment", "file", "1.0.0"],
+        ["media", db.files[0], "1.0.0"],
+        ["media", db.files[1], "1.0.0"],
+        ["media", db.files[2], "1.0.0"],
+        ["table", "table", "1.0.0"],
+    ]
+
+    # Uploaded files are skipped,
+    # unless they were removed from the backend
+    # or have changed
+    backend_interface = repository.create_backend_interface()
+    with backend_interface.backend:
+        backend_interface.remove_file(
+            f"/{db.name}/media/{db.files[0]}.zip",
+            "1.0.0",
+        )
+    audiofile.write(audeer.path(db_root, db.files[1]), np.ones((1, 100)), 8000)
+    uploads.clear()
+
+    # Checksums are stored for interrupted publication,
+    # and only calculated for the changed file
+    assert os.path.exists(audeer.path(db_root, ".checksums.parquet"))
+    md5 = audeer.md5
+    hashed = []
+
+    def recorded_md5(file, *args, **kwargs):
+        if file.endswith(".wav"):
+            hashed.append(file)
+        return md5(file, *args, **kwargs)
+
+    monkeypatch.setattr(audeer, "md5", recorded_md5)
+
+    def recorded_put_archive(backend_interface, src_root, dst_path, *args, **kwargs):
+        uploads.append(dst_path)
+        return put_archive(backend_interface, src_root, dst_path, *args, **kwargs)
+
+    monkeypatch.setattr(audb.core.utils, "put_archive", recorded_put_archive)
+    deps = audb.publish(
+        db_root,
+        "1.0.0",
+        repository,
+        archives=archives,
+        num_workers=1,
+        verbose=False,
+    )
+    assert sorted(uploads) == [
+        f"/{db.name}/media/{db.files[0]}.zip",
+        f"/{db.name}/media/{db.files[1]}.zip",
+        f"/{db.name}/media/{db.files[3]}.zip",
+        f"/{db.name}/media/{db.files[4]}.zip",
+    ]
+    assert hashed == [audeer.path(db_root, db.files[1])]
+    assert not os.path.exists(journal_file)
+    assert audb.versions(db.name) == ["1.0.0"]
+    assert deps.tables == ["db.table.csv"]
+    assert sorted(deps.media) == sorted(db.files)
+    db = audb.load(db.name, version="1.0.0", verbose=False)
+    assert len(db.files) == 5
+    signal, _ = audiofile.read(db.files[1])
+    np.testing.assert_almost_equal(signal, np.ones(100), decimal=4)
+
+
 def test_publish_text_media_files(tmpdir, dbs, repository, storage_format):
     r"""Test publishing databases containing text files as media files."""
     # Create a database, containing text media file
@@ -105,6 +105,7 @@ def assert_db_published_to_repo(
         return audeer.path(repo, db.name, *args)
 
     expected_paths = [
+        audeer.path(repo, "catalog.json"),
         repo_path("1.0.0", dependency_file),
         repo_path("1.0.0", header_file),
     ]
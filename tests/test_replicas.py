@@ -0,0 +1,217 @@
+import os
+import shutil
+
+import pytest
+
+import audbackend
+import audeer
+import audformat.testing
+
+import audb
+from audb.core import replicas
+
+
+DB_NAME = "test_replicas"
+
+
+@pytest.fixture
+def replica(tmpdir, repository):
+    r"""Copy of repository with a published database."""
+    db_root = audeer.mkdir(tmpdir, "db")
+    db = audformat.testing.create_db(minimal=True)
+    db.name = DB_NAME
+    audformat.testing.add_table(db, "table", "filewise", num_files=4)
+    db.save(db_root)
+    audformat.testing.create_audio_files(db)
+    audb.publish(db_root, "1.0.0", repository, verbose=False)
+
+    replica = audb.Repository("replica", audeer.mkdir(tmpdir, "replica"), "file-system")
+    shutil.copytree(
+        audeer.path(repository.host, repository.name),
+        audeer.path(replica.host, replica.name),
+    )
+    audb.config.REPOSITORIES = [repository, replica]
+    audb.repository_statistics(reset=True)
+    yield replica
+    audb.repository_statistics(reset=True)
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    r"""Record repository of every downloaded media archive."""
+    calls = []
+    get_archive = audb.core.utils.get_archive
+
+    def recorded_get_archive(backend_interface, src_path, *args, **kwargs):
+        calls.append(backend_interface.backend.repository)
+        return get_archive(backend_interface, src_path, *args, **kwargs)
+
+    monkeypatch.setattr(audb.core.utils, "get_archive", recorded_get_archive)
+    return calls
+
+
+def test_fastest_replica(repository, replica, monkeypatch):
+    # First repository is selected by default
+    replicas.observe(repository, latency=10)
+    assert audb.repository(DB_NAME, "1.0.0") == repository
+
+    monkeypatch.setattr(audb.config, "FASTEST_REPLICA", True)
+    audb.repository_statistics(reset=True)
+    audb.repository(DB_NAME, "1.0.0")
+    assert audb.core.lookup.read_replicas(DB_NAME, "1.0.0") == [repository, replica]
+    with monkeypatch.context() as m:
+        m.setattr(audb.config, "LOOKUP_TTL", 0)
+        assert audb.core.lookup.read_replicas(DB_NAME, "1.0.0") is None
+    df = audb.repository_statistics()
+    assert list(df.index) == [
+        (repository.name, repository.host),
+        (replica.name, replica.host),
+    ]
+    assert df["latency"].notna().all()
+    assert df["throughput"].isna().all()
+    assert df["healthy"].all()
+
+    # Slower repository is not selected
+    replicas.observe(repository, latency=10)
+    assert audb.repository(DB_NAME, "1.0.0") == replica
+    db = audb.load(DB_NAME, version="1.0.0", verbose=False)
+    assert len(db.files) == 4
+
+    # Failed repository is not selected
+    replicas.fail(replica)
+    assert audb.repository(DB_NAME, "1.0.0") == repository
+    df = audb.repository_statistics(reset=True)
+    assert list(df["failures"]) == [0, 1]
+    assert list(df["healthy"]) == [True, False]
+    assert audb.repository_statistics().empty
+
+    # Remembered repositories are probed again
+    # if latency is unknown
+    assert audb.repository(DB_NAME, "1.0.0") in [repository, replica]
+    assert audb.repository_statistics()["latency"].notna().all()
+
+
+def test_fastest_replica_not_found(tmpdir, repository, replica, monkeypatch):
+    monkeypatch.setattr(audb.config, "FASTEST_REPLICA", True)
+    error_msg = f"Cannot find version '2.0.0' for database '{DB_NAME}'."
+    with pytest.raises(RuntimeError, match=error_msg):
+        audb.core.utils.lookup_backend(DB_NAME, "2.0.0")
+    # Failed look up is remembered
+    assert audb.core.lookup.read_repository(DB_NAME, "2.0.0") == (True, None)
+    with pytest.raises(RuntimeError, match=error_msg):
+        audb.core.utils.lookup_backend(DB_NAME, "2.0.0")
+
+    # Repositories are not remembered
+    # if a repository cannot be reached
+    missing = audb.Repository("missing", audeer.path(tmpdir, "missing"), "file-system")
+    audb.config.REPOSITORIES = [missing, repository]
+    assert audb.repository(DB_NAME, "1.0.0") == repository
+    assert audb.core.lookup.read_replicas(DB_NAME, "1.0.0") is None
+    assert not audb.repository_statistics().loc[missing.name, "healthy"].item()
+    with pytest.raises(RuntimeError, match=error_msg):
+        audb.core.utils.lookup_backend(DB_NAME, "2.0.0")
+    assert audb.core.lookup.read_repository(DB_NAME, "2.0.0") == (False, None)
+
+    # Remembered repositories cannot be opened
+    audb.config.REPOSITORIES = [repository, replica]
+    audb.repository(DB_NAME, "1.0.0")
+
+    def failing_open(self):
+        raise audbackend.BackendError(ConnectionError())
+
+    monkeypatch.setattr(audbackend.backend.FileSystem, "open", failing_open)
+    error_msg = "Cannot reach any repository"
+    with pytest.raises(RuntimeError, match=error_msg):
+        audb.core.utils.lookup_backend(DB_NAME, "1.0.0")
+
+
+def test_stripe_replicas(repository, replica, downloads, monkeypatch):
+    monkeypatch.setattr(audb.config, "STRIPE_REPLICAS", True)
+    # Replica has highest throughput
+    replicas.observe(repository, size=10_000_000, duration=1)
+    replicas.observe(replica, size=100_000_000, duration=1)
+    db = audb.load(DB_NAME, version="1.0.0", verbose=False)
+    assert len(db.files) == 4
+    assert downloads == ["replica"] * 4
+
+    # Missing archive is loaded from other repository
+    archive = audeer.list_file_names(
+        audeer.path(replica.host, replica.name, DB_NAME, "media", "1.0.0")
+    )[0]
+    os.remove(archive)
+    audb.config.CACHE_ROOT = audeer.mkdir(audb.config.CACHE_ROOT, "other")
+    downloads.clear()
+    db = audb.load(DB_NAME, version="1.0.0", verbose=False)
+    assert len(db.files) == 4
+    assert sorted(downloads) == ["data-unittests-local"] + ["replica"] * 4
+
+    # Unreachable repository is skipped
+    def failing_open(self):
+        if self.repository == replica.name:
+            raise audbackend.BackendError(ConnectionError())
+        return open(self)
+
+    audb.config.CACHE_ROOT = audeer.mkdir(audb.config.CACHE_ROOT, "other")
+    audb.core.utils.find_replicas(DB_NAME, "1.0.0")
+    open = audbackend.backend.FileSystem.open
+    monkeypatch.setattr(audbackend.backend.FileSystem, "open", failing_open)
+    downloads.clear()
+    db = audb.load(DB_NAME, version="1.0.0", verbose=False)
+    assert downloads == ["data-unittests-local"] * 4
+    assert not audb.repository_statistics().loc[replica.name, "healthy"].item()
+
+
+def test_stripe(repository, replica):
+    backend_interfaces = [
+        repository.create_backend_interface(),
+        replica.create_backend_interface(),
+    ]
+    stripe = replicas.Stripe(backend_interfaces)
+    assert len(stripe) == 2
+
+    # Downloads are distributed
+    # while others are in progress
+    used = []
+
+    def download(backend_interface):
+        used.append(backend_interface.backend.repository)
+        if len(used) == 1:
+            stripe.run(download, 100)
+        return backend_interface
+
+    stripe.run(download, 100)
+    assert used == [repository.name, replica.name]
+
+    # Replicas with unknown throughput
+    # are assumed to be as fast as the others
+    replicas.observe(repository, size=200_000_000, duration=1)
+    used = []
+    stripe.run(download, 100)
+    assert used == [repository.name, replica.name]
+
+    # Download is repeated on other replica
+    def failing_download(backend_interface):
+        used.append(backend_interface.backend.repository)
+        if backend_interface.backend.repository == repository.name:
+            raise audbackend.BackendError(ConnectionError())
+        return backend_interface
+
+    used = []
+    stripe.run(failing_download, 100)
+    assert used == [repository.name, replica.name]
+
+    # unless error is not related to repository
+    def invalid_download(backend_interface):
+        raise ValueError()
+
+    with pytest.raises(ValueError):
+        stripe.run(invalid_download, 100)
+
+    # Repositories are ranked by expected duration
+    audb.repository_statistics(reset=True)
+    assert replicas.rank([replica, repository]) == [replica, repository]
+    replicas.observe(repository, latency=0.1)
+    replicas.observe(repository, size=64_000_000, duration=1.1)
+    replicas.observe(replica, latency=0.01)
+    replicas.observe(replica, size=6_400_000, duration=1.01)
+    assert replicas.rank([replica, repository]) == [repository, replica]
@@ -0,0 +1,320 @@
+import os
+import tempfile
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+import audbackend
+import audeer
+import audformat.testing
+
+import audb
+from audb.core import define
+from audb.core.retry import call
+
+
+@pytest.fixture(autouse=True)
+def backend_config(monkeypatch):
+    """Disable backoff and reset statistics."""
+    monkeypatch.setattr(audb.config, "BACKEND_BACKOFF", 0)
+    audb.backend_statistics(reset=True)
+    yield
+    audb.backend_statistics(reset=True)
+
+
+class Flaky:
+    """Function failing for the first calls."""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self, value):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return value
+
+
+@pytest.mark.parametrize(
+    "error, retried",
+    [
+        (audbackend.BackendError(ConnectionError()), True),
+        (audbackend.BackendError(OSError("connection reset")), True),
+        (ConnectionError(), True),
+        (InterruptedError(), True),
+        (TimeoutError(), True),
+        (audbackend.BackendError(FileNotFoundError()), False),
+        (audbackend.BackendError(PermissionError()), False),
+        (RuntimeError(), False),
+        (ValueError(), False),
+    ],
+)
+def test_call_retry(error, retried):
+    func = Flaky([error])
+    if retried:
+        assert call(func, 1, operation="op") == 1
+        assert func.calls == 2
+    else:
+        with pytest.raises(type(error)):
+            call(func, 1, operation="op")
+        assert func.calls == 1
+    df = audb.backend_statistics()
+    assert df.loc["op", "requests"] == func.calls
+    assert df.loc["op", "retries"] == int(retried)
+    assert df.loc["op", "failures"] == int(not retried)
+
+
+def test_call_retry_error_code():
+    class S3Error(Exception):
+        code = "NoSuchKey"
+
+    func = Flaky([audbackend.BackendError(S3Error())])
+    with pytest.raises(audbackend.BackendError):
+        call(func, 1, operation="op")
+    assert func.calls == 1
+
+
+def test_call_retries_exhausted(monkeypatch):
+    monkeypatch.setattr(audb.config, "BACKEND_RETRIES", 2)
+    func = Flaky([ConnectionError()] * 3)
+    with pytest.raises(ConnectionError):
+        call(func, 1, operation="op")
+    assert func.calls == 3
+    df = audb.backend_statistics()
+    assert df.loc["op", "retries"] == 2
+    assert df.loc["op", "failures"] == 1
+
+
+def test_call_backoff(monkeypatch):
+    monkeypatch.setattr(audb.config, "BACKEND_BACKOFF", 0.5)
+    delays = []
+    monkeypatch.setattr(audb.core.retry.time, "sleep", lambda delay: None)
+    monkeypatch.setattr(
+        audb.core.retry.random,
+        "uniform",
+        lambda low, high: delays.append((low, high)) or high,
+    )
+    func = Flaky([ConnectionError()] * 2)
+    assert call(func, 1, operation="op") == 1
+    # Maximum delay is doubled with every retry,
+    # the actual delay is random
+    assert delays == [(0, 0.5), (0, 1.0)]
+
+
+def test_call_timeout(monkeypatch):
+    monkeypatch.setattr(audb.config, "BACKEND_RETRIES", 1)
+    monkeypatch.setattr(audb.config, "BACKEND_TIMEOUT", 0.05)
+    release = threading.Event()
+    calls = []
+
+    def func():
+        calls.append(None)
+        release.wait()
+
+    with pytest.raises(TimeoutError):
+        call(func, operation="op", concurrent=True)
+    release.set()
+    assert len(calls) == 2
+    df = audb.backend_statistics()
+    assert df.loc["op", "timeouts"] == 2
+    assert df.loc["op", "retries"] == 1
+
+    # Timeout is only applied to requests
+    # that can run concurrently
+    calls = []
+    assert call(func, operation="op") is None
+    assert len(calls) == 1
+
+
+def test_call_hedge(monkeypatch):
+    monkeypatch.setattr(audb.config, "BACKEND_HEDGE_PERCENTILE", 90)
+
+    # No hedging before enough requests are observed
+    for _ in range(define.HEDGE_MIN_REQUESTS):
+        call(lambda: None, operation="op", concurrent=True)
+    assert audb.backend_statistics().loc["op", "hedges"] == 0
+
+    # Slow request is duplicated,
+    # and the faster duplicate wins
+    release = threading.Event()
+    calls = []
+
+    def slow_first():
+        calls.append(None)
+        if len(calls) == 1:
+            release.wait()
+            return "first"
+        return "second"
+
+    discarded = []
+    result = call(
+        slow_first,
+        operation="op",
+        concurrent=True,
+        discard=discarded.append,
+    )
+    assert result == "second"
+    release.set()
+    # Result of abandoned attempt is discarded
+    while not discarded:
+        time.sleep(0.01)
+    assert discarded == ["first"]
+    df = audb.backend_statistics()
+    assert df.loc["op", "hedges"] == 1
+    assert df.loc["op", "hedge_wins"] == 1
+
+    # Slow request fails,
+    # while its duplicate succeeds
+    calls = []
+    failed = threading.Event()
+
+    def failing_first():
+        calls.append(None)
+        if len(calls) == 1:
+            time.sleep(0.1)
+            failed.set()
+            raise RuntimeError()
+        failed.wait()
+        return "second"
+
+    assert call(failing_first, operation="op", concurrent=True) == "second"
+
+    # Both attempts fail
+    def failing():
+        time.sleep(0.05)
+        raise RuntimeError()
+
+    with pytest.raises(RuntimeError):
+        call(failing, operation="op", concurrent=True)
+
+
+def test_backend_statistics():
+    df = audb.backend_statistics()
+    assert len(df) == 0
+    call(lambda: None, operation="b")
+    call(lambda: None, operation="a")
+    df = audb.backend_statistics(reset=True)
+    expected = pd.DataFrame(
+        {
+            "requests": [1, 1],
+            "retries": [0, 0],
+            "failures": [0, 0],
+            "timeouts": [0, 0],
+            "hedges": [0, 0],
+            "hedge_wins": [0, 0],
+        },
+        index=pd.Index(["a", "b"], name="operation"),
+    )
+    pd.testing.assert_frame_equal(df.iloc[:, :6], expected)
+    assert (df["p50"] >= 0).all()
+    assert (df["p99"] >= df["p50"]).all()
+    assert len(audb.backend_statistics()) == 0
+
+
+@pytest.mark.parametrize("timeout", [None, 60])
+def test_load_retry(tmpdir, monkeypatch, repository, timeout):
+    monkeypatch.setattr(audb.config, "BACKEND_TIMEOUT", timeout)
+    name = "test_load_retry"
+    version = "1.0.0"
+    db_root = audeer.mkdir(tmpdir, "db")
+    db = audformat.testing.create_db(minimal=True)
+    db.name = name
+    audformat.testing.add_table(
+        db,
+        "table",
+        audformat.define.IndexType.FILEWISE,
+        num_files=3,
+    )
+    db.save(db_root)
+    audformat.testing.create_audio_files(db)
+    audb.publish(db_root, version, repository, verbose=False)
+    audb.backend_statistics(reset=True)
+
+    # Every media archive fails once
+    # with a connection error
+    failed = set()
+    get_archive = audbackend.interface.Versioned.get_archive
+    get_file = audbackend.interface.Versioned.get_file
+
+    def flaky(func):
+        def wrapper(self, src_path, *args, **kwargs):
+            if "/media/" in src_path and src_path not in failed:
+                failed.add(src_path)
+                raise audbackend.BackendError(ConnectionError())
+            return func(self, src_path, *args, **kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(
+        audbackend.interface.Versioned, "get_archive", flaky(get_archive)
+    )
+    monkeypatch.setattr(audbackend.interface.Versioned, "get_file", flaky(get_file))
+
+    db = audb.load(name, version=version, full_path=False, verbose=False)
+    assert len(failed) == 3
+    assert len(db.files) == 3
+    df = audb.backend_statistics()
+    operation = "get_archive" if timeout is None else "get_file"
+    assert df.loc[operation, "retries"] == 3
+    assert df.loc[operation, "failures"] == 0
+
+
+def test_get_file_timeout(tmpdir, monkeypatch, repository):
+    monkeypatch.setattr(audb.config, "BACKEND_RETRIES", 1)
+    monkeypatch.setattr(audb.config, "BACKEND_TIMEOUT", 0.1)
+    src_root = audeer.mkdir(tmpdir, "src")
+    src = audeer.touch(src_root, "file.txt")
+    backend_interface = repository.create_backend_interface()
+    backend_interface.backend.open()
+    backend_interface.put_file(src, "/file.txt", "1.0.0")
+
+    # First attempt hangs until the second attempt succeeded
+    release = threading.Event()
+    finished = threading.Event()
+    get_file = audbackend.interface.Versioned.get_file
+
+    def hanging_get_file(self, *args, **kwargs):
+        if not release.is_set():
+            release.set()
+            time.sleep(0.3)
+            try:
+                return get_file(self, *args, **kwargs)
+            finally:
+                finished.set()
+        return get_file(self, *args, **kwargs)
+
+    monkeypatch.setattr(audbackend.interface.Versioned, "get_file", hanging_get_file)
+
+    # Record temporary folders of attempts
+    mkdtemp = tempfile.mkdtemp
+    folders = []
+
+    def recording_mkdtemp(*args, **kwargs):
+        folder = mkdtemp(*args, **kwargs)
+        if kwargs.get("prefix") == ".audb-":
+            folders.append(folder)
+        return folder
+
+    monkeypatch.setattr(tempfile, "mkdtemp", recording_mkdtemp)
+
+    dst_root = audeer.mkdir(tmpdir, "dst")
+    dst = os.path.join(dst_root, "sub", "file.txt")
+    path = audb.core.utils.get_file(backend_interface, "/file.txt", dst, "1.0.0")
+    assert path == dst
+    assert os.path.exists(dst)
+    assert audb.backend_statistics().loc["get_file", "timeouts"] == 1
+
+    # Abandoned attempt removes its temporary folder,
+    # and does not write to the destination folder
+    finished.wait()
+    while os.path.exists(folders[0]):
+        time.sleep(0.01)
+    assert len(folders) == 2
+    # Attempts are stored next to the destination
+    assert all(os.path.dirname(folder) == os.path.dirname(dst) for folder in folders)
+    assert not any(os.path.exists(folder) for folder in folders)
+    assert audeer.list_file_names(dst_root, recursive=True, hidden=True) == [dst]
+    backend_interface.backend.close()
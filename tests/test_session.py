@@ -0,0 +1,132 @@
+import concurrent.futures
+import threading
+import time
+
+import pytest
+
+import audformat.testing
+
+import audb
+
+
+DB_NAME = "test_session"
+DB_VERSION = "1.0.0"
+
+
+@pytest.fixture(
+    scope="module",
+    autouse=True,
+)
+def db(tmpdir_factory, persistent_repository):
+    r"""Publish a single database."""
+    db_root = tmpdir_factory.mktemp(DB_VERSION)
+    db = audformat.testing.create_db(minimal=True)
+    db.name = DB_NAME
+    audformat.testing.add_table(db, "table1", "filewise", num_files=[0, 1, 2])
+    db.save(db_root)
+    audformat.testing.create_audio_files(db)
+    audb.publish(db_root, DB_VERSION, persistent_repository, verbose=False)
+    return db
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    r"""Count requests to find repository and versions of database."""
+    calls = {"lookup": 0, "versions": 0}
+    lookup_repositories = audb.core.utils._lookup_repositories
+
+    def counted_lookup_repositories(*args):
+        calls["lookup"] += 1
+        return lookup_repositories(*args)
+
+    def counted_versions(self, *args, **kwargs):
+        calls["versions"] += 1
+        return versions(self, *args, **kwargs)
+
+    versions = audb.core.utils.audbackend.interface.Versioned.versions
+    monkeypatch.setattr(
+        audb.core.utils,
+        "_lookup_repositories",
+        counted_lookup_repositories,
+    )
+    monkeypatch.setattr(
+        audb.core.utils.audbackend.interface.Versioned,
+        "versions",
+        counted_versions,
+    )
+    return calls
+
+
+def test_session(calls):
+    with audb.Session() as session:
+        for file in ["audio/000.wav", "audio/001.wav"]:
+            audb.load_media(DB_NAME, file, verbose=False)
+        session.load_table(DB_NAME, "table1", verbose=False)
+        deps1 = audb.dependencies(DB_NAME)
+        deps2 = session.dependencies(DB_NAME)
+        ((_, backend_interface),) = [
+            value for (kind, _), value in session._entries.items() if kind == "backend"
+        ]
+        assert backend_interface.backend.opened
+
+    assert calls == {"lookup": 1, "versions": 1}
+    # Callers get their own dependency object
+    assert deps1 is not deps2
+    assert deps1() is not deps2()
+    assert deps1().equals(deps2())
+    # Backend is closed with the session
+    assert not backend_interface.backend.opened
+    assert session._entries == {}
+    assert audb.core.session._current.get() is None
+
+
+def test_session_methods(calls):
+    session = audb.Session()
+    assert session.versions(DB_NAME) == [DB_VERSION]
+    assert session.latest_version(DB_NAME) == DB_VERSION
+    assert session.repository(DB_NAME, DB_VERSION) == audb.config.REPOSITORIES[0]
+    assert audb.core.session._current.get() is None
+    assert calls == {"lookup": 1, "versions": 1}
+    session.close()
+    assert session._entries == {}
+
+    # Without session,
+    # versions and repository are read from the user cache
+    audb.versions(DB_NAME)
+    audb.repository(DB_NAME, DB_VERSION)
+    assert calls == {"lookup": 1, "versions": 1}
+
+
+def test_session_prefetch(calls):
+    with audb.Session() as session:
+        db = audb.prefetch(DB_NAME).result()
+        audb.load(DB_NAME, only_metadata=True, verbose=False)
+        assert ("versions", (DB_NAME, tuple(audb.config.REPOSITORIES))) in (
+            session._entries
+        )
+    assert list(db) == ["table1"]
+    assert len(db.files) == 3
+    assert calls == {"lookup": 1, "versions": 1}
+
+
+def test_session_concurrent_requests():
+    session = audb.Session()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def func():
+        calls.append(None)
+        started.set()
+        release.wait()
+        return "value"
+
+    with concurrent.futures.ThreadPoolExecutor(2) as pool:
+        first = pool.submit(session._get, "kind", "key", func)
+        started.wait()
+        second = pool.submit(session._get, "kind", "key", func)
+        # Wait until second request waits for the first one
+        time.sleep(0.1)
+        release.set()
+        assert first.result() == second.result() == "value"
+    assert len(calls) == 1